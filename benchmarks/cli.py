@@ -0,0 +1,216 @@
+"""End-to-end throughput benchmark of ``python -m ranjg``.
+
+It runs the command line for growing numbers of records in each output mode:
+
+- ``files``: ``-n <size> -j <dir>/out_{}.json`` (a file per record)
+- ``list``: ``--list <size> -j <file>`` (one big array)
+- ``stdout``: ``--list <size>`` written to a pipe
+
+For each run, it records wall time, records per second, bytes per second, peak RSS of the process, and per record:
+
+- the numbers of files opened and closed with ``open``, counted by wrapping ``open`` in the process. They show the
+  file-system work, such as a file per record in the mode ``files``.
+- the numbers of read and write system calls on any file descriptor, including pipes and the standard streams (from
+  ``/proc/self/io``, so only on Linux). They show how well the output is buffered, not the file-system work.
+
+To tell whether each mode scales linearly, the report has, for each mode, the exponent ``k`` of the power law
+``time ~ size ** k`` and the fit of ``time = overhead + size * per_record``. Since the startup of the process is a
+part of the time, ``k`` approaches 1 only for large sizes; the linear fit separates the startup as ``overhead``.
+
+Usage::
+
+    python benchmarks/cli.py [--sizes 1e3,1e4,1e5] [--modes files,list,stdout] [--max-files <n>] [--jsonl]
+                             [--schema <schema_file>] [--report <report_file>]
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ("files", "list", "stdout")
+
+#: 計測対象のプロセスで ranjg を実行し、終了時にリソースの使用量を標準エラー出力の最終行に書き込むコード
+#: open を置き換えて、開いたファイルを数える (閉じたかどうかは終了時に弱参照で判定する)
+_CHILD_CODE = """
+import builtins, json, os, resource, runpy, sys, weakref
+sys.argv = ['ranjg'] + json.loads(sys.argv[1])
+_open = builtins.open
+_opened_files = []
+def _counting_open(*args, **kwargs):
+    fp = _open(*args, **kwargs)
+    _opened_files.append(weakref.ref(fp))
+    return fp
+builtins.open = _counting_open
+try:
+    runpy.run_module('ranjg', run_name='__main__', alter_sys=True)
+finally:
+    sys.stdout.flush()
+    builtins.open = _open
+    stats = {'maxrss_kib': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+             'file_opens': len(_opened_files),
+             'file_closes': sum(1 for ref in _opened_files if ref() is None or ref().closed)}
+    try:
+        with open('/proc/self/io') as fp:
+            stats.update((key, int(value)) for key, value in (line.split(':') for line in fp))
+    except OSError:
+        pass
+    sys.stderr.write('\\n' + json.dumps(stats) + '\\n')
+"""
+
+
+def run(mode: str, size: int, schema: str, work_dir: str, jsonl: bool, seed: int) -> dict:
+    """Runs ``python -m ranjg`` once and returns the measurement.
+    """
+    args = [schema, "--seed", str(seed)]
+    output_path = None
+    if mode == "files":
+        output_dir = os.path.join(work_dir, "files")
+        os.makedirs(output_dir)
+        args += ["-n", str(size), "-j", os.path.join(output_dir, "out_{}.json")]
+    elif mode == "list":
+        output_path = os.path.join(work_dir, "out.json")
+        args += ["--list", str(size), "-j", output_path]
+    else:
+        args += ["--list", str(size)]
+    if jsonl:
+        args.append("--jsonl")
+
+    command = [sys.executable, "-c", _CHILD_CODE, json.dumps(args)]
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=_ROOT_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout_bytes = 0
+    for chunk in iter(lambda: process.stdout.read(1 << 16), b""):
+        stdout_bytes += len(chunk)
+    stderr = process.stderr.read()
+    process.wait()
+    elapsed = time.perf_counter() - start
+
+    if process.returncode != 0:
+        raise RuntimeError(f"ranjg failed ({mode}, {size}):\n{stderr.decode(errors='replace')}")
+    stats = json.loads(stderr.decode().strip().splitlines()[-1])
+
+    if mode == "files":
+        output_bytes = sum(entry.stat().st_size for entry in os.scandir(output_dir))
+    elif mode == "list":
+        output_bytes = os.path.getsize(output_path)
+    else:
+        output_bytes = stdout_bytes
+
+    return {
+        "mode": mode,
+        "size": size,
+        "wall_s": elapsed,
+        "records_per_s": size / elapsed,
+        "bytes": output_bytes,
+        "bytes_per_s": output_bytes / elapsed,
+        "maxrss_kib": stats["maxrss_kib"],
+        "file_opens_per_record": stats["file_opens"] / size,
+        "file_closes_per_record": stats["file_closes"] / size,
+        "read_calls_per_record": stats["syscr"] / size if "syscr" in stats else None,
+        "write_calls_per_record": stats["syscw"] / size if "syscw" in stats else None,
+    }
+
+
+def scaling_exponent(measurements: List[dict]) -> Optional[float]:
+    """Returns ``k`` of the power law ``wall_s ~ size ** k`` fitted by least squares on a log-log scale.
+    """
+    if len(measurements) < 2:
+        return None
+
+    xs = [math.log(m["size"]) for m in measurements]
+    ys = [math.log(m["wall_s"]) for m in measurements]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sum((x - x_mean) ** 2 for x in xs)
+
+
+def linear_fit(measurements: List[dict]) -> Optional[dict]:
+    """Returns the fit of ``wall_s = overhead_s + size * per_record_s`` by least squares.
+    """
+    if len(measurements) < 2:
+        return None
+
+    xs = [m["size"] for m in measurements]
+    ys = [m["wall_s"] for m in measurements]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    per_record = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sum((x - x_mean) ** 2 for x in xs)
+    return {"overhead_s": y_mean - per_record * x_mean, "per_record_s": per_record}
+
+
+def _format_optional(value: Optional[float]) -> str:
+    return f"{value:.3f}" if value is not None else "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the throughput of python -m ranjg.")
+    parser.add_argument("--sizes", default="1e3,1e4,1e5",
+                        help="Comma separated numbers of records. (default: 1e3,1e4,1e5)")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"Comma separated modes in {MODES}.")
+    parser.add_argument("--max-files", type=float, default=1e5,
+                        help="The largest size measured in the mode 'files'. (default: 1e5)")
+    parser.add_argument("--jsonl", action="store_true", help="If specified, --jsonl is passed to ranjg.")
+    parser.add_argument("--schema", default="test-resources/schema-legal-user_object.json",
+                        help="Path of the schema file.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed passed to ranjg. (default: 0)")
+    parser.add_argument("--report", help="Path of a file to which the report is written as JSON. "
+                                         "If it is not specified, the report is written to stdout.")
+    args = parser.parse_args()
+
+    sizes = [int(float(size)) for size in args.sizes.split(",")]
+    modes = args.modes.split(",")
+    for mode in modes:
+        if mode not in MODES:
+            parser.error(f"unknown mode: {mode}")
+
+    measurements = []
+    for mode in modes:
+        for size in sizes:
+            if mode == "files" and size > args.max_files:
+                print(f"skip {mode} {size} (larger than --max-files)", file=sys.stderr)
+                continue
+            work_dir = tempfile.mkdtemp(prefix="ranjg-bench-")
+            try:
+                measurement = run(mode, size, args.schema, work_dir, args.jsonl, args.seed)
+            finally:
+                shutil.rmtree(work_dir)
+            measurements.append(measurement)
+            print(f"{mode:<8}{size:>10}  {measurement['wall_s']:>9.3f} s  {measurement['records_per_s']:>10.0f} rec/s"
+                  f"  {measurement['bytes_per_s'] / 2 ** 20:>8.2f} MiB/s  {measurement['maxrss_kib'] / 1024:>7.1f} MiB"
+                  f"  open/close/rec {measurement['file_opens_per_record']:.3f}"
+                  f"/{measurement['file_closes_per_record']:.3f}"
+                  f"  read/write calls/rec {_format_optional(measurement['read_calls_per_record'])}"
+                  f"/{_format_optional(measurement['write_calls_per_record'])}", file=sys.stderr)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "schema": args.schema,
+        "jsonl": args.jsonl,
+        "measurements": measurements,
+        "scaling": {mode: {"exponent": scaling_exponent(mode_measurements),
+                           "linear_fit": linear_fit(mode_measurements)}
+                    for mode, mode_measurements in ((mode, [m for m in measurements if m["mode"] == mode])
+                                                    for mode in modes)},
+    }
+
+    if args.report is not None:
+        with open(args.report, "w") as fp:
+            json.dump(report, fp, indent=2)
+            fp.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""Benchmark of factories.
+
+For each case, it measures:
+
+- ``gen``: values per second generated by calling ``Factory.gen`` one by one.
+- ``gen_many``: values per second generated by ``Factory.gen_many``.
+- ``peak``: peak memory allocated while ``Factory.gen_many`` generates ``--batch`` values, measured with
+  ``tracemalloc``.
+- ``construct``: factories per second constructed from the validated schema.
+- ``validate``: schemas per second validated by ``ranjg.schemas.validate``.
+
+The results can be saved as a baseline and compared with later results, so that a regression shows up in review.
+Since the results depend on the interpreter, a baseline is stored for each version of Python as
+``baseline-py<major>.<minor>.json``, and the results are compared only with the baseline of the running interpreter.
+The baseline also records how it was produced: the command, the interpreter, the platform and the versions of ranjg and
+jsonschema.
+
+Usage::
+
+    python benchmarks/factories.py [--min-time <seconds>] [--batch <n>] [--case <substring>]
+                                   [--save <result_file>] [--baseline <result_file>] [--threshold <ratio>]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import shlex
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, NamedTuple, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ranjg  # noqa: E402
+from ranjg import Options, schemas  # noqa: E402
+from ranjg.options import NO_COPY, SHALLOW_COPY, DEEP_COPY  # noqa: E402
+
+#: The stored baseline of the running interpreter.
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                f"baseline-py{sys.version_info[0]}.{sys.version_info[1]}.json")
+
+#: Metrics which are larger when the performance is better.
+RATE_METRICS = ("gen", "gen_many", "construct", "validate")
+
+
+class Case(NamedTuple):
+    name: str
+    schema: dict
+    options: Optional[Options] = None
+
+
+_ENUM_VALUES = [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": ["c"]}, [1, 2, 3], "value", 4]
+
+CASES: List[Case] = [
+    Case("null", {"type": "null"}),
+    Case("boolean", {"type": "boolean"}),
+    Case("integer", {"type": "integer", "minimum": 0, "maximum": 1000}),
+    Case("number", {"type": "number", "minimum": 0, "exclusiveMaximum": 1}),
+    Case("string", {"type": "string", "minLength": 5, "maxLength": 20}),
+    Case("string/pattern", {"type": "string", "pattern": "^[A-Z]{3}-[0-9]{4}$"}),
+    Case("array/list", {"type": "array", "minItems": 5, "maxItems": 10, "items": {"type": "integer"}}),
+    Case("array/tuple", {"type": "array", "minItems": 4, "maxItems": 4,
+                         "items": [{"type": "integer"}, {"type": "string"}, {"type": "boolean"}]},
+         Options(default_schema_of_items={"type": "number"})),
+    Case("object/required", {"type": "object", "required": ["p1", "p2", "p3"],
+                             "properties": {"p1": {"type": "integer"}, "p2": {"type": "string"},
+                                            "p3": {"type": "number"}}}),
+    Case("object/optional", {"type": "object",
+                             "properties": {"p1": {"type": "integer"}, "p2": {"type": "string"},
+                                            "p3": {"type": "number"}}}),
+    Case("object/option-derived", {"type": "object", "required": ["p1", "p2", "p3"]},
+         Options(default_schema_of_properties={"type": "integer"},
+                 priority_schema_of_properties={"p3": {"type": "string"}})),
+    Case("multi", {"type": ["integer", "string", "null"]}),
+    Case("enum/NO_COPY", {"enum": _ENUM_VALUES}, Options(enum_copy_style=NO_COPY)),
+    Case("enum/SHALLOW_COPY", {"enum": _ENUM_VALUES}, Options(enum_copy_style=SHALLOW_COPY)),
+    Case("enum/DEEP_COPY", {"enum": _ENUM_VALUES}, Options(enum_copy_style=DEEP_COPY)),
+]
+
+
+def rate(func: Callable[[], int], min_time: float) -> float:
+    """Calls ``func`` repeatedly for at least ``min_time`` seconds and returns the number of operations per second.
+
+    Args:
+        func: A function which returns the number of operations it did.
+        min_time: The minimum time to measure.
+    """
+    # 初回のみの処理 (遅延 import など) を計測に含めない
+    func()
+
+    count = 0
+    start = time.perf_counter()
+    while True:
+        count += func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return count / elapsed
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """Returns the peak memory in bytes allocated while ``func`` runs.
+    """
+    func()
+
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(case: Case, min_time: float, batch: int) -> dict:
+    factory = ranjg.Factory(case.schema)
+
+    def gen_one_by_one():
+        for _ in range(100):
+            factory.gen(options=case.options)
+        return 100
+
+    def construct():
+        ranjg.Factory(case.schema, schema_is_validated=True)
+        return 1
+
+    def validate():
+        schemas.validate(case.schema)
+        return 1
+
+    return {
+        "gen": rate(gen_one_by_one, min_time),
+        "gen_many": rate(lambda: len(factory.gen_many(batch, options=case.options)), min_time),
+        "peak": peak_memory(lambda: factory.gen_many(batch, options=case.options)),
+        "construct": rate(construct, min_time),
+        "validate": rate(validate, min_time),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """Returns the descriptions of the regressions from the baseline.
+
+    A rate metric regresses if it is lower than the baseline by more than ``threshold``, and the peak memory regresses
+    if it is higher than the baseline by more than ``threshold``.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base_value = baseline.get(name, {}).get(metric)
+            if not base_value:
+                continue
+            ratio = value / base_value
+            if metric in RATE_METRICS and ratio < 1 - threshold or metric not in RATE_METRICS and ratio > 1 + threshold:
+                regressions.append(f"{name} {metric}: {base_value:.6g} -> {value:.6g} ({ratio:.2f}x)")
+    return regressions
+
+
+def print_results(results: dict, baseline: Optional[dict]):
+    header = f"{'case':<24}{'gen [/s]':>12}{'gen_many [/s]':>15}{'peak [KiB]':>12}{'construct [/s]':>16}" \
+             f"{'validate [/s]':>15}"
+    print(header)
+    for name, metrics in results.items():
+        print(f"{name:<24}{metrics['gen']:>12.0f}{metrics['gen_many']:>15.0f}{metrics['peak'] / 1024:>12.1f}"
+              f"{metrics['construct']:>16.0f}{metrics['validate']:>15.0f}")
+        if baseline is not None and name in baseline:
+            base = baseline[name]
+            print(f"{'  (vs baseline)':<24}"
+                  + "".join(f"{metrics[metric] / base[metric]:>{width}.2f}x"
+                            for metric, width in (("gen", 11), ("gen_many", 14), ("peak", 11), ("construct", 15),
+                                                  ("validate", 14))))
+
+
+def _jsonschema_version() -> str:
+    import jsonschema
+    return getattr(jsonschema, "__version__", "unknown")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the performance of each factory.")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="The minimum seconds to measure each metric. (default: 0.2)")
+    parser.add_argument("--batch", type=int, default=1000,
+                        help="The number of values generated by each call of gen_many. (default: 1000)")
+    parser.add_argument("--case", help="If specified, only the cases whose name contains it are measured.")
+    parser.add_argument("--save", help="Path of a file to which the results are saved as JSON.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="Path of the results to compare with."
+                             " (default: benchmarks/baseline-py<major>.<minor>.json of the running interpreter)")
+    parser.add_argument("--threshold", type=float, default=0.3,
+                        help="The ratio of difference from the baseline regarded as a regression. (default: 0.3)")
+    args = parser.parse_args()
+
+    results = {case.name: run_case(case, args.min_time, args.batch)
+               for case in CASES if args.case is None or args.case in case.name}
+
+    baseline = None
+    if args.baseline:
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as fp:
+                baseline_file = json.load(fp)
+            # 異なるインタプリタで記録された baseline とは比較しても意味がない
+            if baseline_file["python"].split(".")[:2] == list(platform.python_version_tuple()[:2]):
+                baseline = baseline_file["results"]
+            else:
+                print(f"The baseline was recorded with Python {baseline_file['python']}, so it is not compared with"
+                      f" Python {platform.python_version()}: {args.baseline}\n")
+        else:
+            print(f"No baseline for Python {platform.python_version()}: {args.baseline}\n")
+
+    print_results(results, baseline)
+
+    if args.save is not None:
+        with open(args.save, "w") as fp:
+            json.dump({"python": platform.python_version(),
+                       "implementation": platform.python_implementation(),
+                       "platform": platform.platform(),
+                       "ranjg": ranjg.__version__,
+                       "jsonschema": _jsonschema_version(),
+                       "command": " ".join(shlex.quote(arg) for arg in ["python", *sys.argv]),
+                       "recorded_at": datetime.date.today().isoformat(),
+                       "min_time": args.min_time,
+                       "batch": args.batch,
+                       "results": {name: {metric: float(f"{value:.4g}") for metric, value in metrics.items()}
+                                   for name, metrics in results.items()}}, fp, indent=2)
+            fp.write("\n")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) from the baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
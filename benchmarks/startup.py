@@ -0,0 +1,55 @@
+"""Benchmark of the startup time of ranjg.
+
+It measures the wall-clock time of short processes, each of which is started from scratch:
+
+- ``import ranjg``
+- ``python -m ranjg <schema_file>``
+- ``python -m ranjg <schema_file> --no-validate``
+
+Usage::
+
+    python benchmarks/startup.py [--repeat <n>] [--schema <schema_file>]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(command, repeat: int) -> list:
+    """Runs the command ``repeat`` times and returns the elapsed seconds of each run.
+    """
+    elapsed_list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=_ROOT_DIR, check=True, stdout=subprocess.DEVNULL)
+        elapsed_list.append(time.perf_counter() - start)
+    return elapsed_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the startup time of ranjg.")
+    parser.add_argument("--repeat", type=int, default=20, help="The number of runs of each case. (default: 20)")
+    parser.add_argument("--schema", default="test-resources/schema-legal-user_object.json",
+                        help="Path of the schema file used for the command line cases.")
+    args = parser.parse_args()
+
+    case_list = (
+        ("python (baseline)", [sys.executable, "-c", "pass"]),
+        ("import ranjg", [sys.executable, "-c", "import ranjg"]),
+        ("python -m ranjg", [sys.executable, "-m", "ranjg", args.schema]),
+        ("python -m ranjg --no-validate", [sys.executable, "-m", "ranjg", args.schema, "--no-validate"]),
+    )
+
+    print(f"{'case':<32}{'median [ms]':>12}{'min [ms]':>12}")
+    for name, command in case_list:
+        elapsed_list = measure(command, args.repeat)
+        print(f"{name:<32}{statistics.median(elapsed_list) * 1000:>12.1f}{min(elapsed_list) * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
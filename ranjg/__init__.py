@@ -1,3 +1,6 @@
+from ._version import __version__
 from .factories import Factory
 from ._gen import gen
+from ._factory_cache import factory_cache
 from .options import Options
+from .profiling import Profiler
@@ -1,11 +1,16 @@
+import random
 import string
 import sys
 import argparse
-from typing import Tuple, Optional, TextIO, Iterable
+import contextlib
+from typing import Tuple, Optional, TextIO, Iterable, List
 
 from .util.listutil import count
-from ._arg_parser import positive_integer
-from . import gen
+from ._arg_parser import positive_integer, shard
+from . import gen, Profiler, Factory, schemas
+from ._gen import JSON, JSONL
+from ._factory_cache import DEFAULT_FACTORY_CACHE_SIZE, factory_cache
+from .options import load as load_options
 
 
 __formatter = string.Formatter()
@@ -14,16 +19,138 @@ __formatter = string.Formatter()
 def main():
     """A function to be called when the module is executed on the command line.
     """
+    # サブコマンド serve の場合はサーバーとして動作する
+    if sys.argv[1:2] == ['serve']:
+        serve(sys.argv[2:])
+        return
+    # サブコマンド explain の場合はファクトリの木を出力する
+    if sys.argv[1:2] == ['explain']:
+        explain(sys.argv[2:])
+        return
+
     # 引数を取得
     args = parse_args()
 
     # 出力先を決定
     output_file, output_file_list, output_fp = get_output_target(args)
 
-    gen(schema_file=args.schema_file_path, output_file=output_file, output_fp=output_fp, options_file=args.options,
-        multiplicity=args.multiplicity, output_file_list=output_file_list,
-        # To ensure that generated value is exposed to garbage collection earlier.
-        return_none=True)
+    # キャッシュディレクトリの指定時は、キャッシュ済みのファクトリを使用する
+    if args.cache_dir is not None:
+        from ._schema_file_cache import load_schema_file
+
+        schema = load_schema_file(args.schema_file_path, args.cache_dir, validate=not args.no_validate)
+        schema_kwargs = dict(schema=schema, schema_is_validated=True)
+    elif args.stats:
+        # 統計を取得するファクトリを特定できるよう、スキーマを読み込んでから渡す
+        schema = schemas.load(args.schema_file_path)
+        schema_kwargs = dict(schema=schema, schema_is_validated=args.no_validate)
+    else:
+        schema_kwargs = dict(schema_file=args.schema_file_path, schema_is_validated=args.no_validate)
+
+    with contextlib.ExitStack() as stack:
+        profiler = stack.enter_context(Profiler()) if args.profile else None
+
+        gen(**schema_kwargs, output_file=output_file, output_fp=output_fp, options_file=args.options,
+            multiplicity=args.multiplicity, output_file_list=output_file_list,
+            output_format=JSONL if args.jsonl else JSON, workers=args.jobs, shard=args.shard,
+            rng=random.Random(args.seed) if args.seed is not None else None,
+            # To ensure that generated value is exposed to garbage collection earlier.
+            return_none=True)
+
+    if profiler is not None:
+        print(profiler.report(), file=sys.stderr)
+
+    if args.stats:
+        # ranjg.gen が使用したファクトリは factory_cache に保持されている
+        print(factory_cache.get(schema_kwargs['schema'], schema_is_validated=True).stats().report(), file=sys.stderr)
+
+
+def serve(argv: List[str]):
+    """A function to be called when the module is executed with the sub-command ``serve``.
+
+    It runs until it is interrupted.
+
+    Args:
+        argv: The command line arguments following ``serve``.
+    """
+    # サーバーとして動作する場合のみ使用するため、起動を速くするよう使用時に import する
+    from ._serve import GenerationService, make_unix_server, make_http_server
+
+    args = parse_serve_args(argv)
+
+    service = GenerationService(cache_size=args.cache_size)
+    if args.socket is not None:
+        server = make_unix_server(args.socket, service)
+        address = args.socket
+    else:
+        server = make_http_server(args.host, args.port, service)
+        address = f"http://{args.host}:{server.server_address[1]}"
+
+    print(f"Serving on {address}", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def parse_serve_args(argv: List[str]):
+    """Parse command line arguments of the sub-command ``serve``.
+
+    Args:
+        argv: The command line arguments following ``serve``.
+
+    Returns:
+        An object that holds the values obtained from the command line arguments.
+    """
+    parser = argparse.ArgumentParser(prog="python -m ranjg serve",
+                                     description="Generate json values on request, keeping factories of requested "
+                                                 "schemas in memory.")
+
+    listen_group = parser.add_mutually_exclusive_group(required=True)
+    listen_group.add_argument("--socket", help="Path of a Unix domain socket to listen on.")
+    listen_group.add_argument("--port", type=int,
+                              help="Port to listen on for HTTP. If it is 0, an unused port is used.")
+    parser.add_argument("--host", default="127.0.0.1", help="Host to listen on for HTTP. (default: 127.0.0.1)")
+    parser.add_argument("--cache-size", type=positive_integer, default=DEFAULT_FACTORY_CACHE_SIZE,
+                        help=f"The number of factories kept in memory. (default: {DEFAULT_FACTORY_CACHE_SIZE})")
+
+    return parser.parse_args(argv)
+
+
+def explain(argv: List[str]):
+    """A function to be called when the module is executed with the sub-command ``explain``.
+
+    Args:
+        argv: The command line arguments following ``explain``.
+    """
+    args = parse_explain_args(argv)
+
+    factory = Factory(schemas.load(args.schema_file_path))
+    options = load_options(args.options) if args.options is not None else None
+
+    print(factory.explain(options=options).report(limit_depth=args.depth))
+
+
+def parse_explain_args(argv: List[str]):
+    """Parse command line arguments of the sub-command ``explain``.
+
+    Args:
+        argv: The command line arguments following ``explain``.
+
+    Returns:
+        An object that holds the values obtained from the command line arguments.
+    """
+    parser = argparse.ArgumentParser(prog="python -m ranjg explain",
+                                     description="Print the tree of factories resolved for json schema, with the "
+                                                 "expected number of values and the estimated cost of each node.")
+
+    parser.add_argument("schema_file_path", help="Path of json schema file.")
+    parser.add_argument("--options", help="Path of options file.")
+    parser.add_argument("--depth", type=int, help="If specified, nodes deeper than it are not printed.")
+
+    return parser.parse_args(argv)
 
 
 def _count_placeholder(format_string: str) -> int:
@@ -48,6 +175,29 @@ def parse_args():
     parser.add_argument("--list", "-l", dest="multiplicity", type=positive_integer,
                         help="If specified, repeats the generation for the specified number of times "
                              "and outputs the results as a list.")
+    parser.add_argument("--jobs", type=positive_integer,
+                        help="The number of processes which generate files in parallel. "
+                             "It can be specified only when -n is specified.")
+    parser.add_argument("--shard", type=shard, metavar="i/N",
+                        help="Generates only the files whose index modulo N is i. "
+                             "It can be specified only when -n and --seed are specified.")
+    parser.add_argument("--seed", type=int,
+                        help="The seed of random numbers. With the same seed, the same result is generated.")
+    parser.add_argument("--cache-dir",
+                        help="Path of a directory where compiled schemas are cached. If specified, the schema file is "
+                             "not parsed, validated nor compiled again while its content is unchanged.")
+    parser.add_argument("--no-validate", action="store_true",
+                        help="If specified, the schema is not validated. Use it only with a schema known to be valid; "
+                             "an invalid schema may cause an unexpected error or result.")
+    parser.add_argument("--profile", action="store_true",
+                        help="If specified, reports the time, call count and bytes of generation for each path in "
+                             "generated values to stderr. It cannot be specified with --jobs.")
+    parser.add_argument("--stats", action="store_true",
+                        help="If specified, reports retries, fallbacks to schemas in options and copies of enum values "
+                             "for each path in generated values to stderr. It cannot be specified with --jobs.")
+    parser.add_argument("--jsonl", action="store_true",
+                        help="If specified, outputs each generated value as a line of JSON (JSON Lines) instead of "
+                             "a list. With --list, each value is written as soon as it is generated.")
 
     args = parser.parse_args()
 
@@ -59,6 +209,22 @@ def parse_args():
         # -n に指定がある場合、--json_output は1つのプレースホルダーを持つフォーマットでなくてはならない
         if _count_placeholder(args.json_output) != 1:
             parser.error("when -n is specified, --json_output must have exactly one placeholder such as '{}'")
+    elif args.jobs is not None:
+        # --jobs は -n の指定時のみ使用できる
+        parser.error("the following arguments are required when --jobs is specified: -n")
+    elif args.shard is not None:
+        # --shard は -n の指定時のみ使用できる
+        parser.error("the following arguments are required when --shard is specified: -n")
+
+    # 並列生成は別のプロセスで行われるため、プロファイルできない
+    if args.profile and args.jobs is not None:
+        parser.error("argument --profile: not allowed with argument --jobs")
+    if args.stats and args.jobs is not None:
+        parser.error("argument --stats: not allowed with argument --jobs")
+
+    # シャードごとに別々に実行しても内容が一致するよう、--shard には --seed が必須
+    if args.shard is not None and args.seed is None:
+        parser.error("the following arguments are required when --shard is specified: --seed")
 
     return args
 
@@ -1,5 +1,6 @@
 """Parsers for argparse.ArgumentParser.add_argument
 """
+from typing import Tuple
 
 
 def positive_integer(string: str) -> int:
@@ -9,3 +10,13 @@ def positive_integer(string: str) -> int:
         raise ValueError('invalid literal for positive_int(): ' + repr(string))
 
     return int(string)
+
+
+def shard(string: str) -> Tuple[int, int]:
+    shard_index, _, shard_count = string.partition('/')
+    value = (int(shard_index), int(shard_count))
+
+    if not 0 <= value[0] < value[1]:
+        raise ValueError('invalid literal for shard(): ' + repr(string))
+
+    return value
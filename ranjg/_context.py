@@ -1,26 +1,78 @@
-from typing import Tuple, Union, Iterable
+from typing import Tuple, Union, Iterable, Optional
 
 
 class GenerationContext:
     """Context of randomly construction.
+
+    A context of a child element only holds its parent context and its key. The key path is built only when it is
+    required, for example when an error is raised.
+
+    A context created by ``relative`` has a key path relative to a child element, and also holds the absolute position
+    of the child element, which is used by the profiler.
     """
-    _key_path: Tuple[Union[int, str]]
+    __slots__ = ('_parent', '_key', '_key_path', '_current_schema', '_origin')
+
+    _parent: Optional['GenerationContext']
+    _key: Union[int, str, None]
+    _key_path: Optional[Tuple[Union[int, str]]]
     _current_schema: dict
+    _origin: Optional['GenerationContext']
 
     @classmethod
     def root(cls, current_schema: dict):
         return GenerationContext(path=tuple(), current_schema=current_schema)
 
+    @classmethod
+    def relative(cls, parent: 'GenerationContext', key: Union[int, str], current_schema: dict):
+        # 子要素 key を起点とした相対的な context。絶対的な位置は origin として保持する
+        context = GenerationContext(path=tuple(), current_schema=current_schema)
+        context._origin = parent.resolve(key, current_schema)
+        return context
+
     def __init__(self, path: Iterable[Union[int, str]], current_schema: dict):
+        self._parent = None
+        self._key = None
         self._key_path = tuple(path)
         self._current_schema = current_schema
+        self._origin = None
 
     @property
     def key_path(self) -> Tuple[Union[int, str]]:
+        if self._key_path is None:
+            # パスが確定している祖先まで遡ってキーを集める
+            keys = []
+            context = self
+            while context._key_path is None:
+                keys.append(context._key)
+                context = context._parent
+            self._key_path = (*context._key_path, *reversed(keys))
+
         return self._key_path
 
+    @property
+    def absolute_key_path(self) -> Tuple[Union[int, str]]:
+        # 相対的な context の場合は、起点の絶対的なパスを前に付ける
+        keys = []
+        context = self
+        while context._parent is not None:
+            keys.append(context._key)
+            context = context._parent
+        prefix = context._origin.absolute_key_path if context._origin is not None else ()
+        return (*prefix, *context._key_path, *reversed(keys))
+
     def resolve(self, key: Union[int, str], current_schema: dict):
-        return GenerationContext(path=(*self._key_path, key), current_schema=current_schema)
+        child = GenerationContext.__new__(GenerationContext)
+        child._parent = self
+        child._key = key
+        child._key_path = None
+        child._current_schema = current_schema
+        child._origin = None
+        return child
+
+    def join(self, key: Union[int, str], relative_context: 'GenerationContext'):
+        # relative_context を、この context の子要素 key を起点とした相対パスとみなして結合する
+        return GenerationContext(path=(*self.key_path, key, *relative_context.key_path),
+                                 current_schema=relative_context._current_schema)
 
 
 class SchemaContext:
@@ -29,24 +81,34 @@ class SchemaContext:
     _key_path: Tuple[Union[int, str]]
     _current_schema: dict
     _is_for_options: bool = False
+    #: True であれば、構築するスキーマの検証は省略されている (子要素や options のスキーマも検証しない)
+    _skips_validation: bool = False
 
     @classmethod
-    def root(cls, current_schema: dict):
-        return SchemaContext(path=tuple(), current_schema=current_schema)
+    def root(cls, current_schema: dict, skips_validation: bool = False):
+        return SchemaContext(path=tuple(), current_schema=current_schema, skips_validation=skips_validation)
 
     @classmethod
-    def for_options(cls, current_schema: dict, path: Iterable[Union[int, str]]):
+    def for_options(cls, current_schema: dict, path: Iterable[Union[int, str]], skips_validation: bool = False):
         # Options 内のスキーマを使用する場合の context
-        return SchemaContext(path=path, current_schema=current_schema, for_options=True)
+        return SchemaContext(path=path, current_schema=current_schema, for_options=True,
+                             skips_validation=skips_validation)
 
-    def __init__(self, path: Iterable[Union[int, str]], current_schema: dict, for_options: bool = False):
+    def __init__(self, path: Iterable[Union[int, str]], current_schema: dict, for_options: bool = False,
+                 skips_validation: bool = False):
         self._key_path = tuple(path) if path is not None else None
         self._current_schema = current_schema
         self._is_for_options = for_options
+        self._skips_validation = skips_validation
 
     @property
     def key_path(self) -> Tuple[Union[int, str]]:
         return self._key_path
 
+    @property
+    def skips_validation(self) -> bool:
+        return self._skips_validation
+
     def resolve(self, key: Union[int, str], current_schema: dict):
-        return SchemaContext(path=(*self._key_path, key), current_schema=current_schema)
+        return SchemaContext(path=(*self._key_path, key), current_schema=current_schema,
+                             skips_validation=self._skips_validation)
@@ -0,0 +1,180 @@
+"""A process-wide cache of factories used by ``ranjg.gen``.
+"""
+import copy
+import threading
+from typing import NamedTuple, Optional
+
+import ranjg
+from . import schemas
+from ._context import SchemaContext
+from .util.cacheutil import LRUCache
+from .util.hashutil import canonical_hash
+
+#: ファクトリのキャッシュに保持するファクトリの数の既定値
+DEFAULT_FACTORY_CACHE_SIZE = 128
+
+
+class FactoryCacheInfo(NamedTuple):
+    """Statistics of ``FactoryCache``.
+    """
+
+    #: The number of lookups which returned a cached factory.
+    hits: int
+    #: The number of lookups which constructed a factory.
+    misses: int
+    #: The maximum number of factories which the cache holds. If it is 0, the cache is disabled.
+    maxsize: int
+    #: The number of factories which the cache holds.
+    currsize: int
+
+
+class _Entry:
+    """A factory held by ``FactoryCache``, with whether its schema was validated.
+    """
+    __slots__ = ('factory', 'validated')
+
+    def __init__(self, factory: 'ranjg.Factory', validated: bool):
+        self.factory = factory
+        self.validated = validated
+
+
+class FactoryCache:
+    """A cache of validated and constructed factories keyed by a canonical hash of the schema.
+
+    Schemas which are equal as JSON share a factory, even if they are different objects. A factory holds a copy of
+    the schema, so modifying the schema after the generation doesn't affect the cached factory. Since a factory
+    generates values with any options, options are not a part of the key.
+
+    A factory constructed without validation is not returned to a caller which requires validation; the schema is
+    validated and the factory is constructed again for the caller.
+
+    It is thread safe.
+
+    Args:
+        maxsize: The maximum number of factories which the cache holds. If it is 0, the cache is disabled.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_FACTORY_CACHE_SIZE):
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative: {maxsize}")
+
+        self._factories: Optional[LRUCache] = LRUCache(maxsize=maxsize) if maxsize > 0 else None
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, schema: dict, *, schema_is_validated: bool = False) -> 'ranjg.Factory':
+        """Returns the factory of the schema, validating the schema and constructing the factory only if it isn't
+        cached.
+
+        Args:
+            schema: The JSON schema.
+            schema_is_validated: If it is True, the schema isn't validated when the factory is constructed.
+
+        Returns:
+            The factory of the schema.
+
+        Raises:
+            InvalidSchemaError:
+                When the schema is invalid.
+            SchemaConflictError:
+                When no value can satisfy the schema.
+        """
+        factories = self._factories
+        try:
+            key = canonical_hash(schema) if factories is not None else None
+        except (TypeError, ValueError):
+            # JSON に変換できないスキーマはキャッシュしない
+            key = None
+
+        if key is not None:
+            entry = factories.get(key)
+            if entry is not None and (entry.validated or schema_is_validated):
+                with self._lock:
+                    self._hits += 1
+                return entry.factory
+
+        with self._lock:
+            self._misses += 1
+
+        if not schema_is_validated:
+            schemas.validate(schema)
+
+        if key is None:
+            return construct_factory(schema, skips_validation=schema_is_validated)
+
+        factory = construct_factory(copy.deepcopy(schema), skips_validation=schema_is_validated)
+        factories.put(key, _Entry(factory, validated=not schema_is_validated))
+        return factory
+
+    def put(self, schema: dict, factory: 'ranjg.Factory', *, validated: bool) -> None:
+        """Stores a factory constructed elsewhere as the factory of the schema.
+
+        The factory must be constructed from a copy of the schema which no one modifies, such as a factory restored from
+        pickle.
+
+        Args:
+            schema: The JSON schema.
+            factory: The factory of the schema.
+            validated: Whether the schema was validated or not. If it is False, the factory is not returned to callers
+                which require validation.
+        """
+        factories = self._factories
+        if factories is not None:
+            factories.put(canonical_hash(schema), _Entry(factory, validated))
+
+    def info(self) -> FactoryCacheInfo:
+        """Returns statistics of the cache.
+        """
+        with self._lock:
+            factories = self._factories
+            return FactoryCacheInfo(hits=self._hits, misses=self._misses,
+                                    maxsize=factories.maxsize if factories is not None else 0,
+                                    currsize=len(factories) if factories is not None else 0)
+
+    def resize(self, maxsize: int) -> None:
+        """Changes the maximum number of factories which the cache holds.
+
+        If the cache holds more factories than ``maxsize``, the least recently used factories are discarded.
+
+        Args:
+            maxsize: The maximum number of factories which the cache holds. If it is 0, the cache is disabled.
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative: {maxsize}")
+
+        with self._lock:
+            if maxsize == 0:
+                self._factories = None
+            elif self._factories is None:
+                self._factories = LRUCache(maxsize=maxsize)
+            else:
+                self._factories.resize(maxsize)
+
+    def clear(self) -> None:
+        """Discards all factories and resets the statistics.
+        """
+        with self._lock:
+            if self._factories is not None:
+                self._factories.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def construct_factory(schema: dict, *, skips_validation: bool) -> 'ranjg.Factory':
+    """Constructs the factory of a schema which is already validated, or whose validation is skipped.
+
+    Args:
+        schema: The JSON schema.
+        skips_validation: If it is False, the schema has been validated, so the schemas in options are validated when
+            they are used. If it is True, the validation is skipped, so they are not validated either.
+
+    Returns:
+        The factory of the schema.
+    """
+    return ranjg.Factory(schema, schema_is_validated=True,
+                         context=SchemaContext.root(schema, skips_validation=skips_validation))
+
+
+#: ``ranjg.gen`` が使用するファクトリのキャッシュ
+factory_cache = FactoryCache()
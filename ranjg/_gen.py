@@ -1,13 +1,30 @@
+import functools
 import itertools
 import json
-from typing import Optional, TextIO, Iterable
+import math
+import random
+from typing import Optional, TextIO, Iterable, Any, List, Tuple
 
 import ranjg
+from . import profiling
 from . import schemas
 from ._context import GenerationContext
+from ._factory_cache import factory_cache
 from .options import Options
 from .options import load as load_options
 from .util.numutil import is_integer
+from .util.seedutil import derive_seed
+
+#: Output format which writes a value as JSON
+JSON = 'json'
+#: Output format which writes each value as a line of JSON (JSON Lines)
+JSONL = 'jsonl'
+
+#: 生成した値を逐次出力する場合に、まとめて生成する値の数
+_STREAM_CHUNK_SIZE = 1024
+
+#: 並列生成時に、各ワーカーに割り当てるタスクの数の目安
+_TASKS_PER_WORKER = 4
 
 
 def __count_not_null(*args) -> int:
@@ -24,6 +41,10 @@ def gen(schema: dict = None,
         options: Optional[Options] = None,
         options_file: str = None,
         multiplicity: Optional[int] = None,
+        output_format: str = JSON,
+        workers: Optional[int] = None,
+        shard: Optional[Tuple[int, int]] = None,
+        rng: Optional[random.Random] = None,
         schema_is_validated: bool = False,
         return_none: bool = False,
         context: Optional[GenerationContext] = None):
@@ -32,6 +53,9 @@ def gen(schema: dict = None,
     This function is not fully compliant with the JSON schema, and unsupported parameters in the schema are ignored.
     See also :doc:`ranjg-json-schema` to explore the supported parameters.
 
+    The factory of the schema is kept in ``ranjg.factory_cache``, so calling this function repeatedly with the same
+    schema doesn't validate the schema nor construct the factory again.
+
     Examples
         The following code is most simple usage.
 
@@ -73,6 +97,8 @@ def gen(schema: dict = None,
         output_file_list (Iterable[str], optional):
             The list of paths to a file where the result will be output as JSON.
             It repeats the generation and outputs each result to each file.
+            Each file is generated with a seed derived from a seed drawn from ``rng`` and the index of the file, so
+            the content of each file doesn't depend on ``workers`` and ``shard``.
         output_fp (TextIO, optional):
             The writing object of a file where the result will be output as JSON.
             If ``multiplicity`` is specified, a list consisting of the generated values will be output as json.
@@ -85,6 +111,21 @@ def gen(schema: dict = None,
             The path to options file. This is parsed as JSON to an Options instance.
         multiplicity (int, optional):
             If specified, it repeats the generation for the specified number of times and returns the results as a list.
+        output_format (str, default='json'):
+            The format of output to files. If it is ``'json'``, the result is output as JSON.
+            If it is ``'jsonl'``, each generated value is output as a line of JSON (JSON Lines).
+            In both formats, if ``multiplicity`` is specified, each value is written as soon as it is generated, so
+            memory usage doesn't depend on ``multiplicity`` when ``return_none`` is True.
+        workers (int, optional):
+            If specified, the files of ``output_file_list`` are generated in parallel by the specified number of
+            processes.
+        shard (Tuple[int, int], optional):
+            A pair ``(i, n)``. If specified, only the files of ``output_file_list`` whose index modulo ``n`` is ``i``
+            are generated. With the same state of ``rng``, the files are the same as the files of a run without
+            ``shard``.
+        rng (random.Random, optional):
+            The random number generator. If it is not specified, the module ``random`` is used.
+            Specify a ``random.Random`` with a seed to make the result reproducible.
         schema_is_validated (bool, optional):
             Whether the schema is already validated or not.
             (In normal usage, this argument is not specified.)
@@ -125,14 +166,24 @@ def gen(schema: dict = None,
         raise ValueError("Only one of options and options_file can be set. (You don't have to set either one.)")
     if multiplicity is not None and not (is_integer(multiplicity) and 0 <= multiplicity):
         raise ValueError(f"Illegal argument 'multiplicity': {multiplicity}")
+    if output_format not in (JSON, JSONL):
+        raise ValueError(f"Illegal argument 'output_format': {output_format}")
+    if workers is not None and not (is_integer(workers) and 0 < workers):
+        raise ValueError(f"Illegal argument 'workers': {workers}")
+    if workers is not None and output_file_list is None:
+        raise ValueError("workers can be set only with output_file_list.")
+    if shard is not None and not (len(shard) == 2 and is_integer(shard[0]) and is_integer(shard[1])
+                                  and 0 <= shard[0] < shard[1]):
+        raise ValueError(f"Illegal argument 'shard': {shard}")
+    if shard is not None and output_file_list is None:
+        raise ValueError("shard can be set only with output_file_list.")
 
     # スキーマファイルを読み込み
     if schema_file is not None:
         schema = schemas.load(schema_file)
 
-    # スキーマの不正判定
-    if not schema_is_validated:
-        schemas.validate(schema)
+    # スキーマの不正判定とファクトリの構築 (同じスキーマのファクトリがキャッシュされていれば、いずれも省略される)
+    factory = factory_cache.get(schema, schema_is_validated=schema_is_validated)
 
     # オプションファイルを読み込み
     if options_file is not None:
@@ -143,15 +194,11 @@ def gen(schema: dict = None,
         output_list = ((output_file, None),)
     elif output_fp is not None:
         output_list = ((None, output_fp),)
-    elif output_file_list is not None:
-        output_list = itertools.zip_longest(output_file_list, tuple())
     elif output_fp_list is not None:
         output_list = itertools.zip_longest(tuple(), output_fp_list)
     else:
         output_list = ((None, None),)
 
-    factory = ranjg.Factory(schema, schema_is_validated=True)
-
     # メソッドの戻り値を保持するリストを作成
     if return_none:
         # 戻り値による出力を行わない場合、要素を保持しないダミーリストを使用する。
@@ -161,23 +208,32 @@ def gen(schema: dict = None,
         # 戻り値を返す場合、生成したものをすべて保持する必要があるため、リストに保持する。
         result_list = []
 
-    # 出力先の数だけ生成処理を繰り返す。
-    for output_file, output_fp in output_list:
+    if rng is None:
+        rng = random
 
-        # ランダムに値を生成
-        if multiplicity is None:
-            generated = factory.gen(options=options, context=context)
-            result_list.append(generated)
+    generation_kwargs = dict(options=options, context=context, multiplicity=multiplicity,
+                             output_format=output_format, keep_generated=not return_none)
+
+    if output_file_list is not None:
+        # ファイルごとのシードは、rng から決めたシードとファイルのインデックスから導出する。
+        # これにより、並列化やシャーディングの有無によらず各ファイルの内容が定まる。
+        seed = rng.getrandbits(64)
+        indexed_files = _select_shard(enumerate(output_file_list), shard)
+
+        if workers is not None:
+            # 出力先のファイルを複数のプロセスで分担して生成する
+            result_list.extend(_gen_files_in_parallel(factory, list(indexed_files), workers, seed,
+                                                      generation_kwargs))
         else:
-            generated = [factory.gen(options=options, context=context) for _ in range(multiplicity)]
-            result_list.extend(generated)
+            file_rng = random.Random()
+            generation = _Generation(factory, rng=file_rng, repeated=True, **generation_kwargs)
+            _gen_indexed_files(generation, file_rng, seed, indexed_files, result_list)
+    else:
+        generation = _Generation(factory, rng=rng, repeated=output_fp_list is not None, **generation_kwargs)
 
-        # 出力先指定がある場合、JSONとして出力する
-        if output_file is not None:
-            with open(output_file, "w+") as fp:
-                json.dump(generated, fp)
-        if output_fp is not None:
-            json.dump(generated, output_fp)
+        # 出力先の数だけ生成処理を繰り返す。
+        for output_file, output_fp in output_list:
+            generation.run(output_file, output_fp, result_list)
 
     if return_none:
         return None
@@ -187,6 +243,203 @@ def gen(schema: dict = None,
         return result_list
 
 
+class _Generation:
+    """Generation repeated for each output.
+
+    Args:
+        factory: The factory according to the schema.
+        options: The options for generation.
+        context: The context of generation.
+        rng: The random number generator.
+        multiplicity: The number of values generated for each output, or None to generate a value.
+        output_format: The format of output to files.
+        keep_generated: If it is False, values written to a file are not kept after writing.
+        repeated: Whether the generation is repeated for multiple outputs or not.
+    """
+
+    def __init__(self, factory: 'ranjg.Factory', *,
+                 options: Optional[Options],
+                 context: Optional[GenerationContext],
+                 rng: random.Random,
+                 multiplicity: Optional[int],
+                 output_format: str,
+                 keep_generated: bool,
+                 repeated: bool):
+        self._factory = factory
+        self._options = options
+        self._context = context
+        self._rng = rng
+        self._multiplicity = multiplicity
+        self._output_format = output_format
+        self._keep_generated = keep_generated
+
+        # 複数の出力先について生成を繰り返す場合、オプションの参照などを事前に解決した生成関数を使用する。
+        # プロファイルの有無で生成結果が変わらないよう、プロファイル中も同じ方法で生成し、ルート要素の計測のみ追加する。
+        if multiplicity is None and repeated:
+            self._generate = factory.compile(options=options, context=context, rng=rng)
+        else:
+            self._generate = functools.partial(factory.gen, options=options, context=context, rng=rng)
+            if multiplicity is None and profiling.active_profiler() is not None:
+                self._generate = profiling.profiled(context, self._generate)
+
+    def run(self, output_file: Optional[str], output_fp: Optional[TextIO], result_list: list) -> None:
+        """Generate values for an output, and append them to ``result_list``.
+        """
+        if output_file is not None:
+            with open(output_file, "w+") as fp:
+                generated = self._gen_and_output(fp)
+        else:
+            generated = self._gen_and_output(output_fp)
+
+        if self._multiplicity is None:
+            result_list.append(generated)
+        else:
+            result_list.extend(generated)
+
+    def _gen_and_output(self, fp: Optional[TextIO]) -> Any:
+        # ランダムに値を生成し、出力先指定がある場合は出力する
+        multiplicity, output_format = self._multiplicity, self._output_format
+        if multiplicity is None:
+            generated = self._generate()
+            if fp is not None:
+                _dump(generated, fp, output_format)
+        elif fp is not None:
+            # 生成した値を逐次出力し、戻り値に使用しない場合は保持しない
+            generated = []
+            if output_format == JSON:
+                fp.write("[")
+            for chunk_start in range(0, multiplicity, _STREAM_CHUNK_SIZE):
+                chunk = self._factory.gen_many(min(_STREAM_CHUNK_SIZE, multiplicity - chunk_start),
+                                               options=self._options, context=self._context, rng=self._rng)
+                if output_format == JSONL:
+                    _dump_lines(chunk, fp)
+                else:
+                    _dump_items(chunk, fp, is_first=chunk_start == 0)
+                if self._keep_generated:
+                    generated.extend(chunk)
+            if output_format == JSON:
+                fp.write("]")
+        else:
+            generated = self._factory.gen_many(multiplicity, options=self._options, context=self._context,
+                                               rng=self._rng)
+
+        return generated
+
+
+def _select_shard(indexed_files: Iterable[Tuple[int, str]],
+                  shard: Optional[Tuple[int, int]]) -> Iterable[Tuple[int, str]]:
+    """Select the files which belong to the shard.
+
+    Args:
+        indexed_files: Pairs of the index and the path of files.
+        shard: A pair ``(i, n)``, or None to select all files.
+
+    Returns:
+        Pairs of the index and the path of files whose index modulo ``n`` is ``i``.
+    """
+    if shard is None:
+        return indexed_files
+
+    shard_index, shard_count = shard
+    return ((index, output_file) for index, output_file in indexed_files if index % shard_count == shard_index)
+
+
+def _gen_indexed_files(generation: _Generation, file_rng: random.Random, seed: int,
+                       indexed_files: Iterable[Tuple[int, str]], result_list: list) -> None:
+    """Generate files each of which is generated with the seed derived from its index.
+
+    Args:
+        generation: The generation which uses ``file_rng``.
+        file_rng: The random number generator which is seeded for each file.
+        seed: The seed from which the seed of each file is derived.
+        indexed_files: Pairs of the index and the path of files.
+        result_list: The list to which generated values are appended.
+    """
+    for index, output_file in indexed_files:
+        file_rng.seed(derive_seed(seed, index))
+        generation.run(output_file, None, result_list)
+
+
+def _gen_files_in_parallel(factory: 'ranjg.Factory', indexed_files: List[Tuple[int, str]], workers: int, seed: int,
+                           generation_kwargs: dict) -> list:
+    """Generate files with a process pool.
+
+    The factory is passed to the worker processes as is, so they neither validate the schema nor construct the factory
+    again, and generate values in the same way as this process.
+
+    Args:
+        factory: The factory according to the schema.
+        indexed_files: Pairs of the index and the path of files to generate.
+        workers: The number of processes.
+        seed: The seed from which the seed of each file is derived.
+        generation_kwargs: Keyword arguments of ``_Generation`` except ``factory``, ``rng`` and ``repeated``.
+
+    Returns:
+        Generated values in the order of ``indexed_files``.
+    """
+    # 並列生成時のみ使用するため、起動を速くするよう使用時に import する
+    import concurrent.futures
+    import uuid
+
+    chunk_size = max(1, math.ceil(len(indexed_files) / (workers * _TASKS_PER_WORKER)))
+    chunks = [indexed_files[i:i + chunk_size] for i in range(0, len(indexed_files), chunk_size)]
+
+    task = functools.partial(_gen_files, uuid.uuid4().hex, factory, generation_kwargs, seed)
+    result_list = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for generated_list in executor.map(task, chunks):
+            result_list.extend(generated_list)
+
+    return result_list
+
+
+#: ワーカープロセスで使用中の生成処理と、それを識別するトークン、およびその生成処理が使用する乱数生成器
+_worker_generation: Optional[Tuple[str, _Generation, random.Random]] = None
+
+
+def _gen_files(token: str, factory: 'ranjg.Factory', generation_kwargs: dict, seed: int,
+               indexed_files: List[Tuple[int, str]]) -> list:
+    """Generate files in a worker process.
+
+    The generation is prepared only once in each worker process for each ``token``, with the factory received first.
+    """
+    global _worker_generation
+    if _worker_generation is None or _worker_generation[0] != token:
+        file_rng = random.Random()
+        _worker_generation = (token,
+                              _Generation(factory, rng=file_rng, repeated=True, **generation_kwargs),
+                              file_rng)
+    _, generation, file_rng = _worker_generation
+
+    result_list = [] if generation_kwargs["keep_generated"] else _DummyList()
+    _gen_indexed_files(generation, file_rng, seed, indexed_files, result_list)
+
+    return result_list
+
+
+def _dump(value: Any, fp: TextIO, output_format: str) -> None:
+    """Write a value to the file in the format.
+    """
+    if output_format == JSONL:
+        _dump_lines((value,), fp)
+    else:
+        json.dump(value, fp)
+
+
+def _dump_items(values: Iterable[Any], fp: TextIO, is_first: bool) -> None:
+    """Write values to the file as items of a JSON array.
+
+    The output is the same as ``json.dump`` of a list except for the brackets.
+    """
+    fp.write(("" if is_first else ", ") + ", ".join(map(json.dumps, values)))
+
+
+def _dump_lines(values: Iterable[Any], fp: TextIO) -> None:
+    """Write values to the file as JSON Lines.
+    """
+    fp.write("".join(json.dumps(value) + "\n" for value in values))
+
+
 class _DummyList(list):
     """List to ignore change operations.
     """
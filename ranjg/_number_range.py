@@ -1,3 +1,5 @@
+import math
+import struct
 from collections import namedtuple
 from typing import Union, Tuple, Optional
 
@@ -19,6 +21,26 @@ class NumberRange(namedtuple("NumberRange", "minimum maximum exclusive_minimum e
     def replace(self, **kwargs):
         return self._replace(**kwargs)
 
+    def to_inclusive_float(self) -> Tuple[float, float]:
+        """Convert the range into the inclusive interval of floats.
+
+        Each exclusive bound is replaced with the adjacent float inside the range, so every float in the returned
+        interval is in the range.
+
+        Returns:
+            The smallest and the largest floats in the range. If no float is in the range, the first value is greater
+            than the second value.
+        """
+        minimum = float(self.minimum)
+        if minimum < self.minimum or (self.exclusive_minimum and minimum <= self.minimum):
+            minimum = next_after(minimum, math.inf)
+
+        maximum = float(self.maximum)
+        if maximum > self.maximum or (self.exclusive_maximum and maximum >= self.maximum):
+            maximum = next_after(maximum, -math.inf)
+
+        return minimum, maximum
+
     @classmethod
     def from_schema(cls, schema: dict = None):
         """Initialize NumberRange
@@ -31,6 +53,30 @@ class NumberRange(namedtuple("NumberRange", "minimum maximum exclusive_minimum e
         return _from_schema(schema)
 
 
+def _next_after(x: float, y: float) -> float:
+    """Return the next float after ``x`` towards ``y``.
+
+    It is the same as ``math.nextafter`` which is available since python 3.9.
+    """
+    if math.isnan(x) or math.isnan(y):
+        return math.nan
+    if x == y:
+        return y
+    if x == 0.0:
+        return math.copysign(5e-324, y - x)
+
+    # 正の数は、ビット列を整数とみなした大小が値の大小と一致する
+    bits = struct.unpack('<q', struct.pack('<d', x))[0]
+    if (x < y) == (x > 0.0):
+        bits += 1
+    else:
+        bits -= 1
+    return struct.unpack('<d', struct.pack('<q', bits))[0]
+
+
+next_after = getattr(math, 'nextafter', _next_after)
+
+
 def _normalize_minimum(minimum: Union[float, int, None],
                        exclusive_minimum: Union[float, int, bool, None]) -> Tuple[Optional[float], bool]:
     """Normalize minimum
@@ -0,0 +1,70 @@
+"""Optional NumPy backend for generating many values at once.
+
+NumPy is not required by ranjg. If it is installed and ``options.use_numpy`` is True, factories of simple types
+generate a large batch of values with vectorised NumPy calls; otherwise they use pure-Python loops.
+
+The values generated with NumPy are different from the values generated without it, even with the same seed, and also
+depend on the version of the random stream of NumPy. So NumPy is used only when it is requested.
+"""
+import random
+from typing import Optional
+
+from .options import Options
+
+#: まだ import を試みていないことを表す値
+_NOT_LOADED = object()
+
+#: NumPy のモジュール。使用できない場合は None。import には時間がかかるため、load_numpy で初めて使用する際に import する。
+numpy = _NOT_LOADED
+
+#: NumPy を使用する最小の生成数 (これより少ない場合は配列の生成と変換のコストが上回る)
+NUMPY_THRESHOLD = 64
+
+#: numpy.int64 で表現できる整数の範囲
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def load_numpy():
+    """Returns the module ``numpy``, importing it on the first call.
+
+    Returns:
+        The module ``numpy``, or None if NumPy 1.17 or later is not installed.
+    """
+    global numpy
+    if numpy is _NOT_LOADED:
+        try:
+            import numpy as _numpy
+        except ImportError:
+            _numpy = None
+        else:
+            # numpy.random.Generator は NumPy 1.17 以降にのみ存在する
+            if not hasattr(_numpy.random, 'default_rng'):
+                _numpy = None
+        numpy = _numpy
+
+    return numpy
+
+
+def numpy_rng(n: int, options: Options, rng: random.Random) -> Optional['numpy.random.Generator']:
+    """Returns a NumPy random generator to generate ``n`` values, if NumPy is requested, available and worth using.
+
+    The generator is seeded from ``rng``, so seeding ``rng`` also makes the result of NumPy reproducible as long as the
+    same version of NumPy is used.
+
+    Args:
+        n: The number of values to generate.
+        options: The options of the generation. NumPy is used only if ``options.use_numpy`` is True.
+        rng: The random number generator used instead of NumPy.
+
+    Returns:
+        A random generator of NumPy, or None if values should be generated without NumPy.
+    """
+    if not options.use_numpy or n < NUMPY_THRESHOLD:
+        return None
+
+    np = load_numpy()
+    if np is None:
+        return None
+
+    return np.random.default_rng(rng.getrandbits(128))
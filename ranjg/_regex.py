@@ -0,0 +1,672 @@
+"""Sampler of strings which match regular expressions.
+
+A regular expression is parsed with ``sre_parse`` only once and compiled into a tree of nodes.
+When the length of strings is limited, each node computes the set of lengths of strings it can produce, so that strings
+can be sampled with a length between ``minLength`` and ``maxLength`` directly, without generating and discarding
+strings.
+
+The set of lengths is represented by an integer as a bit set: the i-th bit is 1 if and only if the node can produce a
+string of length i.
+
+As ``pattern`` of JSON schema matches anywhere in a string, a string which matches a pattern not anchored by ``^`` and
+``$`` can be padded to satisfy ``minLength``.
+"""
+import abc
+import random
+import re
+import string
+from typing import List, Optional, Sequence, Dict, Tuple
+
+try:
+    import re._parser as sre_parse  # python 3.11
+    import re._constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+#: The maximum number of repeats of ``*``, ``+`` and ``{n,}`` if the length is not limited. (Same as ``rstr``.)
+#: If the length is limited, the maximum number of repeats is extended to the limit of length.
+REPEAT_LIMIT = 100
+
+#: The maximum length of strings over ``minLength`` which is considered when only ``maxLength`` limits the length.
+LENGTH_WINDOW = 1000
+
+#: The maximum length for which the set of lengths is computed. Over it, strings are generated and discarded.
+LENGTH_LIMIT = 100000
+
+#: 繰り返しの回数ごとの長さの集合として保持するビット数の上限
+_LENGTHS_BUDGET = 10 ** 8
+
+_PRINTABLE = string.printable
+#: 否定の文字クラスで使用する文字 (ASCII 以外を除外するクラスのため、Latin-1 の文字を加える)
+_NEGATABLE = _PRINTABLE + "".join(chr(c) for c in range(0xc0, 0x100) if c not in (0xd7, 0xf7))
+_WORD = string.ascii_letters + string.digits + "_"
+
+_CATEGORIES: Dict[object, str] = {
+    sre_constants.CATEGORY_DIGIT: string.digits,
+    sre_constants.CATEGORY_NOT_DIGIT: "".join(c for c in _PRINTABLE if c not in string.digits),
+    sre_constants.CATEGORY_SPACE: string.whitespace,
+    sre_constants.CATEGORY_NOT_SPACE: "".join(c for c in _PRINTABLE if c not in string.whitespace),
+    sre_constants.CATEGORY_WORD: _WORD,
+    sre_constants.CATEGORY_NOT_WORD: "".join(c for c in _PRINTABLE if c not in _WORD),
+}
+
+_REPEATS = tuple(filter(None, (sre_constants.MAX_REPEAT,
+                               sre_constants.MIN_REPEAT,
+                               getattr(sre_constants, "POSSESSIVE_REPEAT", None))))
+
+
+def _bits(mask: int) -> List[int]:
+    """Returns the indices of 1-bits of ``mask`` in ascending order.
+    """
+    return [i for i in range(mask.bit_length()) if mask >> i & 1]
+
+
+def _add_lengths(mask_a: int, mask_b: int, limit: int) -> int:
+    """Returns the set of the sums of an element of ``mask_a`` and an element of ``mask_b``.
+
+    The lengths greater than ``limit`` are discarded.
+    """
+    # 要素の少ない方について繰り返す
+    if bin(mask_a).count("1") > bin(mask_b).count("1"):
+        mask_a, mask_b = mask_b, mask_a
+    result = 0
+    for i in _bits(mask_a):
+        if i > limit:
+            break
+        result |= mask_b << i
+    return result & ((1 << (limit + 1)) - 1)
+
+
+def _choose_length(rng, lengths: int, rest_lengths: int, length: int) -> int:
+    """Choose the length of a node from ``lengths`` so that the rest ``rest_lengths`` can produce the remaining length.
+    """
+    return rng.choice([n for n in _bits(lengths) if n <= length and rest_lengths >> (length - n) & 1])
+
+
+class _Node(abc.ABC):
+    """A node of a compiled regular expression.
+    """
+    #: The maximum length of strings which the node can produce.
+    max_width: int = 0
+    #: The set of lengths of strings which the node can produce. It is computed by ``prepare``.
+    lengths: int = 1
+    #: True if the node may produce strings whose length is not in ``lengths``. (e.g. back reference)
+    irregular: bool = False
+
+    @abc.abstractmethod
+    def prepare(self, limit: int) -> None:
+        """Compute ``lengths`` of the node and its descendants.
+
+        The lengths greater than ``limit`` are not contained in ``lengths``.
+
+        Args:
+            limit: The maximum length to consider.
+        """
+
+    @abc.abstractmethod
+    def sample(self, rng, out: List[str], groups: dict) -> None:
+        """Appends a string which the node produces to ``out``.
+        """
+
+    def sample_length(self, rng, length: int, out: List[str], groups: dict) -> None:
+        """Appends a string of ``length`` characters which the node produces to ``out``.
+
+        ``length`` must be in ``lengths``.
+        """
+        self.sample(rng, out, groups)
+
+    @property
+    def is_fixed(self) -> bool:
+        return self.lengths & (self.lengths - 1) == 0
+
+
+class _Empty(_Node):
+
+    def prepare(self, limit: int) -> None:
+        pass
+
+    def sample(self, rng, out: List[str], groups: dict) -> None:
+        pass
+
+
+class _Literal(_Node):
+
+    def __init__(self, text: str):
+        self.text = text
+        self.max_width = len(text)
+        self.lengths = 1 << len(text)
+
+    def prepare(self, limit: int) -> None:
+        self.lengths = 1 << len(self.text) if len(self.text) <= limit else 0
+
+    def sample(self, rng, out: List[str], groups: dict) -> None:
+        out.append(self.text)
+
+
+class _Chars(_Node):
+    max_width = 1
+    lengths = 1 << 1
+
+    def __init__(self, chars: Sequence[str]):
+        self.chars = chars
+
+    def prepare(self, limit: int) -> None:
+        self.lengths = 1 << 1 if limit >= 1 else 0
+
+    def sample(self, rng, out: List[str], groups: dict) -> None:
+        out.append(rng.choice(self.chars))
+
+
+class _Sequence(_Node):
+
+    def __init__(self, nodes: List[_Node]):
+        self.nodes = nodes
+        self.max_width = sum(node.max_width for node in nodes)
+        self.irregular = any(node.irregular for node in nodes)
+        self.suffix_lengths = []
+
+    def prepare(self, limit: int) -> None:
+        for node in self.nodes:
+            node.prepare(limit)
+
+        # suffix_lengths[i] は nodes[i:] が生成しうる長さの集合
+        self.suffix_lengths = [1] * (len(self.nodes) + 1)
+        for i in reversed(range(len(self.nodes))):
+            self.suffix_lengths[i] = _add_lengths(self.nodes[i].lengths, self.suffix_lengths[i + 1], limit)
+        self.lengths = self.suffix_lengths[0]
+
+    def sample(self, rng, out: List[str], groups: dict) -> None:
+        for node in self.nodes:
+            node.sample(rng, out, groups)
+
+    def sample_length(self, rng, length: int, out: List[str], groups: dict) -> None:
+        for i, node in enumerate(self.nodes):
+            if node.is_fixed:
+                node_length = node.lengths.bit_length() - 1
+            else:
+                # 残りの要素で残りの長さを生成できるものから選ぶ
+                node_length = _choose_length(rng, node.lengths, self.suffix_lengths[i + 1], length)
+            node.sample_length(rng, node_length, out, groups)
+            length -= node_length
+
+
+class _Branch(_Node):
+
+    def __init__(self, alternatives: List[_Node]):
+        self.alternatives = alternatives
+        self.max_width = max(node.max_width for node in alternatives)
+        self.irregular = any(node.irregular for node in alternatives)
+
+    def prepare(self, limit: int) -> None:
+        self.lengths = 0
+        for node in self.alternatives:
+            node.prepare(limit)
+            self.lengths |= node.lengths
+        self.lengths &= (1 << (limit + 1)) - 1
+
+    def sample(self, rng, out: List[str], groups: dict) -> None:
+        rng.choice(self.alternatives).sample(rng, out, groups)
+
+    def sample_length(self, rng, length: int, out: List[str], groups: dict) -> None:
+        candidates = [node for node in self.alternatives if node.lengths >> length & 1]
+        rng.choice(candidates).sample_length(rng, length, out, groups)
+
+
+class _Repeat(_Node):
+
+    def __init__(self, node: _Node, min_count: int, max_count: int):
+        self.node = node
+        self.min_count = min_count
+        self.max_count = max_count
+        self.max_width = node.max_width * max_count
+        self.irregular = node.irregular
+        self.count_lengths = []
+
+    def prepare(self, limit: int) -> None:
+        self.node.prepare(limit)
+
+        if self.node.lengths == 0:
+            # 要素が生成できない場合、0回の繰り返しのみ可能
+            self.count_lengths = None
+            self.lengths = 1 if self.min_count == 0 else 0
+            return
+
+        if self.node.is_fixed:
+            # 長さが一定の要素の繰り返しは回数から長さが決まるため、回数ごとの長さの集合を保持しない
+            self.count_lengths = None
+            width = self.node.lengths.bit_length() - 1
+            max_count = min(self.max_count, limit // width) if width > 0 else self.min_count
+            if max_count < self.min_count:
+                self.lengths = 0
+            elif width == 0:
+                self.lengths = 1
+            else:
+                # width ビットごとに 1 が立つ整数
+                pattern = int(("1" + "0" * (width - 1)) * (max_count - self.min_count + 1), 2) >> (width - 1)
+                self.lengths = pattern << (self.min_count * width)
+            return
+
+        if self.max_count * (limit + 1) > _LENGTHS_BUDGET:
+            raise _LengthsTooLargeError()
+
+        # count_lengths[k] は node を k 回繰り返して生成しうる長さの集合
+        self.count_lengths = [1]
+        for _ in range(self.max_count):
+            lengths = _add_lengths(self.count_lengths[-1], self.node.lengths, limit)
+            if lengths == self.count_lengths[-1]:
+                # 変化しなくなった後は、繰り返しても同じ集合になる
+                self.count_lengths.extend([lengths] * (self.max_count + 1 - len(self.count_lengths)))
+                break
+            self.count_lengths.append(lengths)
+        self.lengths = 0
+        for mask in self.count_lengths[self.min_count:]:
+            self.lengths |= mask
+
+    def sample(self, rng, out: List[str], groups: dict) -> None:
+        self._sample_count(rng, rng.randint(self.min_count, self.max_count), out, groups)
+
+    def sample_length(self, rng, length: int, out: List[str], groups: dict) -> None:
+        if self.count_lengths is None:
+            width = self.node.lengths.bit_length() - 1
+            count = length // width if width > 0 else self.min_count
+            self._sample_count(rng, count, out, groups)
+            return
+
+        count = rng.choice([k for k in range(self.min_count, self.max_count + 1)
+                            if self.count_lengths[k] >> length & 1])
+
+        for rest_count in reversed(range(count)):
+            node_length = _choose_length(rng, self.node.lengths, self.count_lengths[rest_count], length)
+            self.node.sample_length(rng, node_length, out, groups)
+            length -= node_length
+
+    def _sample_count(self, rng, count: int, out: List[str], groups: dict) -> None:
+        node = self.node
+        if isinstance(node, _Chars):
+            # 1文字の繰り返しは一度に選ぶ
+            out.append("".join(rng.choices(node.chars, k=count)))
+        else:
+            for _ in range(count):
+                node.sample(rng, out, groups)
+
+
+class _Group(_Node):
+
+    def __init__(self, node: _Node, group: Optional[int]):
+        self.node = node
+        self.group = group
+        self.max_width = node.max_width
+        self.irregular = node.irregular
+
+    def prepare(self, limit: int) -> None:
+        self.node.prepare(limit)
+        self.lengths = self.node.lengths
+
+    def sample(self, rng, out: List[str], groups: dict) -> None:
+        start = len(out)
+        self.node.sample(rng, out, groups)
+        self._record(out, start, groups)
+
+    def sample_length(self, rng, length: int, out: List[str], groups: dict) -> None:
+        start = len(out)
+        self.node.sample_length(rng, length, out, groups)
+        self._record(out, start, groups)
+
+    def _record(self, out: List[str], start: int, groups: dict) -> None:
+        # 後方参照のため、グループに該当する文字列を記録する
+        if self.group is not None:
+            groups[self.group] = "".join(out[start:])
+
+
+class _GroupRef(_Node):
+    irregular = True
+
+    def __init__(self, group: int, group_node: Optional[_Node]):
+        self.group = group
+        self.group_node = group_node
+        self.max_width = group_node.max_width if group_node is not None else 0
+
+    def prepare(self, limit: int) -> None:
+        # 参照するグループと同じ長さの集合とみなす (実際の長さはグループの生成結果に依存する)
+        self.lengths = self.group_node.lengths if self.group_node is not None else 1
+
+    def sample(self, rng, out: List[str], groups: dict) -> None:
+        out.append(groups.get(self.group, ""))
+
+
+class _GroupRefExists(_Node):
+    irregular = True
+
+    def __init__(self, group: int, yes: _Node, no: _Node):
+        self.group = group
+        self.yes = yes
+        self.no = no
+        self.max_width = max(yes.max_width, no.max_width)
+
+    def prepare(self, limit: int) -> None:
+        self.yes.prepare(limit)
+        self.no.prepare(limit)
+        self.lengths = self.yes.lengths | self.no.lengths
+
+    def sample(self, rng, out: List[str], groups: dict) -> None:
+        (self.yes if self.group in groups else self.no).sample(rng, out, groups)
+
+
+class _LengthsTooLargeError(Exception):
+    """Raised when the sets of lengths are too large to compute.
+    """
+
+
+class EmptyCharacterSetError(ValueError):
+    """Raised when no character matches a character class of a regular expression.
+    """
+
+
+class _Compiler:
+    """Compiler from a parsed regular expression to nodes.
+
+    Args:
+        repeat_limit: The maximum number of repeats of ``*``, ``+`` and ``{n,}``.
+    """
+
+    def __init__(self, repeat_limit: int = REPEAT_LIMIT):
+        self._repeat_limit = repeat_limit
+        #: The nodes of groups for back references.
+        self._groups: Dict[int, _Node] = {}
+        #: True if the number of repeats of some node is limited by ``repeat_limit``.
+        self.capped = False
+
+    def compile(self, parsed) -> _Node:
+        nodes: List[_Node] = []
+        literal: List[str] = []
+
+        for opcode, value in parsed:
+            if opcode is sre_constants.LITERAL:
+                # 連続するリテラルは1つにまとめる
+                literal.append(chr(value))
+                continue
+
+            if len(literal) > 0:
+                nodes.append(_Literal("".join(literal)))
+                literal = []
+
+            node = self._compile_state(opcode, value)
+            if node is not None:
+                nodes.append(node)
+
+        if len(literal) > 0:
+            nodes.append(_Literal("".join(literal)))
+
+        if len(nodes) == 0:
+            return _Empty()
+        elif len(nodes) == 1:
+            return nodes[0]
+        else:
+            return _Sequence(nodes)
+
+    def _compile_state(self, opcode, value) -> Optional[_Node]:
+        if opcode is sre_constants.NOT_LITERAL:
+            return _Chars(_PRINTABLE.replace(chr(value), ""))
+        elif opcode is sre_constants.ANY:
+            return _Chars(_PRINTABLE.replace("\n", ""))
+        elif opcode is sre_constants.IN:
+            chars = self._compile_in(value)
+            if len(chars) <= 0:
+                raise EmptyCharacterSetError("No character matches a character class of the pattern.")
+            return _Chars(chars)
+        elif opcode is sre_constants.CATEGORY:
+            return _Chars(_CATEGORIES[value])
+        elif opcode is sre_constants.BRANCH:
+            return _Branch([self.compile(alternative) for alternative in value[1]])
+        elif opcode is sre_constants.SUBPATTERN:
+            group = value[0]
+            node = _Group(self.compile(value[-1]), group)
+            if group is not None:
+                self._groups[group] = node
+            return node
+        elif opcode in _REPEATS:
+            min_count, max_count, item = value
+            if max_count is sre_constants.MAXREPEAT or max_count > self._repeat_limit:
+                max_count = max(min_count, self._repeat_limit)
+                self.capped = True
+            return _Repeat(self.compile(item), min_count, max_count)
+        elif opcode is sre_constants.GROUPREF:
+            return _GroupRef(value, self._groups.get(value))
+        elif opcode is sre_constants.GROUPREF_EXISTS:
+            group, yes, no = value
+            return _GroupRefExists(group, self.compile(yes), self.compile(no) if no is not None else _Empty())
+        elif opcode is getattr(sre_constants, "ATOMIC_GROUP", None):
+            return self.compile(value)
+        elif opcode in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            # 位置にのみ関する指定は文字列を生成しない
+            return None
+        else:
+            raise ValueError(f"Unsupported regular expression: {opcode}")
+
+    @staticmethod
+    def _compile_in(items) -> str:
+        chars: List[str] = []
+        negate = False
+        for opcode, value in items:
+            if opcode is sre_constants.NEGATE:
+                negate = True
+            elif opcode is sre_constants.LITERAL:
+                chars.append(chr(value))
+            elif opcode is sre_constants.RANGE:
+                chars.extend(chr(c) for c in range(value[0], value[1] + 1))
+            elif opcode is sre_constants.CATEGORY:
+                chars.extend(_CATEGORIES[value])
+            else:
+                raise ValueError(f"Unsupported regular expression: {opcode}")
+
+        if negate:
+            excluded = set(chars)
+            return "".join(c for c in _NEGATABLE if c not in excluded)
+        else:
+            # 重複を除き、順序を保つ
+            return "".join(dict.fromkeys(chars))
+
+
+def _is_anchored(parsed, index: int, anchors: tuple) -> bool:
+    """Returns whether the parsed regular expression is anchored at the start (``index = 0``) or the end
+    (``index = -1``).
+    """
+    if len(parsed) <= 0:
+        return False
+
+    opcode, value = parsed[index]
+    if opcode is sre_constants.AT:
+        return value in anchors
+    elif opcode is sre_constants.SUBPATTERN:
+        return _is_anchored(value[-1], index, anchors)
+    elif opcode is sre_constants.BRANCH:
+        return all(_is_anchored(alternative, index, anchors) for alternative in value[1])
+    else:
+        return False
+
+
+class PatternSampler:
+    """Sampler of strings which match a regular expression.
+
+    The regular expression is parsed and compiled only once on construction.
+
+    When the length is limited, the length of a sampled string is chosen uniformly from the lengths which the pattern
+    can produce between ``min_length`` and ``max_length``. If the pattern cannot produce such a length but it is not
+    anchored at both ends, a shorter string matching the pattern is padded with letters.
+
+    Args:
+        pattern: A regular expression.
+        min_length: The minimum length of strings to be generated. If it is None, the length is not limited.
+        max_length: The maximum length of strings to be generated. If it is None, the length is not limited.
+
+    Raises:
+        EmptyCharacterSetError: If no character matches a character class of the pattern.
+    """
+
+    def __init__(self, pattern: str, min_length: Optional[int] = None, max_length: Optional[int] = None):
+        parsed = sre_parse.parse(pattern)
+        self._pattern = pattern
+        self._min_length = min_length if min_length is not None else 0
+        self._max_length = max_length
+        self._length_is_limited = min_length is not None or max_length is not None
+        # 長さの候補を絞り込む範囲
+        self._max_length_bound = max_length if max_length is not None else LENGTH_LIMIT
+        # 両端が固定されていない場合、一致する部分の前後に文字を加えてよい
+        self._anchored_at_start = _is_anchored(parsed, 0, (sre_constants.AT_BEGINNING,
+                                                           sre_constants.AT_BEGINNING_STRING))
+        self._anchored_at_end = _is_anchored(parsed, -1, (sre_constants.AT_END, sre_constants.AT_END_STRING))
+        self._regex = None
+
+        #: 生成する長さの候補
+        self._lengths: Optional[List[int]] = None
+        #: 文字を加えて長さを満たす場合の、一致する部分の長さの候補
+        self._match_lengths: Optional[List[int]] = None
+        self._satisfiable = True
+
+        if not self._length_is_limited:
+            self._root = _Compiler().compile(parsed)
+            return
+
+        # 考慮する長さの上限
+        if max_length is None:
+            self._upper = self._min_length + REPEAT_LIMIT
+        else:
+            self._upper = min(max_length, self._min_length + LENGTH_WINDOW)
+
+        if self._upper > LENGTH_LIMIT:
+            # 長さの集合を計算するには長すぎるため、生成してから長さを確認する
+            self._root = _Compiler().compile(parsed)
+            return
+
+        # 上限までの長さを生成できるよう、繰り返しの回数の上限を広げる
+        compiler = _Compiler(max(REPEAT_LIMIT, self._upper))
+        self._root = compiler.compile(parsed)
+        limit = min(self._upper, self._root.max_width)
+        try:
+            self._root.prepare(limit)
+            self._lengths = self._lengths_between(self._min_length, self._root.lengths)
+
+            # maxLength がない場合、上限を超える長さのみを生成しうるパターンもある (e.g. "^a{500}$")
+            if len(self._lengths) <= 0 and max_length is None and limit < min(self._root.max_width, LENGTH_LIMIT):
+                limit = min(self._root.max_width, LENGTH_LIMIT)
+                self._root.prepare(limit)
+                self._lengths = self._lengths_between(self._min_length, self._root.lengths)
+        except _LengthsTooLargeError:
+            # 生成してから長さを確認する
+            self._lengths = None
+            return
+
+        if len(self._lengths) > 0:
+            return
+        self._lengths = None
+
+        # 計算した長さの集合が、生成しうるすべての長さを含むか否か
+        covers_all_lengths = (max_length is not None and self._upper >= max_length) or \
+                             (not compiler.capped and limit >= self._root.max_width)
+
+        # 両端が固定されていない場合、短い文字列に文字を加えて長さを満たす
+        if not (self._anchored_at_start and self._anchored_at_end):
+            # 文字を加えるため、一致する部分は minLength より短くてもよい
+            self._match_lengths = self._lengths_between(0, self._root.lengths) or None
+        if self._match_lengths is None:
+            self._satisfiable = not covers_all_lengths
+
+    def _lengths_between(self, min_length: int, lengths: int) -> List[int]:
+        """Returns the lengths in ``lengths`` between ``min_length`` and the maximum length.
+        """
+        return [n for n in _bits(lengths) if min_length <= n <= self._max_length_bound]
+
+    @property
+    def is_satisfiable(self) -> bool:
+        """False if no string matching the pattern has a length between min_length and max_length.
+        """
+        return self._satisfiable
+
+    @property
+    def is_exact(self) -> bool:
+        """True if the length of sampled strings is always between min_length and max_length.
+
+        It is False if the pattern contains back references and the length is limited, or if the lengths which the
+        pattern can produce are not computed since the length is too long.
+        """
+        if not self._length_is_limited:
+            return True
+        return (self._lengths is not None or self._match_lengths is not None) and not self._root.irregular
+
+    @property
+    def length_bounds(self) -> Tuple[int, int]:
+        """The minimum and maximum length of sampled strings.
+
+        If the pattern contains back references, they are the bounds of lengths which the pattern can produce without
+        the limit of length.
+        """
+        if self._lengths is not None:
+            return self._lengths[0], self._lengths[-1]
+        elif self._length_is_limited:
+            return self._min_length, self._upper
+
+        # 長さを制限しない場合は長さの集合を計算していないため、別に構築した木で計算する
+        root = _Compiler().compile(sre_parse.parse(self._pattern))
+        root.prepare(root.max_width)
+        lengths = _bits(root.lengths)
+        return (lengths[0], lengths[-1]) if len(lengths) > 0 else (0, 0)
+
+    def accepts(self, value: str) -> bool:
+        """Returns whether the length of ``value`` is between min_length and max_length.
+        """
+        return self._min_length <= len(value) and (self._max_length is None or len(value) <= self._max_length)
+
+    def sample(self, rng=random) -> str:
+        """Returns a string which matches the pattern.
+
+        Args:
+            rng: The random number generator. (``random.Random`` or module ``random``)
+
+        Returns:
+            A string which matches the pattern.
+        """
+        out: List[str] = []
+        if self._lengths is not None:
+            self._root.sample_length(rng, rng.choice(self._lengths), out, {})
+            return "".join(out)
+
+        if self._match_lengths is not None:
+            self._root.sample_length(rng, rng.choice(self._match_lengths), out, {})
+        else:
+            self._root.sample(rng, out, {})
+        generated = "".join(out)
+
+        if self._length_is_limited and len(generated) < self._min_length and \
+                not (self._anchored_at_start and self._anchored_at_end):
+            generated = self._pad(generated, rng)
+        return generated
+
+    def _pad(self, generated: str, rng) -> str:
+        """Pads a string matching the pattern with letters on the side which is not anchored.
+        """
+        padding_length = rng.randint(self._min_length, max(self._min_length, self._upper)) - len(generated)
+        for chars in (string.ascii_letters, " "):
+            padding = "".join(rng.choices(chars, k=padding_length))
+            padded = padding + generated if self._anchored_at_end else generated + padding
+
+            # 文字を加えた結果、単語境界などの指定を満たさなくなる場合は空白で試す
+            if self._regex is None:
+                self._regex = re.compile(self._pattern)
+            if self._regex.search(padded) is not None:
+                break
+        return padded
+
+
+def sample_letters(min_length: int, max_length: int, rng=random) -> str:
+    """Returns a string of ascii letters.
+
+    Args:
+        min_length: The minimum length of the string.
+        max_length: The maximum length of the string.
+        rng: The random number generator. (``random.Random`` or module ``random``)
+
+    Returns:
+        A string of ascii letters, whose length is between ``min_length`` and ``max_length``.
+    """
+    return "".join(rng.choices(string.ascii_letters, k=rng.randint(min_length, max_length)))
@@ -0,0 +1,90 @@
+"""A persistent cache of factories constructed from schema files.
+
+A factory is stored as a pickle in a cache directory, keyed by the hash of the content of the schema file and the
+version of ranjg (and Python). Since loading a pickle can execute arbitrary code, use a cache directory which only you
+can write to.
+"""
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+import ranjg
+from . import schemas
+from ._factory_cache import factory_cache, construct_factory
+from ._version import __version__
+
+
+def _cache_path(cache_dir: str, content: bytes) -> str:
+    key = hashlib.sha256(content)
+    key.update(f"\0{__version__}\0{sys.version_info[:2]}".encode("ascii"))
+    return os.path.join(cache_dir, key.hexdigest() + ".pickle")
+
+
+def load_schema_file(schema_file: str, cache_dir: str, *, validate: bool = True) -> dict:
+    """Loads a schema file and makes its factory ready in ``ranjg.factory_cache``.
+
+    If the cache directory has the factory of the same content, the schema is neither parsed, validated nor compiled
+    again. Otherwise, the schema is loaded and validated as usual and its factory is stored in the cache directory.
+
+    Args:
+        schema_file: The path to JSON schema file.
+        cache_dir: The path to the cache directory. It is created if it doesn't exist.
+        validate: If it is False, the schema is not validated. In this case, the factory is not stored in the cache
+            directory, since the cache must have only validated schemas.
+
+    Returns:
+        The schema.
+
+    Raises:
+        SchemaFileIOError:
+            When loading schema_file is failed
+        InvalidSchemaError:
+            When the schema is invalid.
+        SchemaConflictError:
+            When no value can satisfy the schema.
+    """
+    with open(schema_file, 'rb') as fp:
+        cache_path = _cache_path(cache_dir, fp.read())
+
+    try:
+        with open(cache_path, 'rb') as fp:
+            schema, factory = pickle.load(fp)
+    except Exception:
+        # キャッシュが存在しない、または壊れている場合は改めて構築する
+        schema, factory = None, None
+
+    if isinstance(factory, ranjg.Factory):
+        # キャッシュディレクトリには検証済みのスキーマのみ保存されている
+        validated = True
+    else:
+        schema = schemas.load(schema_file)
+        if validate:
+            schemas.validate(schema)
+        factory = construct_factory(schema, skips_validation=not validate)
+        if validate:
+            _store(cache_path, schema, factory)
+        validated = validate
+
+    factory_cache.put(schema, factory, validated=validated)
+    return schema
+
+
+def _store(cache_path: str, schema: dict, factory: 'ranjg.Factory') -> None:
+    # 同時に実行された他のプロセスが書き込み途中のファイルを読まないよう、一時ファイルに書いてから置き換える
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                # factory はスキーマを参照しているため、一緒に保存しても重複しない
+                pickle.dump((schema, factory), fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except Exception:
+        # キャッシュに保存できなくても生成は行える
+        pass
@@ -0,0 +1,275 @@
+"""A long-running server which generates values on request.
+
+The server keeps the factories of requested schemas in memory, so each request costs only the generation itself.
+
+A request is a JSON object such as ``{"schema": {"type": "integer"}, "n": 3, "options": {...}, "seed": 1}``, where
+only ``schema`` is required. ``n`` defaults to 1 and ``options`` has the same keys as an options file.
+
+- Over a Unix domain socket, a client sends each request as a line. For each request, the server writes a header line
+  ``{"n": <n>}`` followed by ``n`` lines of generated values, or a line ``{"error": <message>}``. A client can send
+  requests one after another on the same connection. If generation fails after the header, the server writes a line
+  ``{"error": <message>}`` instead of the rest of the values and closes the connection.
+- Over HTTP, a client POSTs a request as the body. The server responds generated values as JSON Lines with status 200,
+  or ``{"error": <message>}`` with status 400. If generation fails after the response has started, the last line of
+  the body is ``{"error": <message>}``.
+
+The first chunk of values is generated before the header or the status is written, so a request which cannot generate
+any value is responded with an error.
+"""
+import http.server
+import json
+import os
+import random
+import socketserver
+from typing import Iterator, Tuple, Callable
+
+import ranjg
+from ._factory_cache import FactoryCache, DEFAULT_FACTORY_CACHE_SIZE
+from .error import GenerateError, InvalidSchemaError, SchemaConflictError
+from .options import Options
+from .util.numutil import is_integer
+
+#: 一度に生成して書き込む値の数
+_CHUNK_SIZE = 1024
+
+#: 生成中に発生しうるエラー。これらはリクエストの誤りとして応答する
+_GENERATION_ERRORS = (GenerateError, InvalidSchemaError, SchemaConflictError)
+
+#: サーバーが保持するファクトリの数の既定値
+DEFAULT_CACHE_SIZE = DEFAULT_FACTORY_CACHE_SIZE
+
+
+class RequestError(ValueError):
+    """An error raised when a request cannot be processed.
+    """
+
+
+class GenerationService:
+    """Generates values for requests with factories cached by the hash of the schema.
+
+    Args:
+        cache_size: The maximum number of factories kept in memory.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self._factories = FactoryCache(maxsize=cache_size)
+
+    def factory(self, schema: dict) -> ranjg.Factory:
+        """Returns the factory of the schema, constructing it only if it isn't cached.
+
+        Raises:
+            InvalidSchemaError:
+                When the schema is invalid.
+            SchemaConflictError:
+                When no value can satisfy the schema.
+        """
+        return self._factories.get(schema)
+
+    def prepare(self, request) -> Tuple[int, Callable[[], Iterator[str]]]:
+        """Parses the request and prepares the generation.
+
+        Args:
+            request: The request decoded from JSON.
+
+        Returns:
+            The number of values to generate, and a function which returns an iterator of JSON Lines of the values.
+            Each item of the iterator is a chunk of lines.
+
+        Raises:
+            RequestError:
+                When the request is illegal.
+        """
+        if not isinstance(request, dict):
+            raise RequestError("The request must be a JSON object.")
+        if not isinstance(request.get('schema'), dict):
+            raise RequestError("The request must have 'schema' as an object.")
+
+        n = request.get('n', 1)
+        if isinstance(n, bool) or not (is_integer(n) and 0 <= n):
+            raise RequestError(f"Illegal 'n': {n}")
+        n = int(n)
+
+        seed = request.get('seed')
+        if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+            raise RequestError(f"Illegal 'seed': {seed}")
+
+        options = request.get('options')
+        if options is not None:
+            if not isinstance(options, dict):
+                raise RequestError("Illegal 'options': it must be an object.")
+            try:
+                options = Options(**options)
+                # 値の誤りは生成中に初めて発覚するため、応答を始める前に検証しておく
+                ranjg.options.validate(options)
+            except (TypeError, ValueError) as e:
+                raise RequestError(f"Illegal 'options': {e}") from e
+
+        try:
+            factory = self.factory(request['schema'])
+        except (InvalidSchemaError, SchemaConflictError) as e:
+            raise RequestError(str(e)) from e
+
+        # options 内のスキーマは生成中に使用されるため、応答を始める前に検証しておく
+        if options is not None:
+            self._validate_option_schemas(options)
+
+        rng = random.Random(seed) if seed is not None else random
+
+        def generate_lines() -> Iterator[str]:
+            for start in range(0, n, _CHUNK_SIZE):
+                values = factory.gen_many(min(_CHUNK_SIZE, n - start), options=options, rng=rng)
+                yield ''.join(json.dumps(value) + '\n' for value in values)
+
+        return n, generate_lines
+
+    def _validate_option_schemas(self, options: Options) -> None:
+        """Validates the schemas in the options by constructing their factories.
+
+        Raises:
+            RequestError:
+                When a schema in the options is illegal.
+        """
+        if not isinstance(options.priority_schema_of_properties, dict):
+            raise RequestError("Illegal 'options': priority_schema_of_properties must be an object.")
+
+        option_schemas = [('default_schema_of_properties', options.default_schema_of_properties),
+                          ('default_schema_of_items', options.default_schema_of_items)]
+        option_schemas.extend((f'priority_schema_of_properties.{key}', schema)
+                              for key, schema in options.priority_schema_of_properties.items())
+        for name, schema in option_schemas:
+            if not isinstance(schema, dict):
+                raise RequestError(f"Illegal 'options': {name} must be an object.")
+            try:
+                self.factory(schema)
+            except (InvalidSchemaError, SchemaConflictError) as e:
+                raise RequestError(f"Illegal 'options': {name}: {e}") from e
+
+
+class _UnixRequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                n, generate_lines = self.server.service.prepare(json.loads(line.decode('utf-8')))
+                chunks = generate_lines()
+                first_chunk = next(chunks, '')
+            except (ValueError, *_GENERATION_ERRORS) as e:
+                # RequestError のほか、JSON として読み込めない場合や最初の値を生成できない場合も含む
+                self._write(json.dumps({'error': str(e)}) + '\n')
+                continue
+
+            self._write(json.dumps({'n': n}) + '\n')
+            try:
+                self._write(first_chunk)
+                for lines in chunks:
+                    self._write(lines)
+            except OSError:
+                # クライアントが接続を閉じた場合
+                return
+            except Exception as e:
+                # ヘッダーで通知した数の値を書き込めないため、エラーを書き込んだうえで接続を閉じる
+                self._write(json.dumps({'error': str(e)}) + '\n')
+                return
+
+    def _write(self, text: str):
+        self.wfile.write(text.encode('utf-8'))
+        self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, service: GenerationService):
+        super().__init__(path, _UnixRequestHandler)
+        self.service = service
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+class _HTTPRequestHandler(http.server.BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        try:
+            _, generate_lines = self.server.service.prepare(json.loads(body.decode('utf-8')))
+            # 最初の値を生成できない場合もエラーとして応答できるよう、ステータスを書き込む前に生成する
+            chunks = generate_lines()
+            first_chunk = next(chunks, '')
+        except (ValueError, *_GENERATION_ERRORS) as e:
+            # RequestError のほか、JSON として読み込めない場合も含む
+            self._send_error(400, str(e))
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+        # HTTP/1.0 で応答するため、接続が閉じられることで応答の終わりを知らせる。
+        # 生成が途中で失敗した場合は、それまでに生成した値に続けてエラーを書き込み、途中で終わったことを知らせる。
+        try:
+            self._write(first_chunk)
+            for lines in chunks:
+                self._write(lines)
+        except OSError:
+            # クライアントが接続を閉じた場合
+            return
+        except Exception as e:
+            self._write(json.dumps({'error': str(e)}) + '\n')
+
+    def _write(self, text: str):
+        self.wfile.write(text.encode('utf-8'))
+        self.wfile.flush()
+
+    def _send_error(self, code: int, message: str):
+        body = (json.dumps({'error': message}) + '\n').encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # リクエストごとのログは出力しない
+        pass
+
+
+class _HTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], service: GenerationService):
+        super().__init__(address, _HTTPRequestHandler)
+        self.service = service
+
+
+def make_unix_server(path: str, service: GenerationService) -> socketserver.BaseServer:
+    """Creates a server which listens on a Unix domain socket.
+
+    The socket file is removed when the server is closed.
+
+    Args:
+        path: The path of the socket.
+        service: The service which processes requests.
+
+    Returns:
+        The server. Call ``serve_forever()`` to start it.
+    """
+    return _UnixServer(path, service)
+
+
+def make_http_server(host: str, port: int, service: GenerationService) -> socketserver.BaseServer:
+    """Creates a server which listens on HTTP.
+
+    Args:
+        host: The host name or address to listen on.
+        port: The port to listen on. If it is 0, an unused port is assigned.
+        service: The service which processes requests.
+
+    Returns:
+        The server. Call ``serve_forever()`` to start it.
+    """
+    return _HTTPServer((host, port), service)
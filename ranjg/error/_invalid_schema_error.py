@@ -3,9 +3,11 @@
 A module that provides the schema error class ``InvalidSchemaError`` to __init__.
 """
 import os
-from typing import List, Iterable, Union, Iterator
+from typing import List, Iterable, Union, Iterator, TYPE_CHECKING
 
-from jsonschema import ValidationError
+if TYPE_CHECKING:
+    # jsonschema の import には時間がかかるため、型検査時のみ import する
+    from jsonschema import ValidationError
 
 
 _INDENT_UNIT_LENGTH = 4
@@ -47,7 +49,7 @@ class InvalidSchemaError(Exception):
     """
 
     def __init__(self,
-                 validation_error_list: List[ValidationError]):
+                 validation_error_list: List['ValidationError']):
         """Initialize InvalidSchemaError
 
         Args:
@@ -75,7 +77,7 @@ class ValidationErrorWrapper:
     """
 
     @property
-    def base_error(self) -> ValidationError:
+    def base_error(self) -> 'ValidationError':
         """The ValidationError
         """
         return self.__base_error
@@ -86,7 +88,7 @@ class ValidationErrorWrapper:
         """
         return map(lambda e: ValidationErrorWrapper(e), self.base_error.context)
 
-    def __init__(self, base_error: ValidationError):
+    def __init__(self, base_error: 'ValidationError'):
         self.__base_error = base_error
 
     def make_message(self, indent: int = _INDENT_UNIT_LENGTH) -> List[str]:
@@ -0,0 +1,79 @@
+"""Explanation of the factory tree resolved for a schema and options.
+
+Examples:
+    >>> import ranjg
+    >>> schema = {'type': 'object', 'required': ['orders'],
+    ...           'properties': {'orders': {'type': 'array', 'items': {'type': 'string', 'maxLength': 8}}}}
+    >>> print(ranjg.Factory(schema).explain())
+"""
+from typing import List, Optional
+
+
+class ExplainNode:
+    """A node of the factory tree, which generates values at a path.
+    """
+    __slots__ = ('path', 'factory_class', 'details', 'count', 'cost', 'depth')
+
+    def __init__(self, path: str, factory_class: str, details: str, count: float, cost: float, depth: int):
+        #: The path in the style of ``$.orders[].items[].sku``.
+        self.path = path
+        #: The name of the concrete class of the factory.
+        self.factory_class = factory_class
+        #: The parameters resolved from the schema and the options, such as bounds of numbers.
+        self.details = details
+        #: The expected number of values generated at the node per root value.
+        self.count = count
+        #: The estimated cost of generating the values at the node, including their child elements, per root value.
+        self.cost = cost
+        #: The depth of the node in the tree. The depth of the root is 0.
+        self.depth = depth
+
+
+class Explanation:
+    """The factory tree returned by ``Factory#explain``.
+
+    The cost is estimated as the number of generated values and random numbers drawn, so it is not a time but a unit
+    to compare parts of a schema, or schemas, with each other. Rejection sampling and copies of ``enum`` values are not
+    included in the estimation; see ``Factory#stats`` for them.
+    """
+
+    def __init__(self, nodes: List[ExplainNode]):
+        self._nodes = nodes
+
+    def nodes(self) -> List[ExplainNode]:
+        """Returns the nodes of the tree in depth-first order. The first node is the root.
+        """
+        return list(self._nodes)
+
+    def __getitem__(self, path: str) -> ExplainNode:
+        # 同じパスのノードが複数ある場合 (type が複数ある場合など) は最初のノードを返す
+        for node in self._nodes:
+            if node.path == path:
+                return node
+        raise KeyError(path)
+
+    @property
+    def cost(self) -> float:
+        """The estimated cost of generating a root value.
+        """
+        return self._nodes[0].cost
+
+    def report(self, limit_depth: Optional[int] = None) -> str:
+        """Returns the tree as a human readable table.
+
+        Args:
+            limit_depth: If specified, the nodes deeper than it are not reported.
+        """
+        lines = [f"{'count':>10} {'cost':>10}  factory"]
+        for node in self._nodes:
+            if limit_depth is not None and node.depth > limit_depth:
+                continue
+            line = f"{node.count:>10.4g} {node.cost:>10.4g}  {'  ' * node.depth}{node.path} {node.factory_class}"
+            if node.details:
+                line += f" ({node.details})"
+            lines.append(line)
+        lines.append(f"(estimated cost per root value: {self.cost:.4g})")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
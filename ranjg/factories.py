@@ -21,14 +21,15 @@ Examples:
     See also :doc:`ranjg-options` to know about options.
 """
 import abc
+import array
 import collections
 import copy
+import functools
+import itertools
 import math
 import random
-import re
-import string
 import sys
-from typing import TypeVar, Generic, Optional, Union, Iterable, Tuple, Sequence, Dict, Any, List, Type
+from typing import TypeVar, Generic, Optional, Union, Iterable, Tuple, Sequence, Dict, Any, List, Type, Callable
 
 try:
     from typing import GenericMeta  # python 3.6
@@ -37,19 +38,30 @@ except ImportError:
     class GenericMeta(type):
         pass
 
-import jsonschema
-import rstr
-
 import ranjg
 from . import schemas
+from . import profiling
 from ._number_range import NumberRange
+from ._numpy import load_numpy, numpy_rng, INT64_MIN, INT64_MAX
+from ._regex import PatternSampler, EmptyCharacterSetError, sample_letters
+from .stats import FactoryStats, GenerationStats
+from .explain import ExplainNode, Explanation
 from .error import SchemaConflictError, GenerateError, GenerateConflictError
 from .schemas.normalize import normalize_exclusive_maximum, normalize_exclusive_minimum
 from .options import Options
 from ._context import GenerationContext, SchemaContext
+from .util.cacheutil import LRUCache
 from .util.listutil import fix_length
+from .util.seedutil import derive_seed
 
 _T = TypeVar('_T')
+_V = TypeVar('_V')
+
+#: Options ごとに導出した値を保持する数の上限 (Factory ごと)
+_OPTIONS_CACHE_SIZE = 8
+
+#: random.choices で一様に選ぶことができるとみなす母集団の大きさの上限
+_CHOICES_POPULATION_LIMIT = 2 ** 32
 
 
 class MetaFactory(GenericMeta, abc.ABCMeta):
@@ -90,6 +102,13 @@ class Factory(abc.ABC, Generic[_T], metaclass=MetaFactory):
     _schema: dict
     #: True であれば、_schema 全体が (子要素のスキーマも含め) validated。
     _schema_is_validated: bool = False
+    #: True であれば、スキーマの検証が省略されている。options から導出するファクトリのスキーマも検証せず、
+    #: enum の値の判定にも jsonschema を使用しない。
+    _skips_validation: bool = False
+    #: Options から導出した値のキャッシュ。キーは id(options) で、値は (options, {key: 導出した値})。
+    _options_cache: LRUCache
+    #: 生成時の統計
+    _stats: FactoryStats
 
     def __new__(cls, schema: Optional[dict], *,
                 schema_is_validated: bool = False,
@@ -110,9 +129,31 @@ class Factory(abc.ABC, Generic[_T], metaclass=MetaFactory):
                  gen_type: Union[str, None] = None):
         self._schema = schema if schema is not None else {}
         self._schema_is_validated = schema_is_validated
+        # 子要素のファクトリは親が検証した後に構築されるため、検証を省略したか否かは context から引き継ぐ
+        self._skips_validation = schema_is_validated and (context is None or context.skips_validation)
+        self._options_cache = LRUCache(maxsize=_OPTIONS_CACHE_SIZE)
+        self._stats = FactoryStats()
 
         self.validate_schema()
 
+    def __getnewargs__(self):
+        # pickle から復元する際に __new__ へ渡す引数
+        return self._schema,
+
+    def __getstate__(self) -> dict:
+        # Options から導出した値は id(options) をキーとしているため、復元先では使用できない。
+        # また、キャッシュはロックを持つため pickle できない。
+        # 統計は復元先での生成のみを数えるため、引き継がない。
+        state = self.__dict__.copy()
+        del state['_options_cache']
+        del state['_stats']
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._options_cache = LRUCache(maxsize=_OPTIONS_CACHE_SIZE)
+        self._stats = FactoryStats()
+
     @classmethod
     def _decide_concrete(cls,
                          gen_type: Union[str, Iterable[str], None],
@@ -141,7 +182,8 @@ class Factory(abc.ABC, Generic[_T], metaclass=MetaFactory):
     def gen(self,
             *,
             options: Optional[Options] = None,
-            context: Optional[GenerationContext] = None) -> _T:
+            context: Optional[GenerationContext] = None,
+            rng: Optional[random.Random] = None) -> _T:
         """Generate value according to the schema specified for the factory construction.
 
         Args:
@@ -150,6 +192,8 @@ class Factory(abc.ABC, Generic[_T], metaclass=MetaFactory):
             context (GenerationContext, optional):
                 The context of generation.
                 (In normal usage, this argument is not specified. This argument is for using this function recursively.)
+            rng (random.Random, optional):
+                The random number generator. If it is not specified, the module ``random`` is used.
 
         Returns:
             Generated something.
@@ -176,11 +220,159 @@ class Factory(abc.ABC, Generic[_T], metaclass=MetaFactory):
             schemas.validate(self._schema)
             self._schema_is_validated = True
 
+    def _derive_from_options(self, options: Options, key: Any, derive: Callable[[], _V]) -> _V:
+        """Returns a value derived from the options.
+
+        The value is derived only once for each pair of the factory and the options, and cached.
+        Since options are identified by their identity, options should not be modified after they are used.
+
+        Args:
+            options: The options for generation.
+            key: The key which identifies the value among values derived from the same options.
+            derive: A function which derives the value from the options.
+
+        Returns:
+            The value derived from the options.
+        """
+        entry = self._options_cache.get(id(options))
+
+        # id は options が破棄された後で再利用されうるため、同一のオブジェクトであることを確認する
+        if entry is None or entry[0] is not options:
+            entry = (options, {})
+            self._options_cache.put(id(options), entry)
+
+        derived_values = entry[1]
+        if key not in derived_values:
+            derived_values[key] = derive()
+
+        return derived_values[key]
+
+    def _factories_from_options(self) -> Iterable[Tuple[Any, 'Factory']]:
+        """Returns the factories derived from options by ``_derive_from_options`` and still cached.
+
+        Returns:
+            Pairs of the key of the derived factory and the factory.
+        """
+        for options, derived_values in self._options_cache.values():
+            for key, value in derived_values.items():
+                if isinstance(value, Factory):
+                    yield key, value
+
+    def _child_factories(self) -> Iterable[Tuple[str, 'Factory']]:
+        """Returns the factories of child elements, including factories derived from options.
+
+        Subclasses which have child elements override it.
+
+        Returns:
+            Pairs of the path of the child element relative to this element, such as ``.key`` or ``[]``, and its
+            factory.
+        """
+        return ()
+
+    def stats(self) -> GenerationStats:
+        """Returns the statistics of generation by the factory and the factories of its child elements.
+
+        The statistics count rejected values, fallbacks to factories derived from options and copies of ``enum`` values
+        since the factory was constructed, for each path in generated values.
+
+        Examples:
+            >>> import ranjg
+            >>> factory = ranjg.Factory({'type': 'object', 'required': ['p1']})
+            >>> generated = factory.gen()
+            >>> factory.stats()['$'].fallbacks
+            1
+
+        Returns:
+            The statistics of generation.
+        """
+        return GenerationStats(self._walk_stats('$'))
+
+    def _walk_stats(self, path: str) -> Iterable[Tuple[str, FactoryStats]]:
+        yield path, self._stats
+        for child_path, child_factory in self._child_factories():
+            yield from child_factory._walk_stats(path + child_path)
+
+    def explain(self, *, options: Optional[Options] = None) -> Explanation:
+        """Returns the tree of factories which generate values, resolved with the options.
+
+        Each node of the tree shows the concrete class of the factory, the parameters resolved from the schema and the
+        options (such as bounds of numbers, lengths of strings and lists, and probabilities of optional properties),
+        the expected number of values generated at the node per root value, and the estimated cost per root value.
+
+        Examples:
+            >>> import ranjg
+            >>> factory = ranjg.Factory({'type': 'array', 'items': {'type': 'integer', 'minimum': 0}})
+            >>> print(factory.explain())
+                 count       cost  factory
+                     1          8  $ ListFactory (items=[1, 5])
+                     3          6    $[] IntFactory (range=[0, 5])
+            (estimated cost per root value: 8)
+
+        Args:
+            options (Options, optional):
+                The options for generation.
+
+        Returns:
+            The tree of factories.
+        """
+        if options is None:
+            options = Options.default()
+
+        nodes: List[ExplainNode] = []
+        self._explain_node('$', '', 1.0, 0, options, nodes)
+        return Explanation(nodes)
+
+    def _explain_node(self, path: str, origin: str, count: float, depth: int, options: Options,
+                      nodes: List[ExplainNode]) -> ExplainNode:
+        try:
+            details, cost_per_value = self._describe(options)
+        except GenerateError as e:
+            details, cost_per_value = f"error: {e}", 0.0
+        if origin:
+            details = f"{origin}, {details}" if details else origin
+
+        node = ExplainNode(path, self.__class__.__name__, details, count, count * cost_per_value, depth)
+        nodes.append(node)
+        for child_path, child_factory, child_count, child_origin in self._explain_children(options):
+            child_node = child_factory._explain_node(path + child_path, child_origin, count * child_count, depth + 1,
+                                                     options, nodes)
+            node.cost += child_node.cost
+        return node
+
+    def _describe(self, options: Options) -> Tuple[str, float]:
+        """Describes the parameters of generation resolved with the options.
+
+        Subclasses override it.
+
+        Args:
+            options: The options for generation.
+
+        Returns:
+            The description of the parameters, and the estimated cost to generate a value except its child elements.
+        """
+        return '', 1.0
+
+    def _explain_children(self, options: Options) -> Iterable[Tuple[str, 'Factory', float, str]]:
+        """Returns the factories of child elements resolved with the options.
+
+        Subclasses which have child elements override it.
+
+        Args:
+            options: The options for generation.
+
+        Returns:
+            Tuples of the path of the child element relative to this element, its factory, the expected number of child
+            elements per value of this element, and the name of the options which the factory is derived from (or an
+            empty string).
+        """
+        return ()
+
     def gen_as_child(self, *,
                      # 入力漏れを防ぐため、引数にデフォルト値は設定しない。
                      options: Options,
                      parent_context: GenerationContext,
-                     child_key: Union[str, int]) -> _T:
+                     child_key: Union[str, int],
+                     rng: random.Random) -> _T:
         """Generate value as another dict or list.
 
         It is wrapper of ``Factory#gen`` for ranjg development since it is called in ``ListFactory#gen`` etc..
@@ -202,12 +394,246 @@ class Factory(abc.ABC, Generic[_T], metaclass=MetaFactory):
             child_key (str|int):
                 The path to the generated element from the parent element.
                 If the parent element is a dict, it is a string; if it is a list, it is an integer.
+            rng (random.Random):
+                The random number generator.
+                Usually, the generator used to generate the parent element is specified as is.
 
         Returns:
             Generated something.
         """
-        return self.gen(options=options,
-                        context=parent_context.resolve(child_key, self._schema))
+        context = parent_context.resolve(child_key, self._schema)
+        if profiling.active_profiler() is not None:
+            return profiling.profiled_gen(self, options, context, rng)
+
+        return self.gen(options=options, context=context, rng=rng)
+
+    def gen_at(self,
+               index: int,
+               *,
+               seed: int,
+               options: Optional[Options] = None,
+               context: Optional[GenerationContext] = None) -> _T:
+        """Generate the ``index``-th value of the sequence determined by ``seed``.
+
+        Each value is generated with a random number generator seeded by a seed derived from ``seed`` and ``index``,
+        so any value can be regenerated without generating the values before it.
+
+        Examples:
+            >>> import ranjg
+            >>> factory = ranjg.Factory({'type': 'string'})
+            >>> factory.gen_at(1000000, seed=42) == factory.gen_at(1000000, seed=42)
+            True
+
+        Args:
+            index (int):
+                The index of the value.
+            seed (int):
+                The seed of the sequence.
+            options (Options, optional):
+                The options for generation.
+            context (GenerationContext, optional):
+                The context of generation.
+                (In normal usage, this argument is not specified.)
+
+        Returns:
+            Generated something.
+
+        Raises:
+            GenerateError:
+                If an unforeseen error arises.
+        """
+        if index < 0:
+            raise ValueError(f"index must be non-negative: {index}")
+
+        return self.gen(options=options, context=context, rng=random.Random(derive_seed(seed, index)))
+
+    def compile(self,
+                *,
+                options: Optional[Options] = None,
+                context: Optional[GenerationContext] = None,
+                rng: Optional[random.Random] = None) -> Callable[[], _T]:
+        """Compile the factory into a function which generates values.
+
+        All lookups of options, default values and child factories are resolved once here, so calling the returned
+        function is equivalent to calling ``gen`` with the same arguments but costs less.
+        It is recommended when a lot of values are generated with the same options.
+
+        Examples:
+            >>> import ranjg
+            >>> factory = ranjg.Factory({'type': 'array', 'items': {'type': 'integer'}})
+            >>> generate = factory.compile()
+            >>> generated_list = [generate() for _ in range(10000)]
+
+        Args:
+            options (Options, optional):
+                The options for generation.
+            context (GenerationContext, optional):
+                The context of generation.
+                (In normal usage, this argument is not specified.)
+            rng (random.Random, optional):
+                The random number generator. If it is not specified, the module ``random`` is used.
+
+        Returns:
+            A function without arguments which returns a generated value each time it is called.
+
+        Raises:
+            GenerateError:
+                When the options cannot be used to generate values with the schema.
+        """
+        if options is None:
+            options = Options.default()
+        if context is None:
+            context = GenerationContext.root(self._schema)
+        if rng is None:
+            rng = random
+
+        generate = self._compile(options, context, rng)
+        if profiling.active_profiler() is not None:
+            return profiling.profiled(context, generate)
+
+        return generate
+
+    def _compile(self, options: Options, context: GenerationContext, rng: random.Random) -> Callable[[], _T]:
+        """Compile the factory into a function which generates values.
+
+        Subclasses override it to resolve options and child factories in advance.
+
+        Args:
+            options: The options for generation.
+            context: The context of generation.
+            rng: The random number generator.
+
+        Returns:
+            A function without arguments which returns a generated value each time it is called.
+        """
+        return functools.partial(self.gen, options=options, context=context, rng=rng)
+
+    def gen_many(self,
+                 n: int,
+                 *,
+                 options: Optional[Options] = None,
+                 context: Optional[GenerationContext] = None,
+                 rng: Optional[random.Random] = None) -> List[_T]:
+        """Generate values according to the schema specified for the factory construction.
+
+        It returns the same as ``[factory.gen(options=options) for _ in range(n)]``, but costs less since each factory
+        generates values with a loop specialized for its type.
+
+        Examples:
+            >>> import ranjg
+            >>> factory = ranjg.Factory({'type': 'integer', 'minimum': 0, 'maximum': 9})
+            >>> generated_list = factory.gen_many(10000)  # -> A list of 10000 integers
+
+        Args:
+            n (int):
+                The number of values to generate.
+            options (Options, optional):
+                The options for generation.
+            context (GenerationContext, optional):
+                The context of generation.
+                (In normal usage, this argument is not specified.)
+            rng (random.Random, optional):
+                The random number generator. If it is not specified, the module ``random`` is used.
+
+        Returns:
+            A list of generated values.
+
+        Raises:
+            GenerateError:
+                If an unforeseen error arises.
+        """
+        if n < 0:
+            raise ValueError(f"n must be non-negative: {n}")
+        if options is None:
+            options = Options.default()
+        if context is None:
+            context = GenerationContext.root(self._schema)
+        if rng is None:
+            rng = random
+
+        if profiling.active_profiler() is not None:
+            return profiling.profiled_gen_many(self, n, options, context, rng)
+
+        return self._gen_many(n, options, context, rng)
+
+    def _gen_many(self, n: int, options: Options, context: GenerationContext, rng: random.Random) -> List[_T]:
+        """Generate values according to the schema specified for the factory construction.
+
+        Subclasses override it with a loop specialized for their type.
+
+        Args:
+            n: The number of values to generate.
+            options: The options for generation.
+            context: The context of generation.
+            rng: The random number generator.
+
+        Returns:
+            A list of generated values.
+        """
+        generate = self._compile(options, context, rng)
+        return [generate() for _ in range(n)]
+
+    def _compile_as_child(self, *,
+                          options: Options,
+                          parent_context: GenerationContext,
+                          child_key: Union[str, int],
+                          rng: random.Random) -> Callable[[], _T]:
+        """Compile the factory as another dict or list.
+
+        It is the counterpart of ``gen_as_child`` for ``_compile``.
+        """
+        return _compile_child(self, options, parent_context.resolve(child_key, self._schema), rng)
+
+
+def _compile_child(factory: Factory, options: Options, context: GenerationContext, rng: random.Random) -> Callable:
+    """Compile a factory of child elements.
+
+    If the compilation fails, the returned function raises the error when it is called, in the same way as
+    ``Factory#gen`` raises it when the child element is generated.
+
+    Args:
+        factory: A factory of child elements.
+        options: The options for generation.
+        context: The context of generation of the child element.
+        rng: The random number generator.
+
+    Returns:
+        A function without arguments which returns a generated value each time it is called.
+    """
+    try:
+        generate = factory._compile(options, context, rng)
+    except GenerateError as e:
+        error_class, message, error_context = e.__class__, str(e), e.context
+
+        def raise_error():
+            raise error_class(message, error_context)
+
+        return raise_error
+
+    if profiling.active_profiler() is not None:
+        return profiling.profiled(context, generate)
+
+    return generate
+
+
+def _gen_many_child(factory: Factory, n: int, options: Options, context: GenerationContext,
+                    rng: random.Random) -> list:
+    """Generate child elements with ``factory._gen_many``, recording them with the active profiler if any.
+
+    Args:
+        factory: A factory of child elements.
+        n: The number of child elements to generate.
+        options: The options for generation.
+        context: The context of generation of the child elements.
+        rng: The random number generator.
+
+    Returns:
+        A list of generated values.
+    """
+    if profiling.active_profiler() is not None:
+        return profiling.profiled_gen_many(factory, n, options, context, rng)
+
+    return factory._gen_many(n, options, context, rng)
 
 
 class NoneFactory(Factory[None]):
@@ -219,9 +645,20 @@ class NoneFactory(Factory[None]):
     def gen(self,
             *,
             options: Optional[Options] = None,
-            context: Optional[GenerationContext] = None) -> None:
+            context: Optional[GenerationContext] = None,
+            rng: Optional[random.Random] = None) -> None:
         return None
 
+    def _compile(self, options: Options, context: GenerationContext, rng: random.Random) -> Callable[[], None]:
+        return _gen_none
+
+    def _gen_many(self, n: int, options: Options, context: GenerationContext, rng: random.Random) -> List[None]:
+        return [None] * n
+
+
+def _gen_none() -> None:
+    return None
+
 
 class BoolFactory(Factory[bool]):
 
@@ -232,11 +669,49 @@ class BoolFactory(Factory[bool]):
     def gen(self,
             *,
             options: Optional[Options] = None,
-            context: Optional[GenerationContext] = None) -> bool:
+            context: Optional[GenerationContext] = None,
+            rng: Optional[random.Random] = None) -> bool:
         if options is None:
             options = Options.default()
+        if rng is None:
+            rng = random
+
+        return rng.random() < options.default_prob_of_true_given_bool
+
+    def _describe(self, options: Options) -> Tuple[str, float]:
+        return f"prob_of_true={options.default_prob_of_true_given_bool}", 2.0
+
+    def _compile(self, options: Options, context: GenerationContext, rng: random.Random) -> Callable[[], bool]:
+        prob_of_true = options.default_prob_of_true_given_bool
+        rand = rng.random
+
+        def gen_bool() -> bool:
+            return rand() < prob_of_true
+
+        return gen_bool
+
+    def _gen_many(self, n: int, options: Options, context: GenerationContext, rng: random.Random) -> List[bool]:
+        return _gen_bools(n, options.default_prob_of_true_given_bool, options, rng)
 
-        return random.random() < options.default_prob_of_true_given_bool
+
+def _gen_bools(n: int, prob_of_true: float, options: Options, rng: random.Random) -> List[bool]:
+    """Generate booleans each of which is True with the specified probability.
+
+    Args:
+        n: The number of booleans to generate.
+        prob_of_true: The probability that each boolean is True.
+        options: The options of the generation, which specify whether NumPy is used.
+        rng: The random number generator.
+
+    Returns:
+        A list of generated booleans.
+    """
+    np_rng = numpy_rng(n, options, rng)
+    if np_rng is not None:
+        return (np_rng.random(n) < prob_of_true).tolist()
+
+    rand = rng.random
+    return [rand() < prob_of_true for _ in range(n)]
 
 
 class IntFactory(Factory[int]):
@@ -248,7 +723,7 @@ class IntFactory(Factory[int]):
         super(IntFactory, self).__init__(schema, schema_is_validated=schema_is_validated, context=context)
 
         if context is None:
-            context = SchemaContext.root(self._schema)
+            context = SchemaContext.root(self._schema, skips_validation=self._skips_validation)
 
         # Convert float or exclusive value in schema to integer inclusive value.
         self._schema_minimum = _get_inclusive_integer_minimum(self._schema)
@@ -261,10 +736,35 @@ class IntFactory(Factory[int]):
     def gen(self,
             *,
             options: Optional[Options] = None,
-            context: Optional[GenerationContext] = None) -> int:
+            context: Optional[GenerationContext] = None,
+            rng: Optional[random.Random] = None) -> int:
+        if rng is None:
+            rng = random
+
+        minimum, maximum = _apply_default_int(self._schema_minimum, self._schema_maximum)
+        return rng.randint(minimum, maximum)
+
+    def _describe(self, options: Options) -> Tuple[str, float]:
+        minimum, maximum = _apply_default_int(self._schema_minimum, self._schema_maximum)
+        return f"range=[{minimum}, {maximum}]", 2.0
 
+    def _compile(self, options: Options, context: GenerationContext, rng: random.Random) -> Callable[[], int]:
         minimum, maximum = _apply_default_int(self._schema_minimum, self._schema_maximum)
-        return random.randint(minimum, maximum)
+        return functools.partial(rng.randint, minimum, maximum)
+
+    def _gen_many(self, n: int, options: Options, context: GenerationContext, rng: random.Random) -> List[int]:
+        minimum, maximum = _apply_default_int(self._schema_minimum, self._schema_maximum)
+
+        np_rng = numpy_rng(n, options, rng)
+        if np_rng is not None and INT64_MIN <= minimum and maximum <= INT64_MAX:
+            return np_rng.integers(minimum, maximum, size=n, endpoint=True).tolist()
+
+        # random.choices は浮動小数点数で要素を選ぶため、範囲が十分に狭い場合に限って使用する
+        if maximum - minimum < _CHOICES_POPULATION_LIMIT:
+            return rng.choices(range(minimum, maximum + 1), k=n)
+        else:
+            randint = rng.randint
+            return [randint(minimum, maximum) for _ in range(n)]
 
 
 def _get_inclusive_integer_minimum(schema: dict) -> Optional[int]:
@@ -500,118 +1000,228 @@ def _little_less(number: float) -> float:
 
 class NumFactory(Factory[float]):
     _number_range: NumberRange
+    _inclusive_minimum: float
+    _inclusive_maximum: float
 
     def __init__(self, schema: Optional[dict], *,
                  schema_is_validated: bool = False, context: Optional[SchemaContext] = None):
         super(NumFactory, self).__init__(schema, schema_is_validated=schema_is_validated, context=context)
 
         if context is None:
-            context = SchemaContext.root(self._schema)
+            context = SchemaContext.root(self._schema, skips_validation=self._skips_validation)
 
         # 生成する数値の範囲
         number_range = NumberRange.from_schema(self._schema)
         _check_consistency(number_range, context)
         self._number_range = _apply_default(number_range)
 
+        # 境界値を許容しない Schema であっても再生成せずに済むよう、範囲を両端を含む区間に変換しておく
+        self._inclusive_minimum, self._inclusive_maximum = self._number_range.to_inclusive_float()
+        if self._inclusive_minimum > self._inclusive_maximum:
+            raise SchemaConflictError("There are no numbers in the range specified by the schema.", context)
+
     def gen(self,
             *,
             options: Optional[Options] = None,
-            context: Optional[GenerationContext] = None) -> float:
-        if options is None:
-            options = Options.default()
+            context: Optional[GenerationContext] = None,
+            rng: Optional[random.Random] = None) -> float:
         if context is None:
             context = GenerationContext.root(self._schema)
+        if rng is None:
+            rng = random
 
-        # 境界値を許容しない Schema であっても、境界値を含む乱数生成を行うため、
-        # Schema に合致する値を引くまで生成を繰り返す。
-        for i in range(options.regeneration_attempt_limit):
-            generated = random.uniform(self._number_range.minimum, self._number_range.maximum)
+        minimum, maximum = self._inclusive_minimum, self._inclusive_maximum
+        if not math.isfinite(maximum - minimum):
+            raise GenerateError("Error by too large or too small maximum or minimum", context)
 
-            if generated == float("inf") or generated == float("-inf") or generated == float("NaN"):
-                raise GenerateError("Error by too large or too small maximum or minimum", context)
+        # 丸め誤差により区間の外の値が生成される場合に備え、区間内に収める
+        return min(max(rng.uniform(minimum, maximum), minimum), maximum)
+
+    def _describe(self, options: Options) -> Tuple[str, float]:
+        return f"range=[{self._inclusive_minimum!r}, {self._inclusive_maximum!r}]", 2.0
+
+    def _compile(self, options: Options, context: GenerationContext, rng: random.Random) -> Callable[[], float]:
+        minimum, maximum = self._inclusive_minimum, self._inclusive_maximum
+        uniform = rng.uniform
 
-            if generated in self._number_range:
-                break
+        if not math.isfinite(maximum - minimum):
+            def gen_num() -> float:
+                raise GenerateError("Error by too large or too small maximum or minimum", context)
         else:
-            raise GenerateError("No valid value generated on loop.", context)
+            def gen_num() -> float:
+                return min(max(uniform(minimum, maximum), minimum), maximum)
 
-        return generated
+        return gen_num
+
+    def _gen_many(self, n: int, options: Options, context: GenerationContext, rng: random.Random) -> List[float]:
+        np_rng = numpy_rng(n, options, rng)
+        if np_rng is None:
+            return super(NumFactory, self)._gen_many(n, options, context, rng)
+
+        minimum, maximum = self._inclusive_minimum, self._inclusive_maximum
+        if not math.isfinite(maximum - minimum):
+            raise GenerateError("Error by too large or too small maximum or minimum", context)
+
+        return load_numpy().clip(np_rng.uniform(minimum, maximum, size=n), minimum, maximum).tolist()
 
 
-def _normalize_schema(schema: dict, options: Options, context: GenerationContext) -> dict:
-    """Schema normalization.
+def _get_length_range(schema: dict, options: Options, context: GenerationContext) -> Tuple[int, int]:
+    """Determine the range of the length of the string to be generated with the schema.
 
-    To make it easier to use for randomly generation, set items to ``schema`` object.
+    If each of them are not specified in the schema, the options are used instead.
 
     Args:
         schema: JSON schema for randomly generation.
+        options: The options for generation.
+        context: The context of generation.
 
     Returns:
-        New schema based on ``schema`` and the default values.
+        The minimum and maximum length of the string to be generated.
+
+    Raises:
+        GenerateConflictError: If the options have inconsistencies.
     """
-    n_schema = schema.copy()
-    n_schema.setdefault("pattern", None)
+    min_length = schema.get("minLength")
+    max_length = schema.get("maxLength")
 
     # minLength と maxLength がともに指定されていない場合、デフォルト設定を使う
-    if "minLength" not in n_schema and "maxLength" not in n_schema:
-        n_schema["minLength"] = max(0, options.default_min_length_of_string)
-        n_schema["maxLength"] = options.default_max_length_of_string
+    if min_length is None and max_length is None:
+        min_length = max(0, options.default_min_length_of_string)
+        max_length = options.default_max_length_of_string
 
-        if n_schema["minLength"] > n_schema["maxLength"]:
+        if min_length > max_length:
             raise GenerateConflictError("\"options.default_min_length_of_string\" must be lower than or equal to the "
                                         "\"options.default_max_length_of_string\" value.", context)
     # minLength が設定されていて maxLength が指定されていない場合
-    elif "maxLength" not in n_schema:
+    elif max_length is None:
         length_range = max(0, options.default_length_range_of_genstr)
-        n_schema["maxLength"] = n_schema["minLength"] + length_range
+        max_length = min_length + length_range
     # maxLength が設定されていて minLength が指定されていない場合
-    elif "minLength" not in n_schema:
+    elif min_length is None:
         length_range = max(0, options.default_length_range_of_genstr)
-        n_schema["minLength"] = max(0, n_schema["maxLength"] - length_range)
+        min_length = max(0, max_length - length_range)
 
-    return n_schema
+    return min_length, max_length
 
 
 class StrFactory(Factory[str]):
     _schema: dict
+    _pattern_sampler: Optional[PatternSampler]
 
     def __init__(self, schema: Optional[dict], *,
                  schema_is_validated: bool = False, context: Optional[SchemaContext] = None):
         super(StrFactory, self).__init__(schema, schema_is_validated=schema_is_validated, context=context)
 
         if context is None:
-            context = SchemaContext.root(self._schema)
+            context = SchemaContext.root(self._schema, skips_validation=self._skips_validation)
 
         if self._schema.get("minLength", float("-inf")) > self._schema.get("maxLength", float("inf")):
             raise SchemaConflictError("\"minLength\" must be lower than or equal to the \"maxLength\" value.", context)
 
+        pattern = self._schema.get("pattern")
+        if pattern is not None:
+            try:
+                self._pattern_sampler = PatternSampler(pattern,
+                                                       min_length=self._schema.get("minLength"),
+                                                       max_length=self._schema.get("maxLength"))
+            except EmptyCharacterSetError as e:
+                raise SchemaConflictError(str(e), context) from e
+            if not self._pattern_sampler.is_satisfiable:
+                raise SchemaConflictError("No string matching \"pattern\" has a length between \"minLength\" and "
+                                          "\"maxLength\".", context)
+        else:
+            self._pattern_sampler = None
+
+    def _get_length_range(self, options: Options, context: GenerationContext) -> Tuple[int, int]:
+        return self._derive_from_options(options, 'length_range',
+                                         lambda: _get_length_range(self._schema, options, context))
+
     def gen(self,
             *,
             options: Optional[Options] = None,
-            context: Optional[GenerationContext] = None) -> str:
+            context: Optional[GenerationContext] = None,
+            rng: Optional[random.Random] = None) -> str:
         if options is None:
             options = Options.default()
         if context is None:
             context = GenerationContext.root(self._schema)
+        if rng is None:
+            rng = random
 
-        schema = _normalize_schema(self._schema, options, context)
+        # pattern の指定がある場合、それを使用する
+        if self._pattern_sampler is not None:
+            return self._sample_pattern(options, context, rng)
 
-        pattern = re.compile(schema["pattern"]) if schema["pattern"] is not None else None
-        min_length = schema["minLength"]
-        max_length = schema["maxLength"]
+        min_length, max_length = self._get_length_range(options, context)
 
-        # pattern の指定がある場合、それを使用する
-        if pattern is not None:
-            generated = rstr.xeger(pattern)
         # maxLength が 0 の場合、空文字でよい
-        elif max_length is not None and max_length <= 0:
+        if max_length <= 0:
             generated = ""
         # いずれにも当てはまらない場合、英字列を生成する。
         else:
-            generated = rstr.rstr(string.ascii_letters, start_range=min_length, end_range=max_length)
+            generated = sample_letters(min_length, max_length, rng)
 
         return generated
 
+    def _sample_pattern(self, options: Options, context: GenerationContext, rng: random.Random) -> str:
+        if self._pattern_sampler.is_exact:
+            return self._pattern_sampler.sample(rng)
+
+        # 後方参照を含むパターンでは長さを指定して生成できないため、長さが範囲内である値を引くまで生成を繰り返す。
+        attempts = 0
+        for _ in _attempts(options):
+            attempts += 1
+            generated = self._pattern_sampler.sample(rng)
+            if self._pattern_sampler.accepts(generated):
+                self._stats.record_attempts(attempts)
+                return generated
+        else:
+            self._stats.record_attempts(attempts, failed=True)
+            raise GenerateError("No valid value generated on loop.", context)
+
+    def _describe(self, options: Options) -> Tuple[str, float]:
+        if self._pattern_sampler is not None:
+            min_length, max_length = self._pattern_sampler.length_bounds
+            details = f"pattern={self._schema['pattern']!r}, length=[{min_length}, {max_length}]"
+            if not self._pattern_sampler.is_exact:
+                details += ", rejection sampling"
+            # 1文字ごとに乱数を引くものとして見積もる
+            return details, 1.0 + (min_length + max_length) / 2
+
+        min_length, max_length = self._get_length_range(options, GenerationContext.root(self._schema))
+        if max_length <= 0:
+            return "length=[0, 0]", 1.0
+        return f"length=[{min_length}, {max_length}]", 2.0 + (min_length + max_length) / 2
+
+    def _compile(self, options: Options, context: GenerationContext, rng: random.Random) -> Callable[[], str]:
+        if self._pattern_sampler is not None:
+            if self._pattern_sampler.is_exact:
+                return functools.partial(self._pattern_sampler.sample, rng)
+            else:
+                return functools.partial(self._sample_pattern, options, context, rng)
+
+        min_length, max_length = self._get_length_range(options, context)
+
+        if max_length <= 0:
+            return str
+        else:
+            return functools.partial(sample_letters, min_length, max_length, rng)
+
+
+def _attempts(options: Options) -> Iterable[int]:
+    """Returns an iterable which limits the number of attempts of generation.
+
+    Args:
+        options: The options for generation.
+
+    Returns:
+        An iterable of length ``options.regeneration_attempt_limit``, or an infinite iterable if it is None.
+    """
+    if options.regeneration_attempt_limit is None:
+        return itertools.count()
+    else:
+        return range(options.regeneration_attempt_limit)
+
 
 def _schema_is_tuple_validation(schema: dict) -> bool:
     """Determines if the schema is for a tuple validation or not.
@@ -706,7 +1316,7 @@ class ListFactory(Factory[list]):
         super(ListFactory, self).__init__(schema, schema_is_validated=schema_is_validated, context=context)
 
         if context is None:
-            context = SchemaContext.root(self._schema)
+            context = SchemaContext.root(self._schema, skips_validation=self._skips_validation)
 
         # 生成する list の大きさの範囲
         min_items, max_items = _get_range_of_length(self._schema, context)
@@ -737,44 +1347,158 @@ class ListFactory(Factory[list]):
             else:
                 self._other_items_factory = None
 
-    def _get_other_items_factory(self, options: Options) -> Factory:
+    def _get_other_items_factory(self, options: Options, *, count: int) -> Factory:
+        """Returns the factory of items which are not specified by tuple validation.
+
+        Args:
+            options: The options for generation.
+            count: The number of items to be generated with the factory. If the factory is derived from
+                ``options.default_schema_of_items``, they are counted as fallbacks.
+        """
         if self._other_items_factory is not None:
             return self._other_items_factory
         else:
-            schema = options.default_schema_of_items
-            return Factory(schema,
-                           context=SchemaContext.for_options(schema, path=('default_schema_of_items',)))
-
-    def _get_items_factory_list(self, item_count: int, options: Options) -> Iterable[Factory]:
-        return fix_length(self._tuple_items_factory, item_count,
-                          padding_item=self._get_other_items_factory(options))
+            self._stats.fallbacks += count
+            return self._derive_from_options(options, 'default_schema_of_items',
+                                             lambda: _factory_from_options(options.default_schema_of_items,
+                                                                           ('default_schema_of_items',),
+                                                                           self._skips_validation))
+
+    def _describe(self, options: Options) -> Tuple[str, float]:
+        return f"items=[{self._min_items}, {self._max_items}]", 2.0
+
+    def _explain_children(self, options: Options) -> Iterable[Tuple[str, Factory, float, str]]:
+        # 要素数は min_items 以上 max_items 以下から一様に選ばれる
+        item_counts = range(self._min_items, self._max_items + 1)
+        for index, factory in enumerate(self._tuple_items_factory):
+            yield '[]', factory, sum(1 for c in item_counts if c > index) / len(item_counts), ''
+
+        tuple_size = len(self._tuple_items_factory)
+        other_items_count = sum(max(c - tuple_size, 0) for c in item_counts) / len(item_counts)
+        if other_items_count > 0:
+            origin = 'options.default_schema_of_items' if self._other_items_factory is None else ''
+            yield '[]', self._get_other_items_factory(options, count=0), other_items_count, origin
+
+    def _child_factories(self) -> Iterable[Tuple[str, Factory]]:
+        # 要素の添字はすべて [] と表記する
+        for factory in self._tuple_items_factory:
+            yield '[]', factory
+        if self._other_items_factory is not None:
+            yield '[]', self._other_items_factory
+        for _, factory in self._factories_from_options():
+            yield '[]', factory
 
     def gen(self,
             *,
             options: Optional[Options] = None,
-            context: Optional[GenerationContext] = None) -> list:
+            context: Optional[GenerationContext] = None,
+            rng: Optional[random.Random] = None) -> list:
         if options is None:
             options = Options.default()
         if context is None:
             context = GenerationContext.root(self._schema)
+        if rng is None:
+            rng = random
 
         # 生成する list の大きさ
-        item_count = random.randint(self._min_items, self._max_items)
+        item_count = rng.randint(self._min_items, self._max_items)
+
+        # tuple validation で指定されていない要素のファクトリ
+        tuple_items_factory = self._tuple_items_factory
+        other_items_factory = self._get_other_items_factory(options,
+                                                            count=max(item_count - len(tuple_items_factory), 0))
+
+        # tuple validation でない場合、要素の型に特化したループでまとめて生成する
+        if len(tuple_items_factory) <= 0 and _has_gen_many(other_items_factory):
+            try:
+                return _gen_many_child(other_items_factory, item_count, options,
+                                       context.resolve(0, other_items_factory._schema), rng)
+            except GenerateError:
+                # まとめて生成した場合はエラーが発生した要素を特定できないため、1つずつ生成し直す
+                pass
 
         # 生成するリスト
         result = [None] * item_count
 
         # 各要素のファクトリ
-        item_factory_list = self._get_items_factory_list(item_count, options)
+        item_factory_list = fix_length(tuple_items_factory, item_count, padding_item=other_items_factory)
 
         # 要素を1つずつ生成
         for key, item_factory in enumerate(item_factory_list):
             result[key] = item_factory.gen_as_child(options=options,
                                                     parent_context=context,
-                                                    child_key=key)
+                                                    child_key=key,
+                                                    rng=rng)
 
         return result
 
+    def _compile(self, options: Options, context: GenerationContext, rng: random.Random) -> Callable[[], list]:
+        min_items, max_items = self._min_items, self._max_items
+        randint = rng.randint
+        stats = self._stats
+        # options から導出したファクトリで生成する要素は、生成するたびに数える
+        is_fallback = self._other_items_factory is None
+
+        # 要素の context は要素ごとに異なるため、要素を起点とした相対的な context でコンパイルしておき、
+        # エラー発生時にのみ絶対的な context に変換する。
+        tuple_item_gens = [_compile_child(factory, options, GenerationContext.relative(context, key, factory._schema),
+                                          rng)
+                           for key, factory in enumerate(self._tuple_items_factory)]
+        other_items_factory = self._get_other_items_factory(options, count=0)
+        other_items_context = GenerationContext.relative(context, len(tuple_item_gens), other_items_factory._schema)
+        gen_other_item = _compile_child(other_items_factory, options, other_items_context, rng)
+
+        def gen_other_items_one_by_one(item_count: int) -> list:
+            result = []
+            append = result.append
+            key = 0
+            try:
+                for key in range(item_count):
+                    append(gen_other_item())
+            except GenerateError as e:
+                e.context = context.join(key, e.context)
+                raise
+
+            return result
+
+        if len(tuple_item_gens) <= 0 and _has_gen_many(other_items_factory):
+            def gen_list() -> list:
+                item_count = randint(min_items, max_items)
+                if is_fallback:
+                    stats.fallbacks += item_count
+                try:
+                    return _gen_many_child(other_items_factory, item_count, options, other_items_context, rng)
+                except GenerateError:
+                    # まとめて生成した場合はエラーが発生した要素を特定できないため、1つずつ生成し直す
+                    return gen_other_items_one_by_one(item_count)
+        elif len(tuple_item_gens) <= 0:
+            def gen_list() -> list:
+                item_count = randint(min_items, max_items)
+                if is_fallback:
+                    stats.fallbacks += item_count
+                return gen_other_items_one_by_one(item_count)
+        else:
+            tuple_size = len(tuple_item_gens)
+
+            def gen_list() -> list:
+                item_count = randint(min_items, max_items)
+                if is_fallback and item_count > tuple_size:
+                    stats.fallbacks += item_count - tuple_size
+                result = []
+                append = result.append
+                key = 0
+                try:
+                    for key, gen_item in enumerate(fix_length(tuple_item_gens, item_count,
+                                                              padding_item=gen_other_item)):
+                        append(gen_item())
+                except GenerateError as e:
+                    e.context = context.join(key, e.context)
+                    raise
+
+                return result
+
+        return gen_list
+
 
 class DictFactory(Factory[dict]):
     _property_factories: Dict[str, Factory]
@@ -786,7 +1510,7 @@ class DictFactory(Factory[dict]):
         super(DictFactory, self).__init__(schema, schema_is_validated=schema_is_validated, context=context)
 
         if context is None:
-            context = SchemaContext.root(self._schema)
+            context = SchemaContext.root(self._schema, skips_validation=self._skips_validation)
 
         self._property_factories = {prop: Factory(prop_schema,
                                                   schema_is_validated=self.schema_is_validated,
@@ -801,28 +1525,75 @@ class DictFactory(Factory[dict]):
 
     def _factory_of(self, key: str,
                     *,
-                    options: Options) -> Factory:
+                    options: Options,
+                    count: int = 1) -> Factory:
+        """Returns the factory of the property.
+
+        Args:
+            key: The key of the property.
+            options: The options for generation.
+            count: The number of values to be generated with the factory. If the factory is derived from
+                ``options.priority_schema_of_properties`` or ``options.default_schema_of_properties``, they are counted
+                as fallbacks.
+        """
         if key in options.priority_schema_of_properties:
-            schema = options.priority_schema_of_properties[key]
-            return Factory(schema,
-                           context=SchemaContext.for_options(
-                               schema, path=('priority_schema_of_properties', key)))
+            self._stats.fallbacks += count
+            return self._derive_from_options(options, ('priority_schema_of_properties', key),
+                                             lambda: _factory_from_options(options.priority_schema_of_properties[key],
+                                                                           ('priority_schema_of_properties', key),
+                                                                           self._skips_validation))
         elif key in self._property_factories:
             return self._property_factories[key]
         else:
-            schema = options.default_schema_of_properties
-            return Factory(schema,
-                           context=SchemaContext.for_options(
-                               schema, path=('default_schema_of_properties',)))
+            self._stats.fallbacks += count
+            return self._derive_from_options(options, 'default_schema_of_properties',
+                                             lambda: _factory_from_options(options.default_schema_of_properties,
+                                                                           ('default_schema_of_properties',),
+                                                                           self._skips_validation))
+
+    def _describe(self, options: Options) -> Tuple[str, float]:
+        optional_keys = [key for key in self._properties.keys() if key not in self._required_keys]
+        if len(optional_keys) <= 0:
+            return '', 1.0
+        # 必須でない項目ごとに、生成するか否かを決める乱数を引く
+        return f"prob_of_optional_properties={options.default_prob_of_optional_properties}", 1.0 + len(optional_keys)
+
+    def _explain_children(self, options: Options) -> Iterable[Tuple[str, Factory, float, str]]:
+        prob_of_optional_properties = min(max(options.default_prob_of_optional_properties, 0.0), 1.0)
+        required_keys = list(collections.OrderedDict.fromkeys(self._required_keys))
+        optional_keys = [key for key in self._properties.keys() if key not in required_keys]
+
+        for key in required_keys + optional_keys:
+            if key in options.priority_schema_of_properties:
+                origin = 'options.priority_schema_of_properties'
+            elif key not in self._property_factories:
+                origin = 'options.default_schema_of_properties'
+            else:
+                origin = ''
+            count = 1.0 if key in required_keys else prob_of_optional_properties
+            yield f'.{key}', self._factory_of(key, options=options, count=0), count, origin
+
+    def _child_factories(self) -> Iterable[Tuple[str, Factory]]:
+        for key, factory in self._property_factories.items():
+            yield f'.{key}', factory
+        # options.default_schema_of_properties から導出したファクトリは、キーを * と表記する
+        for derived_key, factory in self._factories_from_options():
+            if derived_key == 'default_schema_of_properties':
+                yield '.*', factory
+            else:
+                yield f'.{derived_key[1]}', factory
 
     def gen(self,
             *,
             options: Optional[Options] = None,
-            context: Optional[GenerationContext] = None) -> dict:
+            context: Optional[GenerationContext] = None,
+            rng: Optional[random.Random] = None) -> dict:
         if options is None:
             options = Options.default()
         if context is None:
             context = GenerationContext.root(self._schema)
+        if rng is None:
+            rng = random
 
         generated: Dict[str, Any] = dict()
 
@@ -839,7 +1610,8 @@ class DictFactory(Factory[dict]):
             next_factory = self._factory_of(required_key, options=options)
             generated[required_key] = next_factory.gen_as_child(options=options,
                                                                 parent_context=context,
-                                                                child_key=required_key)
+                                                                child_key=required_key,
+                                                                rng=rng)
             generated_keys[required_key] = True
 
         # 必須でない項目を生成する
@@ -849,18 +1621,190 @@ class DictFactory(Factory[dict]):
                 continue
 
             # 一定確率 (options に指定) で生成しない。
-            if random.random() >= options.default_prob_of_optional_properties:
+            if rng.random() >= options.default_prob_of_optional_properties:
                 generated_keys[prop_key] = False
                 continue
 
             next_factory = self._factory_of(prop_key, options=options)
             generated[prop_key] = next_factory.gen_as_child(options=options,
                                                             parent_context=context,
-                                                            child_key=prop_key)
+                                                            child_key=prop_key,
+                                                            rng=rng)
             generated_keys[prop_key] = True
 
         return generated
 
+    def _compile(self, options: Options, context: GenerationContext, rng: random.Random) -> Callable[[], dict]:
+        prob_of_optional_properties = options.default_prob_of_optional_properties
+        rand = rng.random
+
+        # 必須項目 (重複を除く) と、必須でない項目に分けてコンパイルする
+        required_keys = list(collections.OrderedDict.fromkeys(self._required_keys))
+        optional_keys = [key for key in self._properties.keys() if key not in required_keys]
+        required_gens = [(key, self._compile_property(key, options, context, rng)) for key in required_keys]
+        optional_gens = [(key, self._compile_property(key, options, context, rng)) for key in optional_keys]
+
+        def gen_dict() -> dict:
+            generated = {key: gen_value() for key, gen_value in required_gens}
+
+            for key, gen_value in optional_gens:
+                # 一定確率 (options に指定) で生成しない。
+                if rand() < prob_of_optional_properties:
+                    generated[key] = gen_value()
+
+            return generated
+
+        return gen_dict
+
+    def _compile_property(self, key: str, options: Options, context: GenerationContext,
+                          rng: random.Random) -> Callable:
+        factory = self._factory_of(key, options=options, count=0)
+        gen_value = factory._compile_as_child(options=options, parent_context=context, child_key=key, rng=rng)
+        if factory is self._property_factories.get(key):
+            return gen_value
+
+        # options から導出したファクトリで生成する値は、生成するたびに数える
+        stats = self._stats
+
+        def gen_fallback_value():
+            stats.fallbacks += 1
+            return gen_value()
+
+        return gen_fallback_value
+
+    def _gen_many(self, n: int, options: Options, context: GenerationContext, rng: random.Random) -> List[dict]:
+        # 項目ごとに、すべての dict の値を列としてまとめて生成してから dict を組み立てる
+        required_columns, optional_columns = self._gen_columns(n, options, context, rng)
+
+        if len(required_columns) > 0:
+            generated = [dict(zip(required_columns.keys(), values)) for values in zip(*required_columns.values())]
+        else:
+            generated = [{} for _ in range(n)]
+
+        for key, (positions, column) in optional_columns.items():
+            for position, value in zip(positions, column):
+                generated[position][key] = value
+
+        return generated
+
+    def gen_columns(self,
+                    n: int,
+                    *,
+                    options: Optional[Options] = None,
+                    context: Optional[GenerationContext] = None,
+                    rng: Optional[random.Random] = None,
+                    use_array: bool = False) -> Dict[str, Union[list, array.array]]:
+        """Generate ``n`` dicts according to the schema, and return them as columns.
+
+        It returns a dict whose values are lists of the values of each property, instead of a list of dicts which
+        ``gen_many`` returns. If an optional property is not generated in a dict, the column has ``None`` at the
+        position.
+
+        Examples:
+            >>> import ranjg
+            >>> schema = {'type': 'object', 'required': ['id'], 'properties': {'id': {'type': 'integer'}}}
+            >>> factory = ranjg.Factory(schema)
+            >>> columns = factory.gen_columns(3)  # -> For example, {'id': [3, 85, 41]}
+
+        Args:
+            n (int):
+                The number of dicts to generate.
+            options (Options, optional):
+                The options for generation.
+            context (GenerationContext, optional):
+                The context of generation.
+                (In normal usage, this argument is not specified.)
+            rng (random.Random, optional):
+                The random number generator. If it is not specified, the module ``random`` is used.
+            use_array (bool, optional):
+                If True, the columns of required integer, number and boolean properties are ``array.array``.
+                (Booleans are stored as 1 or 0.)
+
+        Returns:
+            A dict whose keys are the keys of generated dicts and whose values are the columns.
+
+        Raises:
+            GenerateError:
+                If an unforeseen error arises.
+        """
+        if n < 0:
+            raise ValueError(f"n must be non-negative: {n}")
+        if options is None:
+            options = Options.default()
+        if context is None:
+            context = GenerationContext.root(self._schema)
+        if rng is None:
+            rng = random
+
+        required_columns, optional_columns = self._gen_columns(n, options, context, rng)
+
+        columns: Dict[str, Union[list, array.array]] = dict()
+        for key, column in required_columns.items():
+            typecode = _array_typecode(self._factory_of(key, options=options, count=0), column) if use_array else None
+            columns[key] = array.array(typecode, column) if typecode is not None else column
+        for key, (positions, column) in optional_columns.items():
+            columns[key] = [None] * n
+            for position, value in zip(positions, column):
+                columns[key][position] = value
+
+        return columns
+
+    def _gen_columns(self, n: int, options: Options, context: GenerationContext, rng: random.Random) \
+            -> Tuple[Dict[str, list], Dict[str, Tuple[List[int], list]]]:
+        """Generate the values of ``n`` dicts property by property.
+
+        Args:
+            n: The number of dicts to generate.
+            options: The options for generation.
+            context: The context of generation of each dict.
+            rng: The random number generator.
+
+        Returns:
+            A pair of the columns of required properties, and the columns of optional properties. Each column of an
+            optional property is paired with the positions of dicts which have the property.
+        """
+        prob_of_optional_properties = options.default_prob_of_optional_properties
+
+        required_keys = list(collections.OrderedDict.fromkeys(self._required_keys))
+        optional_keys = [key for key in self._properties.keys() if key not in required_keys]
+
+        required_columns = collections.OrderedDict((key, self._gen_column(key, n, options, context, rng))
+                                                   for key in required_keys)
+
+        optional_columns = collections.OrderedDict()
+        for key in optional_keys:
+            # 一定確率 (options に指定) で生成しない。
+            positions = list(itertools.compress(range(n), _gen_bools(n, prob_of_optional_properties, options, rng)))
+            optional_columns[key] = (positions, self._gen_column(key, len(positions), options, context, rng))
+
+        return required_columns, optional_columns
+
+    def _gen_column(self, key: str, n: int, options: Options, context: GenerationContext, rng: random.Random) -> list:
+        factory = self._factory_of(key, options=options, count=n)
+        return _gen_many_child(factory, n, options, context.resolve(key, factory._schema), rng)
+
+
+def _array_typecode(factory: Factory, column: list) -> Optional[str]:
+    """Decide the type code of ``array.array`` which can hold the column.
+
+    Args:
+        factory: The factory which generated the column.
+        column: Generated values.
+
+    Returns:
+        A type code, or None if the column cannot be an ``array.array``.
+    """
+    if isinstance(factory, BoolFactory):
+        return 'b'
+    elif isinstance(factory, NumFactory):
+        return 'd'
+    elif isinstance(factory, IntFactory):
+        minimum, maximum = (min(column), max(column)) if len(column) > 0 else (0, 0)
+        if INT64_MIN <= minimum and maximum <= INT64_MAX:
+            return 'q'
+
+    return None
+
 
 class MultiFactory(Factory[None]):
     _factories: List[Factory]
@@ -869,6 +1813,9 @@ class MultiFactory(Factory[None]):
                  schema_is_validated: bool = False, context: Optional[SchemaContext] = None):
         super(MultiFactory, self).__init__(schema, schema_is_validated=schema_is_validated, context=context)
 
+        if context is None:
+            context = SchemaContext.root(self._schema, skips_validation=self._skips_validation)
+
         # schema['type'] がリストでない場合 (strであるばあいを含む) やリストが空である場合例外を生じる
         schema_type = schema.get('type')
         if isinstance(schema_type, str) or not isinstance(schema_type, Iterable) or len(schema_type) <= 0:
@@ -880,12 +1827,49 @@ class MultiFactory(Factory[None]):
                                    context=context, gen_type=typ)
                            for typ in schema_type]
 
+    def _child_factories(self) -> Iterable[Tuple[str, Factory]]:
+        # 各 type の factory は同じパスの値を生成する
+        for factory in self._factories:
+            yield '', factory
+
+    def _describe(self, options: Options) -> Tuple[str, float]:
+        return f"types={[factory.__class__.__name__ for factory in self._factories]}", 1.0
+
+    def _explain_children(self, options: Options) -> Iterable[Tuple[str, Factory, float, str]]:
+        # いずれかの factory が一様に選ばれる
+        for factory in self._factories:
+            yield '', factory, 1 / len(self._factories), ''
+
     def gen(self,
             *,
             options: Optional[Options] = None,
-            context: Optional[GenerationContext] = None) -> None:
-        factory = random.choice(self._factories)
-        return factory.gen(options=options, context=context)
+            context: Optional[GenerationContext] = None,
+            rng: Optional[random.Random] = None) -> None:
+        if rng is None:
+            rng = random
+
+        factory = rng.choice(self._factories)
+        return factory.gen(options=options, context=context, rng=rng)
+
+    def _compile(self, options: Options, context: GenerationContext, rng: random.Random) -> Callable[[], Any]:
+        gens = [factory._compile(options, context, rng) for factory in self._factories]
+        choice = rng.choice
+
+        def gen_multi():
+            return choice(gens)()
+
+        return gen_multi
+
+    def _gen_many(self, n: int, options: Options, context: GenerationContext, rng: random.Random) -> list:
+        # 各値をどの factory で生成するかを先に決め、factory ごとにまとめて生成する
+        picks = rng.choices(range(len(self._factories)), k=n)
+        generated = [None] * n
+        for index, factory in enumerate(self._factories):
+            positions = [i for i, pick in enumerate(picks) if pick == index]
+            for position, value in zip(positions, factory._gen_many(len(positions), options, context, rng)):
+                generated[position] = value
+
+        return generated
 
 
 class EnumFactory(Factory[None]):
@@ -896,7 +1880,7 @@ class EnumFactory(Factory[None]):
         super(EnumFactory, self).__init__(schema, schema_is_validated=schema_is_validated, context=context)
 
         if context is None:
-            context = SchemaContext.root(self._schema)
+            context = SchemaContext.root(self._schema, skips_validation=self._skips_validation)
 
         enum_values = self._schema.get('enum')
 
@@ -906,7 +1890,10 @@ class EnumFactory(Factory[None]):
         if len(enum_values) <= 0:
             raise SchemaConflictError('schema.enum must contain at least 1 value', context)
 
-        self._enum_values = tuple(filter(lambda v: _value_satisfies_schema(v, self._schema), enum_values))
+        self._enum_values = tuple(filter(lambda v: _value_satisfies_schema(v, self._schema,
+                                                                           skips_validation=self._skips_validation),
+                                         enum_values))
+        self._stats.filtered_enum_values = len(enum_values) - len(self._enum_values)
 
         if len(self._enum_values) <= 0:
             raise SchemaConflictError('At least 1 value of schema.enum must satisfy the schema', context)
@@ -914,13 +1901,17 @@ class EnumFactory(Factory[None]):
     def gen(self,
             *,
             options: Optional[Options] = None,
-            context: Optional[GenerationContext] = None) -> None:
+            context: Optional[GenerationContext] = None,
+            rng: Optional[random.Random] = None) -> None:
         if options is None:
             options = Options.default()
+        if rng is None:
+            rng = random
 
-        value = random.choice(self._enum_values)
+        value = rng.choice(self._enum_values)
 
         if options.enum_copy_style == ranjg.options.DEEP_COPY:
+            self._stats.deep_copies += 1
             return copy.deepcopy(value)
         elif options.enum_copy_style == ranjg.options.NO_COPY:
             return value
@@ -929,8 +1920,83 @@ class EnumFactory(Factory[None]):
         else:
             raise GenerateError('options.enum_copy_style is invalid value: ' + options.enum_copy_style, context=context)
 
+    def _describe(self, options: Options) -> Tuple[str, float]:
+        return f"values={len(self._enum_values)}, copy={options.enum_copy_style}", 2.0
+
+    def _compile(self, options: Options, context: GenerationContext, rng: random.Random) -> Callable[[], Any]:
+        enum_values = self._enum_values
+        choice = rng.choice
+        stats = self._stats
+
+        if options.enum_copy_style == ranjg.options.DEEP_COPY:
+            def gen_enum():
+                stats.deep_copies += 1
+                return copy.deepcopy(choice(enum_values))
+        elif options.enum_copy_style == ranjg.options.NO_COPY:
+            def gen_enum():
+                return choice(enum_values)
+        elif options.enum_copy_style == ranjg.options.SHALLOW_COPY:
+            def gen_enum():
+                return copy.copy(choice(enum_values))
+        else:
+            raise GenerateError('options.enum_copy_style is invalid value: ' + options.enum_copy_style, context=context)
+
+        return gen_enum
+
+    def _gen_many(self, n: int, options: Options, context: GenerationContext, rng: random.Random) -> list:
+        np_rng = numpy_rng(n, options, rng)
+        if np_rng is not None:
+            enum_values = self._enum_values
+            values = [enum_values[i] for i in np_rng.integers(len(enum_values), size=n).tolist()]
+        else:
+            values = rng.choices(self._enum_values, k=n)
+
+        if options.enum_copy_style == ranjg.options.DEEP_COPY:
+            self._stats.deep_copies += n
+            return [copy.deepcopy(value) for value in values]
+        elif options.enum_copy_style == ranjg.options.NO_COPY:
+            return values
+        elif options.enum_copy_style == ranjg.options.SHALLOW_COPY:
+            return [copy.copy(value) for value in values]
+        else:
+            raise GenerateError('options.enum_copy_style is invalid value: ' + options.enum_copy_style, context=context)
+
+
+def _has_gen_many(factory: Factory) -> bool:
+    """Check if the factory generates many values with a loop specialized for its type.
+
+    Args:
+        factory: A factory.
+
+    Returns:
+        True if the class of the factory overrides ``_gen_many``, otherwise False.
+    """
+    return type(factory)._gen_many is not Factory._gen_many
+
+
+def _factory_from_options(schema: dict, path: Tuple[Union[str, int], ...], skips_validation: bool) -> Factory:
+    """Construct a factory with a schema in options.
+
+    Args:
+        schema: A schema in options.
+        path: The path to the schema in options.
+        skips_validation: If True, the schema is not validated, as the schema of the factory which uses the options.
+
+    Returns:
+        A factory according to the schema.
+    """
+    return Factory(schema, schema_is_validated=skips_validation,
+                   context=SchemaContext.for_options(schema, path=path, skips_validation=skips_validation))
+
+
+def _value_satisfies_schema(value, schema: dict, *, skips_validation: bool = False) -> bool:
+    # スキーマの検証を省略する場合は jsonschema を import せずに判定する
+    if skips_validation:
+        return schemas.satisfies(value, schema)
+
+    # jsonschema の import には時間がかかるため、使用時に import する
+    import jsonschema
 
-def _value_satisfies_schema(value, schema: dict) -> bool:
     try:
         # TODO: 使用する validator を検討
         jsonschema.validate(value, schema)
@@ -64,6 +64,12 @@ class Options(NamedTuple):
     #: See the description of copy pickle for information on shallow copy and deep copy.
     enum_copy_style: str = DEEP_COPY
 
+    #: In generation of many values at once (``Factory#gen_many`` or a long list), uses NumPy if it is installed.
+    #: It makes the generation of booleans, integers, numbers and enum values faster, but the generated values are
+    #: different from the values generated without NumPy even with the same seed, and may change with the version of
+    #: NumPy. So the same seed reproduces the same values only with the same backend.
+    use_numpy: bool = False
+
     @classmethod
     @lru_cache(maxsize=1)
     def default(cls):
@@ -77,6 +83,51 @@ class Options(NamedTuple):
         return Options()
 
 
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+#: 各オプションの値が満たすべき条件と、満たさない場合のメッセージ
+_VALUE_CHECKERS = {
+    'regeneration_attempt_limit': (lambda value: value is None or _is_int(value), 'an integer or null'),
+    'default_prob_of_true_given_bool': (lambda value: _is_number(value) and 0 <= value <= 1,
+                                        'a number between 0 and 1'),
+    'default_length_range_of_genstr': (_is_int, 'an integer'),
+    'default_min_length_of_string': (_is_int, 'an integer'),
+    'default_max_length_of_string': (_is_int, 'an integer'),
+    'default_prob_of_optional_properties': (lambda value: _is_number(value) and 0 <= value <= 1,
+                                            'a number between 0 and 1'),
+    'default_schema_of_properties': (lambda value: isinstance(value, (dict, bool)), 'a schema'),
+    'priority_schema_of_properties': (lambda value: isinstance(value, dict), 'an object'),
+    'default_schema_of_items': (lambda value: isinstance(value, (dict, bool)), 'a schema'),
+    'enum_copy_style': (lambda value: value in (NO_COPY, SHALLOW_COPY, DEEP_COPY),
+                        f'one of {NO_COPY}, {SHALLOW_COPY} and {DEEP_COPY}'),
+    'use_numpy': (lambda value: isinstance(value, bool), 'a boolean'),
+}
+
+
+def validate(options: Options) -> None:
+    """Validate the types and the ranges of values of options.
+
+    The schemas in the options are not validated.
+
+    Args:
+        options: Options to validate.
+
+    Raises:
+        ValueError:
+            When a value of the options is illegal.
+    """
+    for name, (checker, expected) in _VALUE_CHECKERS.items():
+        value = getattr(options, name)
+        if not checker(value):
+            raise ValueError(f'{name} must be {expected}: {json.dumps(value, default=repr)}')
+
+
 def __object_hook_on_load(d: dict) -> Union[Options, dict]:
     # Options を json.load メソッドでロードする際の object_hook として使用する
 
@@ -104,7 +155,11 @@ def load(filepath: str) -> Options:
     except json.decoder.JSONDecodeError as e:
         raise OptionsFileIOError(f'This file cannot be parsed as options: {filepath}') from e
 
-    if isinstance(options, Options):
-        return options
-    else:
+    if not isinstance(options, Options):
         raise OptionsFileIOError(f'This file cannot be parsed as options: {filepath}')
+
+    try:
+        validate(options)
+    except ValueError as e:
+        raise OptionsFileIOError(f'This file has an illegal option: {filepath}: {e}') from e
+    return options
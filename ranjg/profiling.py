@@ -0,0 +1,213 @@
+"""Profiling of generation for each path in generated values.
+
+Examples:
+    >>> import ranjg
+    >>> schema = {'type': 'object', 'required': ['items'],
+    ...           'properties': {'items': {'type': 'array', 'items': {'type': 'string', 'pattern': '^[A-Z]{8}$'}}}}
+    >>> with ranjg.Profiler() as profiler:
+    ...     ranjg.gen(schema, multiplicity=1000)
+    >>> print(profiler.report())
+"""
+import json
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union, TypeVar
+
+_T = TypeVar('_T')
+
+#: 有効なプロファイラ
+_active_profiler: Optional['Profiler'] = None
+
+
+class PathProfile:
+    """Statistics of generation of values at a path.
+    """
+    __slots__ = ('path', 'time', 'calls', 'bytes')
+
+    def __init__(self, path: str):
+        #: The path in the style of ``$.orders[].items[].sku``.
+        self.path = path
+        #: The cumulative seconds spent generating values at the path, including their child elements.
+        self.time = 0.0
+        #: The number of values generated at the path.
+        self.calls = 0
+        #: The total length of the JSON representation of values generated at the path.
+        self.bytes = 0
+
+
+class Profiler:
+    """A profiler which records cumulative time, call count and bytes produced for each path in generated values.
+
+    It is a context manager. While it is active, every generation in the process is recorded. Profiling doesn't change
+    how values are generated, so the same seed gives the same values with or without a profiler. Values generated
+    together by ``gen_many`` are measured as a batch; the time is the time of the batch and the calls are the number
+    of values in it.
+
+    Paths are built from the key paths of ``GenerationContext``. Every index of lists is written as ``[]``, so all
+    elements of a list, including elements of tuple validation, are recorded at the same path.
+    """
+
+    def __init__(self):
+        self._profiles: Dict[str, PathProfile] = {}
+        self._path_cache: Dict[Tuple[Union[int, str], ...], str] = {}
+        # 計測中の値ごとに、その内側で生じたプロファイラ自体の処理時間
+        self._overhead_stack: List[float] = []
+        self._start: Optional[float] = None
+        self._elapsed = 0.0
+
+    def __enter__(self) -> 'Profiler':
+        global _active_profiler
+        if _active_profiler is not None:
+            raise RuntimeError("Another profiler is already active.")
+
+        _active_profiler = self
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _active_profiler
+        self._elapsed += time.perf_counter() - self._start
+        _active_profiler = None
+
+    @property
+    def elapsed(self) -> float:
+        """The seconds while the profiler was active.
+        """
+        return self._elapsed
+
+    def profiles(self) -> List[PathProfile]:
+        """Returns the statistics of each path, sorted in descending order of time.
+        """
+        return sorted(self._profiles.values(), key=lambda profile: profile.time, reverse=True)
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """Returns the statistics as a human readable table.
+
+        The ratio of time of each path is relative to the time of the root path ``$``, which is recorded when values
+        are generated by ``ranjg.gen``, ``compile`` or ``gen_many``.
+
+        Args:
+            limit: If specified, only the slowest ``limit`` paths are reported.
+        """
+        # 割合は、ルート要素の生成に要した時間 (記録されていない場合はプロファイラが有効だった時間) に対する値とする
+        root = self._profiles.get('$')
+        total = root.time if root is not None else self._elapsed
+        base = total if total > 0 else 1.0
+        lines = [f"{'time':>8} {'seconds':>10} {'calls':>10} {'bytes':>12}  path"]
+        for profile in self.profiles()[:limit]:
+            lines.append(f"{profile.time / base:>8.1%} {profile.time:>10.4f} {profile.calls:>10} {profile.bytes:>12}"
+                         f"  {profile.path}")
+        lines.append(f"(generation {total:.4f} seconds, profiled for {self._elapsed:.4f} seconds)")
+        return "\n".join(lines)
+
+    def measure(self, key_path: Tuple[Union[int, str], ...], generate: Callable[[], _T]) -> _T:
+        """Generates a value with ``generate`` and records it at the path.
+
+        The time spent by the profiler itself, such as measuring the bytes of values, is excluded from the time of
+        the path and its ancestors.
+        """
+        overhead_stack = self._overhead_stack
+        overhead_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            value = generate()
+        except BaseException:
+            end = time.perf_counter()
+            self._add_overhead(overhead_stack.pop())
+            raise
+        end = time.perf_counter()
+        nested_overhead = overhead_stack.pop()
+
+        profile = self._profile_of(key_path)
+        profile.time += end - start - nested_overhead
+        profile.calls += 1
+        profile.bytes += len(json.dumps(value))
+
+        self._add_overhead(nested_overhead + time.perf_counter() - end)
+        return value
+
+    def measure_many(self, key_path: Tuple[Union[int, str], ...], generate: Callable[[], List[_T]]) -> List[_T]:
+        """Generates values with ``generate`` and records them at the path as a batch.
+
+        It is the counterpart of ``measure`` for ``gen_many``.
+        """
+        overhead_stack = self._overhead_stack
+        overhead_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            values = generate()
+        except BaseException:
+            end = time.perf_counter()
+            self._add_overhead(overhead_stack.pop())
+            raise
+        end = time.perf_counter()
+        nested_overhead = overhead_stack.pop()
+
+        profile = self._profile_of(key_path)
+        profile.time += end - start - nested_overhead
+        profile.calls += len(values)
+        profile.bytes += sum(len(json.dumps(value)) for value in values)
+
+        self._add_overhead(nested_overhead + time.perf_counter() - end)
+        return values
+
+    def _add_overhead(self, overhead: float):
+        if len(self._overhead_stack) > 0:
+            self._overhead_stack[-1] += overhead
+
+    def _profile_of(self, key_path: Tuple[Union[int, str], ...]) -> PathProfile:
+        path = self._path_cache.get(key_path)
+        if path is None:
+            path = '$' + ''.join('[]' if isinstance(key, int) else f'.{key}' for key in key_path)
+            self._path_cache[key_path] = path
+
+        profile = self._profiles.get(path)
+        if profile is None:
+            profile = PathProfile(path)
+            self._profiles[path] = profile
+        return profile
+
+
+def active_profiler() -> Optional[Profiler]:
+    """Returns the active profiler, or None if no profiler is active.
+    """
+    return _active_profiler
+
+
+def profiled_gen(factory, options, context, rng):
+    """Generates a value with ``factory.gen``, recording it with the active profiler if any.
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        return factory.gen(options=options, context=context, rng=rng)
+
+    return profiler.measure(context.absolute_key_path,
+                            lambda: factory.gen(options=options, context=context, rng=rng))
+
+
+def profiled_gen_many(factory, n, options, context, rng):
+    """Generates values with ``factory._gen_many``, recording them with the active profiler if any.
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        return factory._gen_many(n, options, context, rng)
+
+    return profiler.measure_many(context.absolute_key_path,
+                                 lambda: factory._gen_many(n, options, context, rng))
+
+
+def profiled(context, generate: Callable[[], _T]) -> Callable[[], _T]:
+    """Wraps a function which generates values at the context, so that the active profiler records each value.
+
+    The returned function calls ``generate`` as is while no profiler is active. If ``context`` is None, the values are
+    recorded at the root path.
+    """
+    key_path = context.absolute_key_path if context is not None else ()
+
+    def generate_profiled() -> _T:
+        profiler = _active_profiler
+        if profiler is None:
+            return generate()
+
+        return profiler.measure(key_path, generate)
+
+    return generate_profiled
@@ -1,2 +1,3 @@
 from ._io import load
+from ._satisfy import satisfies
 from ._validate import validate
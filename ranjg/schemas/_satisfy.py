@@ -0,0 +1,145 @@
+import re
+from typing import Any, Union
+
+from .normalize import normalize_exclusive_minimum, normalize_exclusive_maximum
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    return _is_number(value) and (isinstance(value, int) or value.is_integer())
+
+
+_TYPE_CHECKERS = {
+    'null': lambda value: value is None,
+    'boolean': lambda value: isinstance(value, bool),
+    'integer': _is_integer,
+    'number': _is_number,
+    'string': lambda value: isinstance(value, str),
+    'array': lambda value: isinstance(value, (list, tuple)),
+    'object': lambda value: isinstance(value, dict),
+}
+
+
+def satisfies(value: Any, schema: Union[dict, bool]) -> bool:
+    """Check if the value satisfies the schema, without jsonschema.
+
+    It is used instead of jsonschema when the validation of schemas is skipped, since importing jsonschema takes long
+    time. Only the keywords which ranjg uses for generation are checked; the other keywords are ignored, so a value
+    which doesn't satisfy them may be regarded as satisfying the schema.
+
+    Args:
+        value: A value.
+        schema: A schema, which is assumed to be valid.
+
+    Returns:
+        True if the value satisfies the schema, otherwise False.
+    """
+    if isinstance(schema, bool):
+        return schema
+
+    schema_type = schema.get('type')
+    if schema_type is not None:
+        types = (schema_type,) if isinstance(schema_type, str) else schema_type
+        if not any(_TYPE_CHECKERS[typ](value) for typ in types if typ in _TYPE_CHECKERS):
+            return False
+
+    if 'enum' in schema and value not in schema['enum']:
+        return False
+    if 'const' in schema and value != schema['const']:
+        return False
+
+    if _is_number(value):
+        return _number_satisfies(value, schema)
+    elif isinstance(value, str):
+        return _str_satisfies(value, schema)
+    elif isinstance(value, (list, tuple)):
+        return _list_satisfies(value, schema)
+    elif isinstance(value, dict):
+        return _dict_satisfies(value, schema)
+    else:
+        return True
+
+
+def _number_satisfies(value: Union[int, float], schema: dict) -> bool:
+    minimum, exclusive_minimum = normalize_exclusive_minimum(schema)
+    maximum, exclusive_maximum = normalize_exclusive_maximum(schema)
+    if minimum is not None and value < minimum:
+        return False
+    if exclusive_minimum is not None and value <= exclusive_minimum:
+        return False
+    if maximum is not None and value > maximum:
+        return False
+    if exclusive_maximum is not None and value >= exclusive_maximum:
+        return False
+
+    multiple_of = schema.get('multipleOf')
+    if multiple_of is not None:
+        # jsonschema と同様に、いずれかが float の場合は商が整数であるかで判定する
+        if isinstance(multiple_of, float) or isinstance(value, float):
+            try:
+                quotient = value / multiple_of
+                if int(quotient) != quotient:
+                    return False
+            except (OverflowError, ValueError):
+                return False
+        elif value % multiple_of != 0:
+            return False
+
+    return True
+
+
+def _str_satisfies(value: str, schema: dict) -> bool:
+    if 'minLength' in schema and len(value) < schema['minLength']:
+        return False
+    if 'maxLength' in schema and len(value) > schema['maxLength']:
+        return False
+    if 'pattern' in schema and re.search(schema['pattern'], value) is None:
+        return False
+
+    return True
+
+
+def _list_satisfies(value: Union[list, tuple], schema: dict) -> bool:
+    if 'minItems' in schema and len(value) < schema['minItems']:
+        return False
+    if 'maxItems' in schema and len(value) > schema['maxItems']:
+        return False
+
+    items = schema.get('items')
+    if isinstance(items, (list, tuple)):
+        # tuple validation
+        if not all(satisfies(item, item_schema) for item, item_schema in zip(value, items)):
+            return False
+        additional_items = schema.get('additionalItems')
+        if additional_items is not None and not all(satisfies(item, additional_items) for item in value[len(items):]):
+            return False
+    elif items is not None:
+        if not all(satisfies(item, items) for item in value):
+            return False
+
+    return True
+
+
+def _dict_satisfies(value: dict, schema: dict) -> bool:
+    if 'minProperties' in schema and len(value) < schema['minProperties']:
+        return False
+    if 'maxProperties' in schema and len(value) > schema['maxProperties']:
+        return False
+    if not all(key in value for key in schema.get('required', ())):
+        return False
+
+    properties = schema.get('properties', {})
+    if not all(satisfies(prop_value, properties[key]) for key, prop_value in value.items() if key in properties):
+        return False
+
+    # patternProperties は判定しないため、その場合は additionalProperties も判定しない
+    additional_properties = schema.get('additionalProperties')
+    if additional_properties is not None and 'patternProperties' not in schema:
+        if not all(satisfies(prop_value, additional_properties)
+                   for key, prop_value in value.items() if key not in properties):
+            return False
+
+    return True
@@ -1,4 +1,4 @@
-import jsonschema
+from functools import lru_cache
 
 from ..error import InvalidSchemaError
 
@@ -58,9 +58,16 @@ __meta_schema = {
     },
 }
 
-#: 使用する validator
-__SCHEMA_VALIDATOR = jsonschema.Draft7Validator(__meta_schema,
-                                                format_checker=jsonschema.draft7_format_checker)
+
+@lru_cache(maxsize=1)
+def _schema_validator():
+    """Returns the validator of schemas.
+
+    jsonschema is imported and the validator is built on the first call, since it takes long time.
+    """
+    import jsonschema
+
+    return jsonschema.Draft7Validator(__meta_schema, format_checker=jsonschema.draft7_format_checker)
 
 
 def validate(schema: dict):
@@ -72,7 +79,7 @@ def validate(schema: dict):
         InvalidSchemaError:
             When the schema is invalid
     """
-    validate_error_list = [*__SCHEMA_VALIDATOR.iter_errors(schema)]
+    validate_error_list = [*_schema_validator().iter_errors(schema)]
 
     # schema が不正でなければ終了
     if len(validate_error_list) <= 0:
@@ -0,0 +1,137 @@
+"""Statistics of generation counted by each factory.
+
+Examples:
+    >>> import ranjg
+    >>> schema = {'type': 'array', 'items': {'type': 'string', 'pattern': '^(a+)-\\\\1$', 'maxLength': 5}}
+    >>> factory = ranjg.Factory(schema)
+    >>> values = factory.gen_many(1000)
+    >>> print(factory.stats().report())
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class FactoryStats:
+    """Counters of a factory, which are updated while the factory generates values.
+
+    The counters are not locked, so they may be inexact when a factory is shared among threads.
+    """
+    __slots__ = ('retries', 'attempts', 'failures', 'fallbacks', 'deep_copies', 'filtered_enum_values')
+
+    def __init__(self):
+        #: The number of values rejected and regenerated, such as strings of patterns with backreferences whose length
+        #: is out of range.
+        self.retries = 0
+        #: The histogram of attempts to generate a value by rejection sampling. The keys are the numbers of attempts and
+        #: the values are the numbers of generated values (or failures).
+        self.attempts: Dict[int, int] = {}
+        #: The number of generations which failed since ``options.regeneration_attempt_limit`` was reached.
+        self.failures = 0
+        #: The number of child elements generated with factories derived from options, such as
+        #: ``options.default_schema_of_properties``. It is counted for each generated child element, in the same way
+        #: with ``gen``, ``compile`` and ``gen_many``.
+        self.fallbacks = 0
+        #: The number of values of ``enum`` which were deep-copied.
+        self.deep_copies = 0
+        #: The number of values of ``enum`` which were discarded at construction since they don't satisfy the schema.
+        self.filtered_enum_values = 0
+
+    def record_attempts(self, attempts: int, *, failed: bool = False):
+        """Records that a value was generated by rejection sampling with ``attempts`` attempts.
+
+        Args:
+            attempts: The number of attempts, including the accepted one.
+            failed: True if no value was accepted.
+        """
+        self.attempts[attempts] = self.attempts.get(attempts, 0) + 1
+        self.retries += max(attempts - 1, 0)
+        if failed:
+            self.failures += 1
+
+    def merge(self, other: 'FactoryStats'):
+        """Adds the counters of ``other`` to this.
+        """
+        self.retries += other.retries
+        for attempts, count in other.attempts.items():
+            self.attempts[attempts] = self.attempts.get(attempts, 0) + count
+        self.failures += other.failures
+        self.fallbacks += other.fallbacks
+        self.deep_copies += other.deep_copies
+        self.filtered_enum_values += other.filtered_enum_values
+
+    def is_empty(self) -> bool:
+        """Returns True if nothing is counted.
+        """
+        return (self.retries == 0 and len(self.attempts) == 0 and self.failures == 0 and self.fallbacks == 0
+                and self.deep_copies == 0 and self.filtered_enum_values == 0)
+
+
+class PathStats(FactoryStats):
+    """Counters of all factories at a path in generated values.
+    """
+    __slots__ = ('path',)
+
+    def __init__(self, path: str):
+        super(PathStats, self).__init__()
+        #: The path in the style of ``$.orders[].items[].sku``.
+        self.path = path
+
+
+class GenerationStats:
+    """Statistics of generation of a factory and its descendants, returned by ``Factory#stats``.
+
+    Paths are built in the same way as ``ranjg.Profiler``; every index of lists is written as ``[]``. Child elements
+    generated with factories derived from ``options.default_schema_of_properties`` are recorded at the path whose last
+    key is ``*``.
+    """
+
+    def __init__(self, factories: Iterable[Tuple[str, FactoryStats]]):
+        self._paths: Dict[str, PathStats] = {}
+        for path, factory_stats in factories:
+            path_stats = self._paths.get(path)
+            if path_stats is None:
+                path_stats = PathStats(path)
+                self._paths[path] = path_stats
+            path_stats.merge(factory_stats)
+
+    def __getitem__(self, path: str) -> PathStats:
+        return self._paths[path]
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._paths
+
+    def paths(self) -> List[PathStats]:
+        """Returns the statistics of each path, sorted in descending order of retries.
+        """
+        return sorted(self._paths.values(), key=lambda stats: (-stats.retries, stats.path))
+
+    def total(self) -> FactoryStats:
+        """Returns the sum of the statistics of all paths.
+        """
+        total = FactoryStats()
+        for path_stats in self._paths.values():
+            total.merge(path_stats)
+        return total
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """Returns the statistics as a human readable table.
+
+        Only paths which have something counted are reported.
+
+        Args:
+            limit: If specified, only the ``limit`` paths with the most retries are reported.
+        """
+        path_stats_list = [path_stats for path_stats in self.paths() if not path_stats.is_empty()][:limit]
+        if len(path_stats_list) <= 0:
+            return "(no retries, fallbacks or copies recorded)"
+
+        lines = [f"{'retries':>10} {'failures':>10} {'fallbacks':>10} {'copies':>10} {'filtered':>10}  path"]
+        for path_stats in path_stats_list:
+            lines.append(f"{path_stats.retries:>10} {path_stats.failures:>10} {path_stats.fallbacks:>10}"
+                         f" {path_stats.deep_copies:>10} {path_stats.filtered_enum_values:>10}  {path_stats.path}")
+
+        for path_stats in path_stats_list:
+            if len(path_stats.attempts) > 0:
+                histogram = ' '.join(f"{attempts}:{count}" for attempts, count in sorted(path_stats.attempts.items()))
+                lines.append(f"attempts of {path_stats.path}: {histogram}")
+
+        return "\n".join(lines)
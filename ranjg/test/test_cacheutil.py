@@ -0,0 +1,73 @@
+import unittest
+
+from ..util.cacheutil import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test class of ``LRUCache``
+
+    Test ``ranjg.util.cacheutil.LRUCache``
+    """
+
+    def test_get_and_put(self):
+        """ Normalized System Test
+        """
+        cache = LRUCache(maxsize=2)
+        cache.put('k1', 1)
+
+        self.assertEqual(cache.get('k1'), 1)
+        self.assertIsNone(cache.get('k2'))
+        self.assertEqual(cache.get('k2', 2), 2)
+
+    def test_discard_least_recently_used(self):
+        """ Normalized System Test
+
+        When the number of items exceeds ``maxsize``, the least recently used item is discarded.
+        """
+        cache = LRUCache(maxsize=2)
+        cache.put('k1', 1)
+        cache.put('k2', 2)
+        cache.get('k1')
+        cache.put('k3', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn('k1', cache)
+        self.assertNotIn('k2', cache)
+        self.assertIn('k3', cache)
+
+    def test_resize(self):
+        """ Normalized System Test
+
+        When ``maxsize`` is reduced, the least recently used items are discarded.
+        """
+        cache = LRUCache(maxsize=3)
+        cache.put('k1', 1)
+        cache.put('k2', 2)
+        cache.put('k3', 3)
+        cache.get('k1')
+
+        cache.resize(2)
+
+        self.assertEqual(cache.maxsize, 2)
+        self.assertListEqual([key in cache for key in ('k1', 'k2', 'k3')], [True, False, True])
+
+    def test_values(self):
+        """ Normalized System Test
+
+        ``values`` returns all items without changing the order of use.
+        """
+        cache = LRUCache(maxsize=2)
+        cache.put('k1', 1)
+        cache.put('k2', 2)
+
+        self.assertListEqual(cache.values(), [1, 2])
+        cache.put('k3', 3)
+        self.assertListEqual(cache.values(), [2, 3])
+
+    def test_illegal_maxsize(self):
+        """ Semi-normalized System Test
+        """
+        with self.assertRaisesRegex(ValueError, 'maxsize must be positive'):
+            LRUCache(maxsize=0)
+        with self.assertRaisesRegex(ValueError, 'maxsize must be positive'):
+            LRUCache(maxsize=1).resize(0)
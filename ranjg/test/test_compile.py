@@ -0,0 +1,104 @@
+import unittest
+
+import jsonschema
+
+import ranjg
+from ranjg import Options
+from ranjg.error import GenerateConflictError
+from ranjg.factories import NoneFactory, BoolFactory, IntFactory, NumFactory, StrFactory, ListFactory, DictFactory, \
+    MultiFactory, EnumFactory
+
+from .res import sample_schema
+
+
+class TestCompile(unittest.TestCase):
+    """Test class of ``Factory#compile``
+
+    Test ``ranjg.Factory#compile``
+    """
+
+    def test_compile(self):
+        """ Normalized System Test
+
+        ``Factory#compile()`` returns a function which returns a value according to the schema.
+        """
+        case_list = (
+            (NoneFactory, sample_schema('null')),
+            (BoolFactory, sample_schema('boolean')),
+            (IntFactory, sample_schema('integer')),
+            (NumFactory, sample_schema('number')),
+            (StrFactory, sample_schema('string')),
+            (StrFactory, {'type': 'string', 'pattern': '^[0-9]{3}-[A-Z]{2}$'}),
+            (ListFactory, sample_schema('array')),
+            (ListFactory, {'type': 'array', 'minItems': 3, 'items': [{'type': 'string'}, {'type': 'integer'}]}),
+            (DictFactory, sample_schema('object')),
+            (DictFactory, {'type': 'object', 'required': ['p1'], 'properties': {'p1': {}, 'p2': {'type': 'integer'}}}),
+            (MultiFactory, {'type': ['string', 'integer']}),
+            (EnumFactory, {'enum': ['value1', 1, [1, 2]]}),
+        )
+
+        for clz, schema in case_list:
+            with self.subTest(clz=clz.__name__, schema=schema):
+                factory = ranjg.Factory(schema)
+                generate = factory.compile()
+
+                self.assertIsInstance(factory, clz)
+                # 確率的事象につき、何度か試す
+                for _ in range(20):
+                    jsonschema.validate(generate(), schema)
+
+    def test_compile_with_options(self):
+        """ Normalized System Test
+
+        ``Factory#compile(options)`` uses the options in the same way as ``Factory#gen(options)``.
+        """
+        options = Options(default_prob_of_true_given_bool=1.0,
+                          default_prob_of_optional_properties=1.0,
+                          default_schema_of_properties={'type': 'integer', 'minimum': 3, 'maximum': 3},
+                          default_schema_of_items={'type': 'string', 'pattern': 'a'})
+        schema = {
+            'type': 'object',
+            'required': ['p1', 'p2'],
+            'properties': {
+                'p1': {'type': 'boolean'},
+                'p3': {'type': 'array', 'minItems': 2, 'maxItems': 2, 'items': [{'type': 'null'}]},
+            },
+        }
+
+        generate = ranjg.Factory(schema).compile(options=options)
+
+        self.assertDictEqual(generate(), {'p1': True, 'p2': 3, 'p3': [None, 'a']})
+
+    def test_compile_raises_error_with_context(self):
+        """ Semi-normalized System Test
+
+        When the options conflicts the schema, the compiled function raises an error which has the context of the
+        element.
+        """
+        options = Options(default_min_length_of_string=5, default_max_length_of_string=1)
+        schema = {
+            'type': 'object',
+            'required': ['p1'],
+            'properties': {
+                'p1': {'type': 'array', 'minItems': 2, 'maxItems': 2, 'items': [{'type': 'null'}, {'type': 'string'}]},
+            },
+        }
+
+        generate = ranjg.Factory(schema).compile(options=options)
+
+        with self.assertRaises(GenerateConflictError) as cm:
+            generate()
+        self.assertTupleEqual(cm.exception.context.key_path, ('p1', 1))
+
+    def test_compile_raises_error_lazily(self):
+        """ Normalized System Test
+
+        When the options conflicts the schema of child elements which are never generated, the compiled function
+        doesn't raise error.
+        """
+        options = Options(default_min_length_of_string=5, default_max_length_of_string=1)
+        schema = {'type': 'array', 'maxItems': 0, 'items': {'type': 'string'}}
+
+        generate = ranjg.Factory(schema).compile(options=options)
+
+        self.assertListEqual(generate(), [])
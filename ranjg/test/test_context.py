@@ -29,13 +29,17 @@ class TestContext(unittest.TestCase):
             with self.subTest(clz=clz):
                 schema = {"type": "array", "minItems": 1, "maxItems": 1, "items": items}
                 parent_context = GenerationContext(path, schema)
-                with mock.patch(f'{clz}.gen') as mock_gen:
+                # 要素は gen で1つずつ、または _gen_many でまとめて生成される
+                with mock.patch(f'{clz}.gen') as mock_gen, \
+                        mock.patch.object(clz, '_gen_many', autospec=True, side_effect=clz._gen_many) as mock_gen_many:
                     ranjg.gen(schema, context=parent_context)
 
-                self.assertGreaterEqual(len(mock_gen.call_args_list), 1)
-                for call in mock_gen.call_args_list:
-                    self.assertIn('context', call[1])
-                    self.assertTupleEqual((*path, 0), tuple(call[1]['context'].key_path))
+                contexts = [call[1]['context'] for call in mock_gen.call_args_list if 'context' in call[1]]
+                contexts += [call[0][3] for call in mock_gen_many.call_args_list]
+                self.assertGreaterEqual(len(contexts), 1)
+                self.assertEqual(len(contexts), len(mock_gen.call_args_list) + len(mock_gen_many.call_args_list))
+                for context in contexts:
+                    self.assertTupleEqual((*path, 0), tuple(context.key_path))
 
     def test_gendict_carry_context_over(self):
         case_list = (
@@ -59,3 +63,15 @@ class TestContext(unittest.TestCase):
                 for call in mock_gen.call_args_list:
                     self.assertIn('context', call[1])
                     self.assertTupleEqual((*path, "p1"), tuple(call[1]['context'].key_path))
+
+    def test_resolve(self):
+        """ Normalized System Test
+
+        The key path of a resolved context is built from its ancestors.
+        """
+        root_context = GenerationContext((1, '2'), {})
+        context = root_context.resolve('a', {}).resolve(0, {}).resolve('b', {'type': 'null'})
+
+        self.assertTupleEqual(context.key_path, (1, '2', 'a', 0, 'b'))
+        self.assertDictEqual(context._current_schema, {'type': 'null'})
+        self.assertTupleEqual(root_context.key_path, (1, '2'))
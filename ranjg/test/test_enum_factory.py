@@ -1,5 +1,6 @@
 import unittest
 from typing import Sequence, Dict
+from unittest import mock
 
 from ranjg import Options
 from ranjg.error import SchemaConflictError
@@ -97,6 +98,27 @@ class TestEnumFactory(unittest.TestCase):
                                             "At least 1 value of schema.enum must satisfy the schema"):
                     EnumFactory(schema)
 
+    def test_init_without_validation(self):
+        """ Normalized System Test
+
+        When the validation of the schema is skipped, values in ``schema.enum`` are filtered without jsonschema.
+        """
+        case_list = (
+            ({'enum': ['1', 2.0, 1.5, True], 'type': 'integer'}, (2.0,)),
+            ({'enum': ['1', 2.0, 1.5], 'maximum': 1.9}, ('1', 1.5)),
+            ({'enum': ['a', 'ab', 'b'], 'pattern': 'a', 'maxLength': 1}, ('a',)),
+            ({'enum': [[1], [1, 'a'], {'a': 1}, {'a': 'b'}], 'items': {'type': 'integer'},
+              'properties': {'a': {'type': 'integer', 'multipleOf': 0.5}}}, ([1], {'a': 1})),
+        )
+
+        for schema, expected in case_list:
+            with self.subTest(schema=schema):
+                with mock.patch('jsonschema.validate') as mock_validate:
+                    factory = EnumFactory(schema, schema_is_validated=True)
+
+                self.assertFalse(mock_validate.called)
+                self.assertTupleEqual(factory._enum_values, expected)
+
     def test_init_without_enum_schema(self):
         """ Semi-normalized System Test
 
@@ -0,0 +1,94 @@
+import unittest
+
+import ranjg
+from ranjg import Options
+
+
+class TestExplain(unittest.TestCase):
+    """Test class of ``Factory#explain``
+
+    Test ``ranjg.explain.Explanation``
+    """
+
+    SCHEMA = {
+        'type': 'object',
+        'required': ['id'],
+        'properties': {
+            'id': {'type': 'integer', 'minimum': 1, 'maximum': 9},
+            'tags': {'type': 'array', 'minItems': 2, 'maxItems': 4,
+                     'items': [{'type': 'number', 'minimum': 0, 'maximum': 1}, {'type': 'string', 'maxLength': 3}]},
+        },
+    }
+
+    def test_explain(self):
+        """ Normalized System Test
+
+        Each node shows the concrete class, the resolved parameters and the expected number of values per root value.
+        """
+        explanation = ranjg.Factory(self.SCHEMA).explain(options=Options(default_prob_of_optional_properties=0.5,
+                                                                       default_length_range_of_genstr=1))
+        nodes = explanation.nodes()
+
+        self.assertListEqual([(node.path, node.factory_class, node.depth) for node in nodes],
+                             [('$', 'DictFactory', 0), ('$.id', 'IntFactory', 1), ('$.tags', 'ListFactory', 1),
+                              ('$.tags[]', 'NumFactory', 2), ('$.tags[]', 'StrFactory', 2),
+                              ('$.tags[]', 'NoneFactory', 2)])
+        self.assertListEqual([node.count for node in nodes], [1.0, 1.0, 0.5, 0.5, 0.5, 0.5 * (0 + 1 + 2) / 3])
+        self.assertIn('prob_of_optional_properties=0.5', explanation['$'].details)
+        self.assertEqual(explanation['$.id'].details, 'range=[1, 9]')
+        self.assertEqual(explanation['$.tags'].details, 'items=[2, 4]')
+        self.assertEqual(explanation['$.tags[]'].details, 'range=[0.0, 1.0]')
+        self.assertEqual(nodes[4].details, 'length=[2, 3]')
+        self.assertIn('options.default_schema_of_items', nodes[5].details)
+
+    def test_explain_cost(self):
+        """ Normalized System Test
+
+        The cost of each node includes the costs of its child elements.
+        """
+        explanation = ranjg.Factory(self.SCHEMA).explain()
+        nodes = explanation.nodes()
+
+        self.assertEqual(explanation.cost, nodes[0].cost)
+        self.assertAlmostEqual(explanation['$.tags'].cost - sum(node.cost for node in nodes[3:]),
+                               explanation['$.tags'].count * 2)
+        self.assertGreater(nodes[0].cost, sum(node.cost for node in nodes[1:] if node.depth == 1))
+
+    def test_explain_options(self):
+        """ Normalized System Test
+
+        Factories derived from options are shown with the name of the options, and explaining doesn't affect the
+        statistics of the factory.
+        """
+        options = Options(priority_schema_of_properties={'id': {'type': 'string', 'pattern': '^[0-9]{4}$'}})
+        factory = ranjg.Factory({'type': 'object', 'required': ['id', 'extra'],
+                                 'properties': {'id': {'type': 'integer'}}})
+
+        explanation = factory.explain(options=options)
+
+        self.assertEqual(explanation['$.id'].factory_class, 'StrFactory')
+        self.assertIn('options.priority_schema_of_properties', explanation['$.id'].details)
+        self.assertIn("pattern='^[0-9]{4}$', length=[4, 4]", explanation['$.id'].details)
+        self.assertIn('options.default_schema_of_properties', explanation['$.extra'].details)
+        self.assertEqual(factory.stats()['$'].fallbacks, 0)
+
+    def test_explain_error(self):
+        """ Semi-normalized System Test
+
+        When the options conflict with the schema, the node shows the error instead of raising it.
+        """
+        options = Options(default_min_length_of_string=5, default_max_length_of_string=1)
+        explanation = ranjg.Factory({'type': 'string'}).explain(options=options)
+
+        self.assertTrue(explanation['$'].details.startswith('error: '))
+
+    def test_report(self):
+        """ Normalized System Test
+
+        The report shows nodes indented by depth, and can be limited by depth.
+        """
+        explanation = ranjg.Factory(self.SCHEMA).explain()
+
+        self.assertIn('    $.tags[] NumFactory (range=[0.0, 1.0])', explanation.report())
+        self.assertNotIn('$.tags[]', explanation.report(limit_depth=1))
+        self.assertEqual(str(explanation), explanation.report())
@@ -1,4 +1,6 @@
 import itertools
+import pickle
+import random
 import unittest
 
 from ranjg.factories import *
@@ -66,3 +68,26 @@ class TestFactory(unittest.TestCase):
             with self.subTest(gen_type=gen_type, schema=schema):
                 factory = ranjg.Factory(schema, gen_type=gen_type)
                 self.assertIsInstance(factory, clz)
+
+    def test_pickle(self):
+        """ Normalized System Test
+
+        A factory restored from pickle generates the same values as the original factory.
+        """
+        schema_list = (
+            {'type': 'integer'},
+            {'type': 'string', 'pattern': '^[a-z]{3}[0-9]+$'},
+            {'type': 'array', 'items': [{'type': 'number'}], 'maxItems': 5},
+            {'type': 'object', 'required': ['p1'], 'properties': {'p1': {'type': 'boolean'}, 'p2': {}}},
+            {'type': ['string', 'integer']},
+            {'enum': ['value1', 1]},
+        )
+
+        for schema in schema_list:
+            with self.subTest(schema=schema):
+                factory = ranjg.Factory(schema)
+                restored = pickle.loads(pickle.dumps(factory))
+
+                self.assertIs(type(restored), type(factory))
+                self.assertEqual(restored.gen_many(10, rng=random.Random(1)),
+                                 factory.gen_many(10, rng=random.Random(1)))
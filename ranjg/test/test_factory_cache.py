@@ -0,0 +1,162 @@
+import unittest
+from unittest import mock
+
+import ranjg
+from ranjg import Options
+from ranjg.error import InvalidSchemaError
+from ranjg.factories import IntFactory
+from .._factory_cache import FactoryCache
+
+
+class TestFactoryCache(unittest.TestCase):
+    """Test class of ``FactoryCache``
+
+    Test ``ranjg._factory_cache.FactoryCache``
+    """
+
+    def test_get(self):
+        """ Normalized System Test
+
+        ``FactoryCache#get(schema)`` constructs a factory only once for schemas which are equal as JSON.
+        """
+        cache = FactoryCache(maxsize=2)
+
+        factory = cache.get({'type': 'integer', 'minimum': 0})
+
+        self.assertIsInstance(factory, IntFactory)
+        self.assertIs(cache.get({'minimum': 0, 'type': 'integer'}), factory)
+        self.assertIsNot(cache.get({'type': 'integer', 'minimum': 1}), factory)
+        self.assertTupleEqual(tuple(cache.info()), (1, 2, 2, 2))
+
+    def test_get_validates_once(self):
+        """ Normalized System Test
+
+        The schema is validated only when the factory is constructed.
+        """
+        cache = FactoryCache()
+
+        with mock.patch('ranjg.schemas.validate') as mock_validate:
+            for _ in range(3):
+                cache.get({'type': 'string'})
+
+        self.assertEqual(len(mock_validate.call_args_list), 1)
+
+    def test_get_validates_schemas_in_options(self):
+        """ Normalized System Test
+
+        The factory of a validated schema validates the schemas in options when they are used, and the factory of a
+        schema whose validation is skipped doesn't.
+        """
+        schema = {'type': 'array', 'minItems': 1, 'maxItems': 1}
+        options = Options(default_schema_of_items={'minLength': -1})
+
+        with self.assertRaises(InvalidSchemaError):
+            FactoryCache().get(schema).gen(options=options)
+        self.assertListEqual(FactoryCache().get(schema, schema_is_validated=True).gen(options=options), [None])
+
+    def test_get_validates_factory_constructed_without_validation(self):
+        """ Normalized System Test
+
+        A factory constructed without validation is not returned to a caller which requires validation. The schema is
+        validated, and the factory constructed again is returned to later callers.
+        """
+        cache = FactoryCache()
+        factory = cache.get({'type': 'string'}, schema_is_validated=True)
+
+        with mock.patch('ranjg.schemas.validate') as mock_validate:
+            validated_factory = cache.get({'type': 'string'})
+            self.assertIsNot(validated_factory, factory)
+            self.assertIs(cache.get({'type': 'string'}), validated_factory)
+            self.assertIs(cache.get({'type': 'string'}, schema_is_validated=True), validated_factory)
+        self.assertEqual(len(mock_validate.call_args_list), 1)
+
+        cache.get({'type': 'string', 'minLength': -1}, schema_is_validated=True)
+        with self.assertRaises(InvalidSchemaError):
+            cache.get({'type': 'string', 'minLength': -1})
+
+    def test_get_with_modified_schema(self):
+        """ Normalized System Test
+
+        Modifying the schema after ``FactoryCache#get`` doesn't affect the cached factory.
+        """
+        cache = FactoryCache()
+        schema = {'type': 'integer', 'minimum': 0, 'maximum': 0}
+        factory = cache.get(schema)
+
+        schema['maximum'] = 10
+
+        self.assertEqual(factory.gen(), 0)
+        self.assertIs(cache.get({'type': 'integer', 'minimum': 0, 'maximum': 0}), factory)
+        self.assertIsNot(cache.get(schema), factory)
+
+    def test_get_with_invalid_schema(self):
+        """ Semi-normalized System Test
+
+        When the schema is invalid, ``FactoryCache#get`` raises an error each time.
+        """
+        cache = FactoryCache()
+
+        for _ in range(2):
+            with self.assertRaises(InvalidSchemaError):
+                cache.get({'type': []})
+        self.assertEqual(cache.info().currsize, 0)
+
+    def test_eviction_and_resize(self):
+        """ Normalized System Test
+
+        The least recently used factory is discarded when the cache is full or resized.
+        """
+        cache = FactoryCache(maxsize=2)
+        factory_1 = cache.get({'type': 'integer'})
+        cache.get({'type': 'string'})
+        cache.get({'type': 'integer'})
+        cache.get({'type': 'boolean'})
+
+        self.assertIs(cache.get({'type': 'integer'}), factory_1)
+        self.assertEqual(cache.info().misses, 3)
+        cache.get({'type': 'string'})
+        self.assertEqual(cache.info().misses, 4)
+
+        cache.resize(1)
+        self.assertTupleEqual(tuple(cache.info()), (2, 4, 1, 1))
+        cache.get({'type': 'integer'})
+        self.assertEqual(cache.info().misses, 5)
+
+    def test_disabled(self):
+        """ Normalized System Test
+
+        If ``maxsize`` is 0, no factory is cached.
+        """
+        cache = FactoryCache(maxsize=0)
+
+        self.assertIsNot(cache.get({'type': 'integer'}), cache.get({'type': 'integer'}))
+        self.assertTupleEqual(tuple(cache.info()), (0, 2, 0, 0))
+
+        cache.resize(1)
+        self.assertIs(cache.get({'type': 'integer'}), cache.get({'type': 'integer'}))
+
+        cache.clear()
+        self.assertTupleEqual(tuple(cache.info()), (0, 0, 1, 0))
+
+    def test_illegal_maxsize(self):
+        """ Semi-normalized System Test
+        """
+        with self.assertRaisesRegex(ValueError, 'maxsize must be non-negative'):
+            FactoryCache(maxsize=-1)
+        with self.assertRaisesRegex(ValueError, 'maxsize must be non-negative'):
+            FactoryCache().resize(-1)
+
+    def test_gen_uses_factory_cache(self):
+        """ Normalized System Test
+
+        ``ranjg.gen`` validates the schema only once while its factory is cached in ``ranjg.factory_cache``.
+        """
+        schema = {'type': 'integer', 'minimum': 0, 'maximum': 7}
+        hits = ranjg.factory_cache.info().hits
+
+        with mock.patch('ranjg.schemas.validate') as mock_validate:
+            for _ in range(3):
+                ranjg.gen(schema)
+
+        self.assertLessEqual(len(mock_validate.call_args_list), 1)
+        self.assertGreaterEqual(ranjg.factory_cache.info().hits, hits + 2)
@@ -357,3 +357,157 @@ class TestGen(unittest.TestCase):
         with open(output_file) as fp:
             output = json.load(fp)
         jsonschema.validate(output, schema)
+
+    def test_gen_with_output_format_jsonl(self):
+        """ Normalized System Test
+
+        ``gen(schema, multiplicity, output_file, output_format='jsonl')`` writes each generated value as a line of JSON.
+        """
+        schema = {"type": "object", "required": ["p1"], "properties": {"p1": {"type": "integer"}}}
+        output_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_with_output_format_jsonl_output.jsonl")
+
+        for multiplicity, return_none in itertools.product((0, 1, 3000), (False, True)):
+            with self.subTest(multiplicity=multiplicity, return_none=return_none):
+                generated = gen(schema, multiplicity=multiplicity, output_file=output_file, output_format='jsonl',
+                                return_none=return_none)
+
+                with open(output_file) as fp:
+                    output = [json.loads(line) for line in fp]
+                self.assertEqual(len(output), multiplicity)
+                for output_elem in output:
+                    jsonschema.validate(output_elem, schema)
+                if return_none:
+                    self.assertIsNone(generated)
+                else:
+                    self.assertListEqual(generated, output)
+
+    def test_gen_with_output_format_jsonl_without_multiplicity(self):
+        """ Normalized System Test
+        """
+        schema = {"type": "integer"}
+        output_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_with_output_format_jsonl_without_multiplicity.jsonl")
+
+        generated = gen(schema, output_file=output_file, output_format='jsonl')
+
+        with open(output_file) as fp:
+            self.assertEqual(fp.read(), f"{generated}\n")
+
+    def test_gen_with_illegal_output_format(self):
+        with self.assertRaisesRegex(ValueError, "Illegal argument 'output_format'"):
+            gen({"type": "integer"}, output_format='xml')
+
+    def test_gen_with_multiplicity_and_output_fp(self):
+        """ Normalized System Test
+
+        ``gen(schema, multiplicity, output_fp)`` writes the same JSON as ``json.dump`` of the generated list.
+        """
+        schema = {"type": "object", "required": ["p1"], "properties": {"p1": {"type": "string", "maxLength": 3}}}
+        output_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_with_multiplicity_and_output_fp.json")
+
+        for multiplicity in (0, 1, 3000):
+            with self.subTest(multiplicity=multiplicity):
+                with open(output_file, "w") as fp:
+                    generated = gen(schema, multiplicity=multiplicity, output_fp=fp)
+
+                with open(output_file) as fp:
+                    self.assertEqual(fp.read(), json.dumps(generated))
+
+        with open(output_file, "w") as fp:
+            self.assertIsNone(gen(schema, multiplicity=10, output_fp=fp, return_none=True))
+        with open(output_file) as fp:
+            output = json.load(fp)
+        self.assertEqual(len(output), 10)
+
+    def test_gen_with_workers(self):
+        """ Normalized System Test
+
+        ``gen(schema, output_file_list, workers)`` generates files in parallel. Since each file is generated with the
+        seed derived from its index, the result doesn't depend on the number of workers.
+        """
+        schema = {"type": "object", "required": ["p1", "p2"],
+                  "properties": {"p1": {"type": "integer"}, "p2": {"type": "string"}}}
+        output_file_list = [path.join(self.TEST_TMP_DIR_PRE, f"test_gen_with_workers_{i}.json") for i in range(10)]
+
+        results = []
+        for workers in (None, 1, 3):
+            with self.subTest(workers=workers):
+                random.seed(123)
+                generated = gen(schema, output_file_list=output_file_list, workers=workers)
+
+                self.assertEqual(len(generated), len(output_file_list))
+                for generated_elem, output_file in zip(generated, output_file_list):
+                    with open(output_file) as fp:
+                        self.assertDictEqual(json.load(fp), generated_elem)
+                    jsonschema.validate(generated_elem, schema)
+                results.append(generated)
+
+        self.assertListEqual(results[0], results[1])
+        self.assertListEqual(results[0], results[2])
+
+    def test_gen_with_workers_and_return_none(self):
+        """ Normalized System Test
+        """
+        output_file_list = [path.join(self.TEST_TMP_DIR_PRE, f"test_gen_with_workers_and_return_none_{i}.json")
+                            for i in range(3)]
+
+        generated = gen({"type": "integer"}, output_file_list=output_file_list, workers=2, multiplicity=2,
+                        return_none=True)
+
+        self.assertIsNone(generated)
+        for output_file in output_file_list:
+            with open(output_file) as fp:
+                self.assertEqual(len(json.load(fp)), 2)
+
+    def test_gen_with_illegal_workers(self):
+        output_file_list = [path.join(self.TEST_TMP_DIR_PRE, "test_gen_with_illegal_workers.json")]
+
+        for workers in (0, -1, 1.5, '1'):
+            with self.subTest(workers=workers):
+                with self.assertRaisesRegex(ValueError, "Illegal argument 'workers'"):
+                    gen({"type": "integer"}, output_file_list=output_file_list, workers=workers)
+
+        with self.assertRaisesRegex(ValueError, "workers can be set only with output_file_list"):
+            gen({"type": "integer"}, workers=2)
+
+    def test_gen_with_shard(self):
+        """ Normalized System Test
+
+        ``gen(schema, output_file_list, shard=(i, n))`` generates only the files whose index modulo ``n`` is ``i``,
+        and the files are the same as the files generated without ``shard``.
+        """
+        schema = {"type": "object", "required": ["p1", "p2"],
+                  "properties": {"p1": {"type": "integer"}, "p2": {"type": "string"}}}
+        output_file_list = [path.join(self.TEST_TMP_DIR_PRE, f"test_gen_with_shard_{i}.json") for i in range(10)]
+
+        random.seed(123)
+        expected = gen(schema, output_file_list=output_file_list)
+
+        for shard_index in range(3):
+            for workers in (None, 2):
+                with self.subTest(shard_index=shard_index, workers=workers):
+                    for output_file in output_file_list:
+                        if path.exists(output_file):
+                            os.remove(output_file)
+
+                    random.seed(123)
+                    generated = gen(schema, output_file_list=output_file_list, shard=(shard_index, 3),
+                                    workers=workers)
+
+                    self.assertListEqual(generated, expected[shard_index::3])
+                    for i, output_file in enumerate(output_file_list):
+                        if i % 3 == shard_index:
+                            with open(output_file) as fp:
+                                self.assertDictEqual(json.load(fp), expected[i])
+                        else:
+                            self.assertFalse(path.exists(output_file))
+
+    def test_gen_with_illegal_shard(self):
+        output_file_list = [path.join(self.TEST_TMP_DIR_PRE, "test_gen_with_illegal_shard.json")]
+
+        for shard in ((3, 3), (-1, 3), (0, 0), (0.5, 2), (0, 1, 2)):
+            with self.subTest(shard=shard):
+                with self.assertRaisesRegex(ValueError, "Illegal argument 'shard'"):
+                    gen({"type": "integer"}, output_file_list=output_file_list, shard=shard)
+
+        with self.assertRaisesRegex(ValueError, "shard can be set only with output_file_list"):
+            gen({"type": "integer"}, shard=(0, 2))
@@ -0,0 +1,56 @@
+import unittest
+
+import jsonschema
+
+import ranjg
+
+from .res import sample_schema
+
+
+class TestGenAt(unittest.TestCase):
+    """Test class of ``Factory#gen_at``
+
+    Test ``ranjg.Factory#gen_at``
+    """
+
+    def test_gen_at(self):
+        """ Normalized System Test
+
+        ``Factory#gen_at(index, seed)`` returns the same value for the same index and seed.
+        """
+        schema_list = (
+            sample_schema('boolean'),
+            sample_schema('integer'),
+            sample_schema('number'),
+            sample_schema('string'),
+            sample_schema('array'),
+            {'type': 'object', 'required': ['p1'], 'properties': {'p1': {'type': 'integer'}, 'p2': {}}},
+            {'enum': ['value1', 1, [1, 2]]},
+        )
+
+        for schema in schema_list:
+            with self.subTest(schema=schema):
+                factory = ranjg.Factory(schema)
+
+                generated_list = [factory.gen_at(index, seed=7) for index in range(20)]
+
+                for generated in generated_list:
+                    jsonschema.validate(generated, schema)
+                self.assertListEqual([factory.gen_at(index, seed=7) for index in reversed(range(20))],
+                                     list(reversed(generated_list)))
+
+    def test_gen_at_with_different_index_or_seed(self):
+        """ Normalized System Test
+
+        Values of different indices or different seeds are generated independently.
+        """
+        factory = ranjg.Factory({'type': 'integer', 'minimum': 0, 'maximum': 2 ** 60})
+
+        self.assertEqual(len({factory.gen_at(index, seed=1) for index in range(100)}), 100)
+        self.assertEqual(len({factory.gen_at(1, seed=seed) for seed in range(100)}), 100)
+
+    def test_gen_at_with_negative_index(self):
+        """ Semi-normalized System Test
+        """
+        with self.assertRaisesRegex(ValueError, 'index must be non-negative'):
+            ranjg.Factory({'type': 'integer'}).gen_at(-1, seed=1)
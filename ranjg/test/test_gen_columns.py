@@ -0,0 +1,82 @@
+import array
+import unittest
+
+import jsonschema
+
+import ranjg
+from ranjg import Options
+
+
+class TestGenColumns(unittest.TestCase):
+    """Test class of ``DictFactory#gen_columns``
+
+    Test ``ranjg.factories.DictFactory#gen_columns``
+    """
+
+    def test_gen_columns(self):
+        """ Normalized System Test
+
+        ``DictFactory#gen_columns(n)`` returns columns of ``n`` dicts according to the schema.
+        """
+        schema = {
+            'type': 'object',
+            'required': ['p1', 'p2'],
+            'properties': {
+                'p1': {'type': 'integer'},
+                'p3': {'type': 'string'},
+            },
+        }
+        options = Options(default_schema_of_properties={'type': 'boolean'})
+
+        columns = ranjg.Factory(schema).gen_columns(50, options=options)
+
+        self.assertListEqual(list(columns.keys()), ['p1', 'p2', 'p3'])
+        for key, column in columns.items():
+            self.assertIsInstance(column, list)
+            self.assertEqual(len(column), 50)
+        for values in zip(*columns.values()):
+            generated = {key: value for key, value in zip(columns.keys(), values) if value is not None}
+            jsonschema.validate(generated, schema)
+            self.assertIn('p1', generated)
+            self.assertIn('p2', generated)
+
+    def test_gen_columns_with_use_array(self):
+        """ Normalized System Test
+
+        ``DictFactory#gen_columns(n, use_array=True)`` returns ``array.array`` for required numeric and boolean
+        properties.
+        """
+        schema = {
+            'type': 'object',
+            'required': ['p1', 'p2', 'p3', 'p4', 'p5'],
+            'properties': {
+                'p1': {'type': 'integer'},
+                'p2': {'type': 'number'},
+                'p3': {'type': 'boolean'},
+                'p4': {'type': 'string'},
+                'p5': {'type': 'integer', 'minimum': 2 ** 70},
+                'p6': {'type': 'integer'},
+            },
+        }
+        options = Options(default_prob_of_optional_properties=0.5)
+
+        columns = ranjg.Factory(schema).gen_columns(50, options=options, use_array=True)
+
+        self.assertEqual(columns['p1'].typecode, 'q')
+        self.assertEqual(columns['p2'].typecode, 'd')
+        self.assertEqual(columns['p3'].typecode, 'b')
+        self.assertIsInstance(columns['p4'], list)
+        self.assertIsInstance(columns['p5'], list)
+        self.assertIsInstance(columns['p6'], list)
+        for key, column in columns.items():
+            self.assertEqual(len(column), 50)
+        self.assertTrue(all(value in (0, 1) for value in columns['p3']))
+
+    def test_gen_columns_with_zero(self):
+        """ Normalized System Test
+        """
+        schema = {'type': 'object', 'required': ['p1'], 'properties': {'p1': {'type': 'integer'}, 'p2': {}}}
+
+        columns = ranjg.Factory(schema).gen_columns(0, use_array=True)
+
+        self.assertDictEqual(columns, {'p1': array.array('q'), 'p2': []})
@@ -10,6 +10,7 @@ import unittest
 from unittest.mock import patch
 import jsonschema
 from ranjg.__main__ import main as module_main
+from ranjg.factories import DictFactory
 
 
 class TestGenMain(unittest.TestCase):
@@ -150,6 +151,27 @@ class TestGenMain(unittest.TestCase):
                 for output_elem in output:
                     jsonschema.validate(output_elem, schema)
 
+    def test_gen_main_with_jsonl(self):
+        """ Normalized System Test
+
+        Module execution received an optional argument ``--jsonl``.
+        If it's specified with ``--list``, it outputs each generated value as a line of JSON.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        with open(schema_file) as fp:
+            schema = json.load(fp)
+        test_args = ["__main__.py", schema_file, "--list", "5", "--jsonl"]
+
+        with captured_stdout() as stdout:
+            with patch.object(sys, 'argv', test_args):
+                module_main()
+
+        output_lines = stdout.getvalue().splitlines()
+
+        self.assertEqual(len(output_lines), 5)
+        for output_line in output_lines:
+            jsonschema.validate(json.loads(output_line), schema)
+
     def test_gen_main_with_illegal_multiplicity(self):
         """ Semi-normalized System Test
 
@@ -213,6 +235,273 @@ class TestGenMain(unittest.TestCase):
 
         self.assertFalse(path.exists(output_file.format(num)))
 
+    def test_gen_main_with_num_and_jobs(self):
+        """ Normalized System Test
+
+        Module execution received an optional argument ``--jobs`` with ``-n``.
+        If it's specified, files are generated in parallel.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        output_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_main_with_num_and_jobs_{}.json")
+        num = 10
+
+        test_args = ["__main__.py", schema_file, '-n', str(num), '--json_output', output_file, '--jobs', '2']
+
+        with open(schema_file) as fp:
+            schema = json.load(fp)
+
+        with captured_stdout() as stdout:
+            with patch.object(sys, 'argv', test_args):
+                module_main()
+
+        self.assertEqual(stdout.getvalue(), '')
+        for i in range(num):
+            with open(output_file.format(i)) as fp:
+                generated = json.load(fp)
+            jsonschema.validate(generated, schema)
+
+        self.assertFalse(path.exists(output_file.format(num)))
+
+    def test_gen_main_with_jobs_without_num(self):
+        """ Semi-normalized System Test
+
+        ``--jobs`` can be specified only with ``-n``.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        test_args = ["__main__.py", schema_file, '--jobs', '2']
+
+        with captured_stdout() as stdout, captured_stderr() as stderr:
+            with patch.object(sys, 'argv', test_args):
+                with self.assertRaises(SystemExit) as error_ctx:
+                    module_main()
+                self.assertEqual(error_ctx.exception.code, 2)
+
+        self.assertEqual(stdout.getvalue(), '')
+        self.assertIn("error: the following arguments are required when --jobs is specified: -n", stderr.getvalue())
+
+    def test_gen_main_with_shard(self):
+        """ Normalized System Test
+
+        Module execution received an optional argument ``--shard i/N`` with ``-n`` and ``--seed``.
+        If it's specified, only the files whose index modulo N is i are generated, and they are the same as the files
+        generated without ``--shard``.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        output_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_main_with_shard_{}.json")
+        sharded_output_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_main_with_shard_sharded_{}.json")
+        num = 10
+
+        test_args = ["__main__.py", schema_file, '-n', str(num), '--json_output', output_file, '--seed', '7']
+        sharded_test_args = ["__main__.py", schema_file, '-n', str(num), '--json_output', sharded_output_file,
+                             '--seed', '7', '--shard', '1/4']
+
+        with captured_stdout() as stdout:
+            for args in (test_args, sharded_test_args):
+                with patch.object(sys, 'argv', args):
+                    module_main()
+
+        self.assertEqual(stdout.getvalue(), '')
+        for i in range(num):
+            if i % 4 == 1:
+                with open(output_file.format(i)) as fp, open(sharded_output_file.format(i)) as sharded_fp:
+                    self.assertEqual(sharded_fp.read(), fp.read())
+            else:
+                self.assertFalse(path.exists(sharded_output_file.format(i)))
+
+    def test_gen_main_with_illegal_shard(self):
+        """ Semi-normalized System Test
+
+        ``--shard`` requires ``-n`` and ``--seed``, and its value must be ``i/N`` where ``0 <= i < N``.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        output_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_main_with_illegal_shard_{}.json")
+        case_list = (
+            (['--shard', '0/2', '--seed', '1'], "required when --shard is specified: -n"),
+            (['-n', '2', '-j', output_file, '--shard', '0/2'], "required when --shard is specified: --seed"),
+            (['-n', '2', '-j', output_file, '--seed', '1', '--shard', '2/2'], "argument --shard: invalid shard value"),
+            (['-n', '2', '-j', output_file, '--seed', '1', '--shard', '2'], "argument --shard: invalid shard value"),
+        )
+
+        for args, message in case_list:
+            with self.subTest(args=args):
+                with captured_stdout() as stdout, captured_stderr() as stderr:
+                    with patch.object(sys, 'argv', ["__main__.py", schema_file] + args):
+                        with self.assertRaises(SystemExit) as error_ctx:
+                            module_main()
+                        self.assertEqual(error_ctx.exception.code, 2)
+
+                self.assertEqual(stdout.getvalue(), '')
+                self.assertIn(message, stderr.getvalue())
+
+    def test_gen_main_with_cache_dir(self):
+        """ Normalized System Test
+
+        Module execution received an optional argument ``--cache-dir``.
+        The compiled schema is stored in the directory and the generation with it is the same as without it.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        cache_dir = path.join(self.TEST_TMP_DIR_PRE, "test_gen_main_with_cache_dir")
+
+        outputs = []
+        for args in ([], ['--cache-dir', cache_dir], ['--cache-dir', cache_dir]):
+            with captured_stdout() as stdout:
+                with patch.object(sys, 'argv', ["__main__.py", schema_file, '--seed', '3'] + args):
+                    module_main()
+            outputs.append(stdout.getvalue())
+
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        self.assertEqual(outputs[1], outputs[0])
+        self.assertEqual(outputs[2], outputs[0])
+
+    def test_gen_main_with_no_validate(self):
+        """ Normalized System Test
+
+        Module execution received an optional argument ``--no-validate``.
+        If it's specified, the schema is not validated and the generation is the same as without it.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+
+        outputs = []
+        for args in ([], ['--no-validate']):
+            with captured_stdout() as stdout:
+                with patch.object(sys, 'argv', ["__main__.py", schema_file, '--seed', '5'] + args):
+                    with patch('ranjg.schemas.validate') as mock_validate:
+                        module_main()
+            outputs.append((stdout.getvalue(), mock_validate.called))
+
+        self.assertEqual(outputs[1][0], outputs[0][0])
+        self.assertFalse(outputs[1][1])
+
+    def test_gen_main_with_list_of_objects(self):
+        """ Normalized System Test
+
+        The objects in an array are generated at once with ``DictFactory#_gen_many``, also when a single value is
+        written to stdout or to each file.
+        """
+        schema = {'type': 'array', 'minItems': 100, 'maxItems': 100,
+                  'items': {'type': 'object', 'required': ['id'], 'properties': {'id': {'type': 'integer'}}}}
+        schema_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_main_with_list_of_objects_schema.json")
+        with open(schema_file, 'w') as fp:
+            json.dump(schema, fp)
+        output_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_main_with_list_of_objects_{}.json")
+
+        for args, count in (([], 1), (['-n', '2', '-j', output_file], 2)):
+            with self.subTest(args=args):
+                test_args = ["__main__.py", schema_file] + args
+                with captured_stdout():
+                    with patch.object(sys, 'argv', test_args):
+                        with patch.object(DictFactory, '_gen_many', autospec=True,
+                                          side_effect=DictFactory._gen_many) as gen_mock:
+                            module_main()
+
+                self.assertEqual(gen_mock.call_count, count)
+                self.assertListEqual([call[0][1] for call in gen_mock.call_args_list], [100] * count)
+
+    def test_gen_main_with_profile(self):
+        """ Normalized System Test
+
+        Module execution received an optional argument ``--profile``.
+        If it's specified, the report of profiling is written to stderr.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        test_args = ["__main__.py", schema_file, '--list', '3', '--profile']
+
+        with captured_stdout() as stdout, captured_stderr() as stderr:
+            with patch.object(sys, 'argv', test_args):
+                module_main()
+
+        self.assertEqual(len(json.loads(stdout.getvalue())), 3)
+        self.assertIn("$.name", stderr.getvalue())
+
+    def test_gen_main_with_profile_and_seed(self):
+        """ Normalized System Test
+
+        ``--profile`` doesn't change values generated with ``--seed``.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+
+        for args in ([], ['--list', '3']):
+            with self.subTest(args=args):
+                outputs = []
+                for profile_args in ([], ['--profile']):
+                    test_args = ["__main__.py", schema_file, '--seed', '5'] + args + profile_args
+                    with captured_stdout() as stdout, captured_stderr():
+                        with patch.object(sys, 'argv', test_args):
+                            module_main()
+                    outputs.append(stdout.getvalue())
+
+                self.assertEqual(outputs[1], outputs[0])
+
+    def test_gen_main_with_profile_and_jobs(self):
+        """ Semi-normalized System Test
+
+        ``--profile`` cannot be specified with ``--jobs``.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        output_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_main_with_profile_and_jobs_{}.json")
+        test_args = ["__main__.py", schema_file, '-n', '2', '-j', output_file, '--jobs', '2', '--profile']
+
+        with captured_stdout(), captured_stderr() as stderr:
+            with patch.object(sys, 'argv', test_args):
+                with self.assertRaises(SystemExit) as error_ctx:
+                    module_main()
+                self.assertEqual(error_ctx.exception.code, 2)
+
+        self.assertIn("argument --profile: not allowed with argument --jobs", stderr.getvalue())
+
+    def test_gen_main_with_stats(self):
+        """ Normalized System Test
+
+        Module execution received an optional argument ``--stats``.
+        If it's specified, the statistics of generation are written to stderr.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        options_file = "./test-resources/options-legal-list.json"
+        test_args = ["__main__.py", schema_file, '--list', '3', '--options', options_file, '--stats']
+
+        with captured_stdout() as stdout, captured_stderr() as stderr:
+            with patch.object(sys, 'argv', test_args):
+                module_main()
+
+        self.assertEqual(len(json.loads(stdout.getvalue())), 3)
+        self.assertIn("fallbacks", stderr.getvalue())
+        self.assertRegex(stderr.getvalue(), r"(?m)^ +0 +0 +[1-9][0-9]* +0 +0  \$$")
+
+    def test_gen_main_with_stats_and_jobs(self):
+        """ Semi-normalized System Test
+
+        ``--stats`` cannot be specified with ``--jobs``.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        output_file = path.join(self.TEST_TMP_DIR_PRE, "test_gen_main_with_stats_and_jobs_{}.json")
+        test_args = ["__main__.py", schema_file, '-n', '2', '-j', output_file, '--jobs', '2', '--stats']
+
+        with captured_stdout(), captured_stderr() as stderr:
+            with patch.object(sys, 'argv', test_args):
+                with self.assertRaises(SystemExit) as error_ctx:
+                    module_main()
+                self.assertEqual(error_ctx.exception.code, 2)
+
+        self.assertIn("argument --stats: not allowed with argument --jobs", stderr.getvalue())
+
+    def test_gen_main_explain(self):
+        """ Normalized System Test
+
+        Module execution with the sub-command ``explain`` outputs the tree of factories resolved with the options.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        options_file = "./test-resources/options-legal-list.json"
+        test_args = ["__main__.py", "explain", schema_file, '--options', options_file]
+
+        with captured_stdout() as stdout:
+            with patch.object(sys, 'argv', test_args):
+                module_main()
+
+        lines = stdout.getvalue().splitlines()
+        self.assertIn("$ DictFactory (prob_of_optional_properties=1.0)", lines[1])
+        self.assertIn("$.comment StrFactory (options.priority_schema_of_properties", stdout.getvalue())
+        self.assertTrue(lines[-1].startswith("(estimated cost per root value: "))
+
     def test_gen_main_with_num_without_output_file(self):
         """ Normalized System Test
 
@@ -0,0 +1,121 @@
+import unittest
+from unittest import mock
+
+import jsonschema
+
+import ranjg
+from ranjg import Options
+from ranjg.error import GenerateConflictError
+from ranjg.factories import NoneFactory, BoolFactory, IntFactory, NumFactory, StrFactory, ListFactory, DictFactory, \
+    MultiFactory, EnumFactory
+
+from .res import sample_schema
+
+
+class TestGenMany(unittest.TestCase):
+    """Test class of ``Factory#gen_many``
+
+    Test ``ranjg.Factory#gen_many``
+    """
+
+    def test_gen_many(self):
+        """ Normalized System Test
+
+        ``Factory#gen_many(n)`` returns a list of ``n`` values according to the schema.
+        """
+        case_list = (
+            (NoneFactory, sample_schema('null')),
+            (BoolFactory, sample_schema('boolean')),
+            (IntFactory, sample_schema('integer')),
+            (IntFactory, {'type': 'integer', 'minimum': -2 ** 70, 'maximum': 2 ** 70}),
+            (NumFactory, sample_schema('number')),
+            (StrFactory, sample_schema('string')),
+            (ListFactory, sample_schema('array')),
+            (DictFactory, sample_schema('object')),
+            (DictFactory, {'type': 'object', 'required': ['p1', 'p2'],
+                           'properties': {'p1': {'type': 'integer'}, 'p3': {'type': 'string'}, 'p4': {}}}),
+            (MultiFactory, {'type': ['string', 'integer', 'null']}),
+            (EnumFactory, {'enum': ['value1', 1, [1, 2]]}),
+        )
+
+        for clz, schema in case_list:
+            for n in (0, 1, 50):
+                with self.subTest(clz=clz.__name__, schema=schema, n=n):
+                    factory = ranjg.Factory(schema)
+                    generated_list = factory.gen_many(n)
+
+                    self.assertIsInstance(factory, clz)
+                    self.assertIsInstance(generated_list, list)
+                    self.assertEqual(len(generated_list), n)
+                    for generated in generated_list:
+                        jsonschema.validate(generated, schema)
+
+    def test_gen_many_with_options(self):
+        """ Normalized System Test
+
+        ``Factory#gen_many(n, options)`` uses the options in the same way as ``Factory#gen(options)``.
+        """
+        options = Options(default_prob_of_true_given_bool=1.0)
+
+        generated_list = ranjg.Factory({'type': ['boolean']}).gen_many(10, options=options)
+
+        self.assertListEqual(generated_list, [True] * 10)
+
+    def test_gen_many_with_enum_copy_style(self):
+        """ Normalized System Test
+
+        ``EnumFactory#gen_many(n, options)`` copies values according to ``options.enum_copy_style``.
+        """
+        value = [[1]]
+        factory = ranjg.Factory({'enum': [value]})
+
+        no_copy = factory.gen_many(2, options=Options(enum_copy_style=ranjg.options.NO_COPY))
+        shallow_copy = factory.gen_many(2, options=Options(enum_copy_style=ranjg.options.SHALLOW_COPY))
+        deep_copy = factory.gen_many(2, options=Options(enum_copy_style=ranjg.options.DEEP_COPY))
+
+        for generated in no_copy:
+            self.assertIs(generated, factory._enum_values[0])
+        for generated in shallow_copy:
+            self.assertIsNot(generated, factory._enum_values[0])
+            self.assertIs(generated[0], factory._enum_values[0][0])
+        for generated in deep_copy:
+            self.assertIsNot(generated, factory._enum_values[0])
+            self.assertIsNot(generated[0], factory._enum_values[0][0])
+            self.assertListEqual(generated, value)
+
+    def test_gen_many_with_negative_n(self):
+        """ Semi-normalized System Test
+        """
+        with self.assertRaisesRegex(ValueError, 'n must be non-negative'):
+            ranjg.Factory({'type': 'null'}).gen_many(-1)
+
+    def test_gen_many_of_dict_generates_columns(self):
+        """ Normalized System Test
+
+        ``DictFactory#gen_many(n)`` generates the values of each property at once.
+        """
+        options = Options(default_prob_of_optional_properties=0.5)
+        schema = {'type': 'object', 'required': ['p1'],
+                  'properties': {'p1': {'type': 'integer'}, 'p2': {'type': 'integer', 'minimum': 10}}}
+
+        with mock.patch.object(IntFactory, '_gen_many', autospec=True, side_effect=IntFactory._gen_many) as gen_mock:
+            generated_list = ranjg.Factory(schema).gen_many(100, options=options)
+
+        self.assertEqual(gen_mock.call_count, 2)
+        self.assertListEqual([list(generated.keys()) for generated in generated_list],
+                             [['p1', 'p2'] if 'p2' in generated else ['p1'] for generated in generated_list])
+        for generated in generated_list:
+            jsonschema.validate(generated, schema)
+
+    def test_gen_many_of_list_of_dict_raises_error_with_context(self):
+        """ Semi-normalized System Test
+
+        When the options conflicts the schema, ``gen_many`` raises an error which has the context of the element.
+        """
+        options = Options(default_min_length_of_string=5, default_max_length_of_string=1)
+        schema = {'type': 'array', 'minItems': 3,
+                  'items': {'type': 'object', 'required': ['p1'], 'properties': {'p1': {'type': 'string'}}}}
+
+        with self.assertRaises(GenerateConflictError) as cm:
+            ranjg.Factory(schema).gen_many(2, options=options)
+        self.assertTupleEqual(cm.exception.context.key_path, (0, 'p1'))
@@ -1,13 +1,14 @@
 import itertools
 import unittest
 from typing import Sequence
+from unittest import mock
 
 import jsonschema
 from ranjg import Options
 from ranjg._context import GenerationContext
 from .res import sample_schema
-from ..factories import ListFactory, _get_range_of_length
-from ranjg.error import SchemaConflictError, InvalidSchemaError
+from ..factories import ListFactory, IntFactory, _get_range_of_length
+from ranjg.error import SchemaConflictError, InvalidSchemaError, GenerateConflictError
 
 
 class TestListFactory(unittest.TestCase):
@@ -1050,6 +1051,34 @@ class TestGenlistLengthRange(unittest.TestCase):
                                             '"minItems" must be less than or equal to size of "items".'):
                     _get_range_of_length(schema, GenerationContext.root(schema))
 
+    def test_gen_generates_items_at_once(self):
+        """ Normalized System Test
+
+        ``ListFactory#gen`` generates the items of a list which is not tuple validation at once with ``_gen_many``.
+        """
+        schema = {'type': 'array', 'minItems': 50, 'maxItems': 50, 'items': {'type': 'integer'}}
+
+        with mock.patch.object(IntFactory, '_gen_many', autospec=True, side_effect=IntFactory._gen_many) as gen_mock:
+            generated = ListFactory(schema).gen()
+
+        self.assertEqual(gen_mock.call_count, 1)
+        self.assertEqual(len(generated), 50)
+        jsonschema.validate(generated, schema)
+
+    def test_gen_raises_error_with_context_of_item(self):
+        """ Semi-normalized System Test
+
+        When the items cannot be generated at once, ``ListFactory#gen`` raises an error which has the context of the
+        item.
+        """
+        options = Options(default_min_length_of_string=5, default_max_length_of_string=1)
+        schema = {'type': 'array', 'minItems': 3,
+                  'items': {'type': 'object', 'required': ['p1'], 'properties': {'p1': {'type': 'string'}}}}
+
+        with self.assertRaises(GenerateConflictError) as cm:
+            ListFactory(schema).gen(options=options)
+        self.assertTupleEqual(cm.exception.context.key_path, (0, 'p1'))
+
 
 def _type_to_cls(type_str: str):
     if type_str == "null":
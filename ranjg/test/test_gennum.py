@@ -304,3 +304,33 @@ class TestNumFactory(unittest.TestCase):
                 with self.assertRaisesRegex(SchemaConflictError,
                                             'ExclusiveMinimum value must be lower than the exclusiveMaximum value'):
                     NumFactory(schema)
+
+    def test_gen_with_narrow_exclusive_range(self):
+        """ Normalized System Test
+
+        When the range contains only a few floats, a number in the range is generated without regeneration.
+
+        assert that:
+            Every generated number satisfies the schema.
+        """
+        schema_list = (
+            {"exclusiveMinimum": 1.0, "exclusiveMaximum": 1.0000000000000004},
+            {"exclusiveMinimum": 1.0, "maximum": 1.0000000000000002},
+            {"minimum": -5e-324, "exclusiveMaximum": 5e-324},
+            {"exclusiveMinimum": 0, "exclusiveMaximum": 1e-323},
+        )
+        for schema in schema_list:
+            with self.subTest(schema=schema):
+                factory = NumFactory(schema)
+                for _ in range(100):
+                    jsonschema.validate(factory.gen(), schema)
+
+    def test_with_param_conflict_no_float_in_range(self):
+        """ Semi-normalized System Test
+
+        When there is no float in the range, SchemaConflictError is raised.
+        """
+        schema = {"exclusiveMinimum": 1.0, "exclusiveMaximum": 1.0000000000000002}
+
+        with self.assertRaisesRegex(SchemaConflictError, 'There are no numbers in the range specified by the schema'):
+            NumFactory(schema)
@@ -1,8 +1,10 @@
 import unittest
+from unittest import mock
 
 import jsonschema
 from ranjg import Options
 from ..factories import StrFactory
+from .._regex import sre_parse
 from ranjg.error import InvalidSchemaError, SchemaConflictError, GenerateConflictError
 
 
@@ -247,49 +249,105 @@ class TestStrFactory(unittest.TestCase):
                 self.assertRegex(generated, pattern)
                 jsonschema.validate(generated, schema)
 
-    def test_gen_with_pattern_and_minLength(self):
+    def test_gen_with_pattern_parses_once(self):
         """ Normalized System Test
 
-        When ``schema.pattern`` is specified, the return value satisfies this as regular expression even if it
-        contradicts ``schema.minLength``.
+        ``schema.pattern`` is parsed only once on the construction of ``StrFactory``, not on each generation.
+        """
+        schema = {"pattern": "[a-z]+\\d\\d"}
+
+        with mock.patch('ranjg._regex.sre_parse.parse', wraps=sre_parse.parse) as mock_parse:
+            factory = StrFactory(schema)
+            for _ in range(10):
+                self.assertRegex(factory.gen(), schema["pattern"])
+
+        self.assertEqual(len(mock_parse.call_args_list), 1)
+
+    def test_gen_with_pattern_and_length(self):
+        """ Normalized System Test
+
+        When ``schema.pattern`` is specified with ``schema.minLength`` or ``schema.maxLength``, the return value
+        satisfies all of them.
 
         assert that:
-            When ``schema.pattern`` is valid as regular expression and ``schema.minLength`` contradicts ``pattern``,
-            ``StrFactory(schema).gen()`` returns a string satisfies this regular expression.
+            ``StrFactory(schema).gen()`` returns a string satisfies the regular expression and the length.
         """
-        pattern_list = ("\\d\\d\\d-\\d\\d\\d\\d-\\d\\d\\d",
-                        "[a-z][A-Z]\\d\\d")
-
-        for pattern in pattern_list:
-            with self.subTest(pattern=pattern):
-                schema = {"pattern": pattern, "minLength": 13}
-                generated = StrFactory(schema).gen()
-                self.assertIsInstance(generated, str)
-                self.assertRegex(generated, pattern)
-                with self.assertRaisesRegex(jsonschema.ValidationError, "Failed validating 'minLength'"):
+        schema_list = ({"pattern": "^[a-z]+\\d\\d$", "minLength": 13},
+                       {"pattern": "^[a-z]+\\d\\d$", "maxLength": 4},
+                       {"pattern": "^[a-z]+\\d\\d$", "minLength": 5, "maxLength": 6},
+                       {"pattern": "^SKU-[A-Z]{3}-\\d{4,6}$", "minLength": 13, "maxLength": 13},
+                       {"pattern": "^(ab|c)+$", "minLength": 5, "maxLength": 5},
+                       {"pattern": "^(a|bc)+-\\1$", "minLength": 6, "maxLength": 8},
+                       {"pattern": "^[a-z]+$", "minLength": 200},
+                       {"pattern": "^[a-z]+$", "minLength": 150, "maxLength": 160},
+                       {"pattern": "^(a{150})+$", "maxLength": 1000},
+                       {"pattern": "^abc$", "maxLength": 3},
+                       {"pattern": "[a-z]", "maxLength": 1},
+                       {"pattern": "^(a|bb|ccc)$", "maxLength": 1},
+                       {"pattern": "^(x|yy)$", "minLength": 0, "maxLength": 1},
+                       {"pattern": "foo", "minLength": 5, "maxLength": 6})
+
+        for schema in schema_list:
+            with self.subTest(schema=schema):
+                factory = StrFactory(schema)
+                # Since this is a test of probabilistic events, it should be performed multiple times.
+                for _ in range(20):
+                    generated = factory.gen()
+                    self.assertIsInstance(generated, str)
                     jsonschema.validate(generated, schema)
 
-    def test_gen_with_pattern_and_maxLength(self):
+    def test_gen_with_pattern_and_conflicting_length(self):
+        """ Semi-normalized System Test
+
+        When no string matching ``schema.pattern`` has a length between ``schema.minLength`` and
+        ``schema.maxLength``, ``StrFactory(schema)`` raises SchemaConflictError.
+        """
+        schema_list = ({"pattern": "^\\d\\d\\d-\\d\\d\\d\\d-\\d\\d\\d$", "minLength": 13},
+                       {"pattern": "\\A[a-z][A-Z]\\d\\d\\Z", "minLength": 13},
+                       {"pattern": "\\d\\d\\d-\\d\\d\\d\\d-\\d\\d\\d", "maxLength": 3},
+                       {"pattern": "[a-z][A-Z]\\d\\d", "maxLength": 3},
+                       {"pattern": "^abc$", "maxLength": 2},
+                       {"pattern": "foo", "maxLength": 2},
+                       {"pattern": "[a-z]", "maxLength": 0},
+                       {"pattern": "^(a|bb|ccc)$", "minLength": 4},
+                       {"pattern": "^(bb|ccc)$", "maxLength": 1})
+
+        for schema in schema_list:
+            with self.subTest(schema=schema):
+                with self.assertRaisesRegex(SchemaConflictError,
+                                            'No string matching "pattern" has a length between "minLength" '
+                                            'and "maxLength".'):
+                    StrFactory(schema)
+
+    def test_gen_with_unanchored_pattern_and_min_length(self):
         """ Normalized System Test
 
-        When ``schema.pattern`` is specified, the return value satisfies this as regular expression even if it
-        contradicts ``schema.maxLength``.
+        ``schema.pattern`` matches anywhere in a string. When the pattern is not anchored at both ends and every
+        string matching it is shorter than ``schema.minLength``, the match is padded to satisfy the length.
+        """
+        schema_list = ({"pattern": "\\d\\d\\d-\\d\\d\\d\\d-\\d\\d\\d", "minLength": 13},
+                       {"pattern": "^[a-z][A-Z]\\d\\d", "minLength": 13, "maxLength": 15},
+                       {"pattern": "[a-z][A-Z]\\d\\d$", "minLength": 13, "maxLength": 13},
+                       {"pattern": "\\bfoo\\b", "minLength": 10, "maxLength": 12})
+
+        for schema in schema_list:
+            with self.subTest(schema=schema):
+                factory = StrFactory(schema)
+                # Since this is a test of probabilistic events, it should be performed multiple times.
+                for _ in range(20):
+                    jsonschema.validate(factory.gen(), schema)
+
+    def test_gen_with_negated_character_class(self):
+        """ Normalized System Test
 
-        assert that:
-            When ``schema.pattern`` is valid as regular expression and ``schema.maxLength`` contradicts ``pattern``,
-            ``StrFactory(schema).gen()`` returns a string satisfies this regular expression.
+        A negated character class which excludes all ASCII characters generates other characters, and a character
+        class which no character matches causes SchemaConflictError.
         """
-        pattern_list = ("\\d\\d\\d-\\d\\d\\d\\d-\\d\\d\\d",
-                        "[a-z][A-Z]\\d\\d")
+        schema = {"pattern": "^[^\\x00-\\x7f]{3}$"}
+        jsonschema.validate(StrFactory(schema).gen(), schema)
 
-        for pattern in pattern_list:
-            with self.subTest(pattern=pattern):
-                schema = {"pattern": pattern, "maxLength": 3}
-                generated = StrFactory(schema).gen()
-                self.assertIsInstance(generated, str)
-                self.assertRegex(generated, pattern)
-                with self.assertRaisesRegex(jsonschema.ValidationError, "Failed validating 'maxLength'"):
-                    jsonschema.validate(generated, schema)
+        with self.assertRaisesRegex(SchemaConflictError, 'No character matches a character class'):
+            StrFactory({"pattern": "[^\\x00-\\U0010ffff]"})
 
     def test_gen_with_illegal_pattern(self):
         """ Semi-normalized System Test
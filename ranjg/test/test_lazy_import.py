@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import unittest
+
+
+class TestLazyImport(unittest.TestCase):
+    """Test class of lazy imports
+
+    Test that heavy dependencies are imported only when they are used.
+    """
+
+    def _imported_modules(self, code: str, modules) -> list:
+        # 既に import 済みのモジュールの影響を受けないよう、別のプロセスで確認する
+        code += f"\nimport sys\nprint(','.join(m for m in {tuple(modules)!r} if m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True)
+        return [m for m in result.stdout.decode().strip().split(',') if m]
+
+    def test_import_ranjg(self):
+        """ Normalized System Test
+
+        ``import ranjg`` doesn't import jsonschema and numpy.
+        """
+        self.assertListEqual(self._imported_modules("import ranjg", ("jsonschema", "numpy")), [])
+
+    def test_gen_without_validation(self):
+        """ Normalized System Test
+
+        The generation with a validated schema doesn't import jsonschema, and the generation with a schema to be
+        validated imports it.
+        """
+        code = "import ranjg\nranjg.gen({'type': 'string'}, schema_is_validated=True)"
+        self.assertListEqual(self._imported_modules(code, ("jsonschema",)), [])
+
+        code = "import ranjg\nranjg.gen({'type': 'string'})"
+        self.assertListEqual(self._imported_modules(code, ("jsonschema",)), ["jsonschema"])
+
+    def test_gen_without_validation_of_enum_and_options(self):
+        """ Normalized System Test
+
+        The generation with a validated schema doesn't import jsonschema even if the schema has ``enum`` or factories
+        are derived from schemas in options.
+        """
+        code = "import ranjg\nranjg.gen({'type': 'integer', 'enum': [1, 'a']}, schema_is_validated=True)"
+        self.assertListEqual(self._imported_modules(code, ("jsonschema",)), [])
+
+        code = ("import ranjg\n"
+                "options = ranjg.Options(default_schema_of_items={'type': 'string'})\n"
+                "ranjg.gen({'type': 'array', 'minItems': 1}, options=options, schema_is_validated=True)")
+        self.assertListEqual(self._imported_modules(code, ("jsonschema",)), [])
+
+    def test_main_without_validation(self):
+        """ Normalized System Test
+
+        ``python -m ranjg --no-validate`` doesn't import jsonschema.
+        """
+        code = ("import io\nimport sys\n"
+                "from ranjg.__main__ import main\n"
+                "sys.argv = ['ranjg', './test-resources/schema-legal-list.json', '--no-validate',\n"
+                "            '--options', './test-resources/options-legal.json']\n"
+                "stdout, sys.stdout = sys.stdout, io.StringIO()\n"
+                "main()\n"
+                "sys.stdout = stdout")
+        self.assertListEqual(self._imported_modules(code, ("jsonschema",)), [])
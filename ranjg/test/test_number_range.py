@@ -1,7 +1,7 @@
 import itertools
 import unittest
 
-from .._number_range import _from_schema, _normalize_minimum, _normalize_maximum
+from .._number_range import NumberRange, _from_schema, _normalize_minimum, _normalize_maximum, _next_after
 
 
 class TestFromSchema(unittest.TestCase):
@@ -301,3 +301,45 @@ class TestNormalizeMaximum(unittest.TestCase):
                                                                          exclusive_maximum=exclusive_maximum)
                 self.assertEqual(generated_maximum, expected_maximum)
                 self.assertEqual(generated_ex_max, expected_exclusive_maximum)
+
+
+class TestNumberRange(unittest.TestCase):
+    """Test class of ``NumberRange``
+
+    Test ``ranjg._number_range.NumberRange``
+    """
+
+    def test_to_inclusive_float(self):
+        """ Normalized System Test
+
+        Exclusive bounds are replaced with the adjacent floats in the range.
+        """
+        case_list = (
+            (NumberRange(1.0, 2.0, False, False), (1.0, 2.0)),
+            (NumberRange(1.0, 2.0, True, False), (1.0000000000000002, 2.0)),
+            (NumberRange(1.0, 2.0, False, True), (1.0, 1.9999999999999998)),
+            (NumberRange(0, 0, True, True), (5e-324, -5e-324)),
+            (NumberRange(2 ** 53 + 1, 2 ** 53 + 1, False, False), (9007199254740994.0, 9007199254740992.0)),
+        )
+        for number_range, expected in case_list:
+            with self.subTest(number_range=number_range):
+                self.assertTupleEqual(number_range.to_inclusive_float(), expected)
+
+    def test_next_after(self):
+        """ Normalized System Test
+
+        ``_next_after`` returns the same as ``math.nextafter``.
+        """
+        case_list = (
+            (1.0, 2.0, 1.0000000000000002),
+            (1.0, 0.0, 0.9999999999999999),
+            (-1.0, 0.0, -0.9999999999999999),
+            (-1.0, -2.0, -1.0000000000000002),
+            (0.0, 1.0, 5e-324),
+            (0.0, -1.0, -5e-324),
+            (1.0, 1.0, 1.0),
+            (1.7976931348623157e+308, float('inf'), float('inf')),
+        )
+        for x, y, expected in case_list:
+            with self.subTest(x=x, y=y):
+                self.assertEqual(_next_after(x, y), expected)
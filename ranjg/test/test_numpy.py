@@ -0,0 +1,128 @@
+import json
+import random
+import unittest
+from unittest import mock
+
+import jsonschema
+
+import ranjg
+from ranjg import Options
+from ranjg.error import GenerateError
+from .. import _numpy
+from .._numpy import NUMPY_THRESHOLD
+
+
+@unittest.skipIf(_numpy.load_numpy() is None, 'NumPy is not installed')
+class TestNumpy(unittest.TestCase):
+    """Test class of generation with NumPy
+
+    Test ``Factory#gen_many`` which uses NumPy if it is installed and ``options.use_numpy`` is True.
+    """
+    options = Options(use_numpy=True)
+
+    def test_gen_many(self):
+        """ Normalized System Test
+
+        Values generated with NumPy are python objects according to the schema.
+        """
+        case_list = (
+            ({'type': 'boolean'}, bool),
+            ({'type': 'integer'}, int),
+            ({'type': 'integer', 'minimum': -2 ** 63, 'maximum': 2 ** 63 - 1}, int),
+            ({'type': 'integer', 'minimum': -2 ** 70, 'maximum': 2 ** 70}, int),
+            ({'type': 'number'}, float),
+            ({'type': 'number', 'exclusiveMinimum': 1, 'exclusiveMaximum': 1.0000000000000004}, float),
+            ({'type': 'number', 'minimum': 3, 'maximum': 3}, float),
+            ({'enum': ['value1', 1, [1, 2]]}, object),
+        )
+
+        for schema, value_type in case_list:
+            with self.subTest(schema=schema):
+                n = NUMPY_THRESHOLD * 4
+                generated_list = ranjg.Factory(schema).gen_many(n, options=self.options)
+
+                self.assertEqual(len(generated_list), n)
+                for generated in generated_list:
+                    self.assertIsInstance(generated, value_type)
+                    jsonschema.validate(generated, schema)
+                json.dumps(generated_list)
+
+    def test_gen_many_with_prob_of_true(self):
+        """ Normalized System Test
+        """
+        factory = ranjg.Factory({'type': 'boolean'})
+
+        self.assertListEqual(factory.gen_many(NUMPY_THRESHOLD, options=Options(default_prob_of_true_given_bool=1.0,
+                                                                                  use_numpy=True)),
+                             [True] * NUMPY_THRESHOLD)
+        self.assertListEqual(factory.gen_many(NUMPY_THRESHOLD, options=Options(default_prob_of_true_given_bool=0.0,
+                                                                                  use_numpy=True)),
+                             [False] * NUMPY_THRESHOLD)
+
+    def test_gen_many_of_number_raise_error_by_inf(self):
+        """ Semi-normalized System Test
+        """
+        factory = ranjg.Factory({'type': 'number',
+                                 'minimum': -1.7976931348623157e+308,
+                                 'maximum': 1.7976931348623157e+308})
+
+        with self.assertRaisesRegex(GenerateError, 'Error by too large or too small maximum or minimum'):
+            factory.gen_many(NUMPY_THRESHOLD, options=self.options)
+
+    def test_gen_list(self):
+        """ Normalized System Test
+
+        Items of large list are generated with NumPy.
+        """
+        schema = {'type': 'array', 'minItems': NUMPY_THRESHOLD, 'items': {'type': 'integer'}}
+
+        with mock.patch('ranjg._numpy.numpy.random.default_rng', wraps=_numpy.numpy.random.default_rng) as rng_mock:
+            generated = ranjg.Factory(schema).compile(options=self.options)()
+
+        rng_mock.assert_called_once()
+        jsonschema.validate(generated, schema)
+
+    def test_gen_many_without_use_numpy(self):
+        """ Normalized System Test
+
+        NumPy is not used unless ``options.use_numpy`` is True, so seeded values don't depend on whether NumPy is
+        installed.
+        """
+        case_list = (
+            {'type': 'boolean'},
+            {'type': 'integer'},
+            {'type': 'number'},
+            {'enum': ['value1', 1, [1, 2]]},
+            {'type': 'array', 'minItems': NUMPY_THRESHOLD, 'items': {'type': 'integer'}},
+            {'type': 'object', 'properties': {'p': {'type': 'boolean'}}},
+        )
+
+        for schema in case_list:
+            with self.subTest(schema=schema):
+                factory = ranjg.Factory(schema)
+                with mock.patch('ranjg._numpy.numpy.random.default_rng') as rng_mock:
+                    generated_list = factory.gen_many(NUMPY_THRESHOLD, rng=random.Random(1))
+                rng_mock.assert_not_called()
+
+                with mock.patch('ranjg._numpy.numpy', None):
+                    generated_list_without_numpy = factory.gen_many(NUMPY_THRESHOLD, rng=random.Random(1))
+                self.assertListEqual(generated_list, generated_list_without_numpy)
+
+    def test_gen_many_without_numpy(self):
+        """ Normalized System Test
+
+        If NumPy is not installed, values are generated without NumPy.
+        """
+        case_list = (
+            {'type': 'boolean'},
+            {'type': 'integer'},
+            {'type': 'number'},
+            {'enum': ['value1', 1, [1, 2]]},
+        )
+
+        for schema in case_list:
+            with self.subTest(schema=schema), mock.patch('ranjg._numpy.numpy', None):
+                generated_list = ranjg.Factory(schema).gen_many(NUMPY_THRESHOLD, options=self.options)
+
+                for generated in generated_list:
+                    jsonschema.validate(generated, schema)
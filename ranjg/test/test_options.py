@@ -44,6 +44,12 @@ class TestOptions(unittest.TestCase):
         with self.assertRaisesRegex(OptionsFileIOError, options_file):
             ranjg.options.load(options_file)
 
+    def test_load_illegal_value(self):
+        options_file = "./test-resources/options-illegal-value.json"
+
+        with self.assertRaisesRegex(OptionsFileIOError, "default_prob_of_optional_properties must be a number"):
+            ranjg.options.load(options_file)
+
     def test_load_invalid_as_json(self):
         options_file = "./test-resources/json-illegal.json"
 
@@ -64,13 +70,17 @@ class TestOptions(unittest.TestCase):
             with self.subTest(clz=clz):
                 options = Options()
                 schema = {"type": "array", "minItems": 1, "maxItems": 1, "items": items}
-                with mock.patch(f'{clz}.gen') as mock_gen:
+                # 要素は gen で1つずつ、または _gen_many でまとめて生成される
+                with mock.patch(f'{clz}.gen') as mock_gen, \
+                        mock.patch.object(clz, '_gen_many', autospec=True, side_effect=clz._gen_many) as mock_gen_many:
                     ranjg.gen(schema, options=options)
 
-                self.assertGreaterEqual(len(mock_gen.call_args_list), 1)
-                for call in mock_gen.call_args_list:
-                    self.assertIn('options', call[1])
-                    self.assertIs(options, call[1]['options'])
+                options_list = [call[1]['options'] for call in mock_gen.call_args_list if 'options' in call[1]]
+                options_list += [call[0][2] for call in mock_gen_many.call_args_list]
+                self.assertGreaterEqual(len(options_list), 1)
+                self.assertEqual(len(options_list), len(mock_gen.call_args_list) + len(mock_gen_many.call_args_list))
+                for passed_options in options_list:
+                    self.assertIs(options, passed_options)
 
     def test_gendict_carry_options_over(self):
         case_list = (
@@ -188,3 +198,31 @@ class TestOptions(unittest.TestCase):
                                           ('priority_schema_of_properties', 'p1', *path_suffix))
                     if len(path_suffix) == 0:
                         self.assertTrue(context._is_for_options)
+
+    def test_factory_from_options_is_constructed_once(self):
+        """ Normalized System Test
+
+        A factory constructed with a schema in options is reused while the same options are used.
+        """
+        case_list = (
+            ({"type": "array", "minItems": 3, "maxItems": 3}, 'default_schema_of_items'),
+            ({"type": "object", "required": ["p1"]}, 'default_schema_of_properties'),
+            ({"type": "object", "required": ["p1"]}, 'priority_schema_of_properties'),
+        )
+
+        for schema, option_name in case_list:
+            with self.subTest(option_name=option_name):
+                if option_name == 'priority_schema_of_properties':
+                    options = Options(priority_schema_of_properties={'p1': sample_schema('string')})
+                else:
+                    options = Options(**{option_name: sample_schema('string')})
+                factory = ranjg.Factory(schema)
+
+                with mock.patch('ranjg.schemas.validate') as mock_validate:
+                    for _ in range(5):
+                        factory.gen(options=options)
+                    self.assertEqual(len(mock_validate.call_args_list), 1)
+
+                    # 異なる options を使用する場合は改めて構築する
+                    factory.gen(options=options._replace())
+                    self.assertEqual(len(mock_validate.call_args_list), 2)
@@ -0,0 +1,115 @@
+import json
+import random
+import unittest
+
+import ranjg
+from ranjg import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    """Test class of ``Profiler``
+
+    Test ``ranjg.profiling.Profiler``
+    """
+
+    SCHEMA = {
+        'type': 'object',
+        'required': ['orders'],
+        'properties': {
+            'orders': {
+                'type': 'array', 'minItems': 2, 'maxItems': 2,
+                'items': {'type': 'object', 'required': ['sku'],
+                          'properties': {'sku': {'type': 'string', 'pattern': '^[A-Z]{3}$'}}},
+            },
+        },
+    }
+
+    def test_profile(self):
+        """ Normalized System Test
+
+        While a profiler is active, calls and bytes of generation are recorded for each path.
+        """
+        with Profiler() as profiler:
+            generated = ranjg.gen(self.SCHEMA, multiplicity=5)
+
+        profiles = {profile.path: profile for profile in profiler.profiles()}
+
+        self.assertSetEqual(set(profiles.keys()), {'$', '$.orders', '$.orders[]', '$.orders[].sku'})
+        self.assertListEqual([profiles[path].calls for path in ('$', '$.orders', '$.orders[]', '$.orders[].sku')],
+                             [5, 5, 10, 10])
+        self.assertEqual(profiles['$.orders[].sku'].bytes, 10 * len('"ABC"'))
+        self.assertEqual(profiles['$'].bytes, sum(len(json.dumps(value)) for value in generated))
+        self.assertGreaterEqual(profiles['$'].time, profiles['$.orders'].time)
+        self.assertIn('$.orders[].sku', profiler.report())
+
+    def test_profile_compile(self):
+        """ Normalized System Test
+
+        ``compile`` and ``gen_many`` are also recorded while a profiler is active.
+        """
+        factory = ranjg.Factory(self.SCHEMA)
+
+        with Profiler() as profiler:
+            generate = factory.compile()
+            generate()
+            factory.gen_many(3)
+
+        profiles = {profile.path: profile for profile in profiler.profiles()}
+        self.assertEqual(profiles['$'].calls, 4)
+        self.assertEqual(profiles['$.orders[].sku'].calls, 8)
+
+    def test_profile_keeps_generated_values(self):
+        """ Normalized System Test
+
+        A profiler doesn't change values generated with the same seed.
+        """
+        factory = ranjg.Factory(self.SCHEMA)
+        cases = (
+            lambda rng: ranjg.gen(self.SCHEMA, rng=rng),
+            lambda rng: ranjg.gen(self.SCHEMA, multiplicity=5, rng=rng),
+            lambda rng: factory.compile(rng=rng)(),
+            lambda rng: factory.gen_many(5, rng=rng),
+        )
+
+        for index, gen in enumerate(cases):
+            with self.subTest(index=index):
+                expected = gen(random.Random(7))
+                with Profiler():
+                    profiled = gen(random.Random(7))
+
+                self.assertEqual(profiled, expected)
+
+    def test_profile_nested_list(self):
+        """ Normalized System Test
+
+        Child elements of lists in lists are recorded at their absolute paths.
+        """
+        schema = {'type': 'array', 'minItems': 2, 'maxItems': 2,
+                  'items': {'type': 'array', 'minItems': 3, 'maxItems': 3,
+                            'items': {'type': 'object', 'required': ['id'], 'properties': {'id': {'type': 'integer'}}}}}
+
+        with Profiler() as profiler:
+            ranjg.Factory(schema).gen_many(2)
+
+        profiles = {profile.path: profile for profile in profiler.profiles()}
+        self.assertSetEqual(set(profiles.keys()), {'$', '$[]', '$[][]', '$[][].id'})
+        self.assertListEqual([profiles[path].calls for path in ('$', '$[]', '$[][]', '$[][].id')], [2, 4, 12, 12])
+
+    def test_inactive(self):
+        """ Normalized System Test
+
+        After a profiler is deactivated, nothing is recorded.
+        """
+        with Profiler() as profiler:
+            pass
+        ranjg.gen(self.SCHEMA)
+
+        self.assertListEqual(profiler.profiles(), [])
+
+    def test_nested_profiler(self):
+        """ Semi-normalized System Test
+        """
+        with Profiler():
+            with self.assertRaisesRegex(RuntimeError, 'Another profiler is already active'):
+                with Profiler():
+                    pass
@@ -0,0 +1,89 @@
+import random
+import sys
+import unittest
+from test.support import captured_stdout
+from unittest.mock import patch
+
+import ranjg
+from ranjg.__main__ import main as module_main
+
+from .res import sample_schema
+
+
+class TestRng(unittest.TestCase):
+    """Test class of generation with ``rng``
+
+    Test the argument ``rng`` of ``Factory#gen``, ``Factory#compile``, ``Factory#gen_many`` and ``ranjg.gen``.
+    """
+
+    SCHEMA_LIST = (
+        sample_schema('null'),
+        sample_schema('boolean'),
+        sample_schema('integer'),
+        sample_schema('number'),
+        sample_schema('string'),
+        {'type': 'string', 'pattern': '^[0-9]{3}-[A-Z]{2}$'},
+        sample_schema('array'),
+        {'type': 'array', 'minItems': 100, 'maxItems': 100, 'items': {'type': 'number'}},
+        sample_schema('object'),
+        {'type': 'object', 'required': ['p1'], 'properties': {'p1': {'type': 'integer'}, 'p2': {}}},
+        {'type': ['string', 'integer']},
+        {'enum': ['value1', 1, [1, 2]]},
+    )
+
+    def test_gen_with_rng(self):
+        """ Normalized System Test
+
+        With ``random.Random`` of the same seed, the same value is generated, and the module ``random`` is not used.
+        """
+        for schema in self.SCHEMA_LIST:
+            with self.subTest(schema=schema):
+                factory = ranjg.Factory(schema)
+                state = random.getstate()
+
+                generated_1 = [factory.gen(rng=random.Random(1)) for _ in range(3)]
+                generated_2 = [factory.gen(rng=random.Random(1)) for _ in range(3)]
+
+                self.assertEqual(random.getstate(), state)
+                self.assertListEqual(generated_1, generated_2)
+
+    def test_compile_and_gen_many_with_rng(self):
+        """ Normalized System Test
+        """
+        for schema in self.SCHEMA_LIST:
+            with self.subTest(schema=schema):
+                factory = ranjg.Factory(schema)
+                state = random.getstate()
+
+                generate_1 = factory.compile(rng=random.Random(1))
+                generate_2 = factory.compile(rng=random.Random(1))
+                self.assertListEqual([generate_1() for _ in range(3)], [generate_2() for _ in range(3)])
+
+                self.assertListEqual(factory.gen_many(100, rng=random.Random(1)),
+                                     factory.gen_many(100, rng=random.Random(1)))
+                self.assertEqual(random.getstate(), state)
+
+    def test_ranjg_gen_with_rng(self):
+        """ Normalized System Test
+        """
+        schema = {'type': 'object', 'required': ['p1'], 'properties': {'p1': {'type': 'string'}, 'p2': {}}}
+
+        self.assertListEqual(ranjg.gen(schema, multiplicity=10, rng=random.Random(2)),
+                             ranjg.gen(schema, multiplicity=10, rng=random.Random(2)))
+
+    def test_gen_main_with_seed(self):
+        """ Normalized System Test
+
+        Module execution received an optional argument ``--seed``. With the same seed, the same result is output.
+        """
+        schema_file = "./test-resources/schema-legal-user_object.json"
+        test_args = ["__main__.py", schema_file, "--list", "5", "--seed", "3"]
+
+        outputs = []
+        for _ in range(2):
+            with captured_stdout() as stdout:
+                with patch.object(sys, 'argv', test_args):
+                    module_main()
+            outputs.append(stdout.getvalue())
+
+        self.assertEqual(outputs[0], outputs[1])
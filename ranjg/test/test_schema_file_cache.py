@@ -0,0 +1,87 @@
+import json
+import os
+from os import path
+import random
+import shutil
+import unittest
+from unittest import mock
+
+import ranjg
+from .._schema_file_cache import load_schema_file
+
+
+class TestSchemaFileCache(unittest.TestCase):
+    """Test class of ``load_schema_file``
+
+    Test ``ranjg._schema_file_cache.load_schema_file``
+    """
+
+    #: str: The path of directory where tests output file.
+    TEST_TMP_DIR = "./test-tmp/test_schema_file_cache"
+    #: str: The path of directory where tests output file.
+    TEST_TMP_DIR_PRE = path.join(TEST_TMP_DIR, f"{random.randint(0, 2 ** 64):X}")
+
+    @classmethod
+    def setUpClass(cls):
+        if path.exists(cls.TEST_TMP_DIR_PRE):
+            shutil.rmtree(cls.TEST_TMP_DIR_PRE)
+        os.makedirs(cls.TEST_TMP_DIR_PRE, exist_ok=True)
+
+    def _write_schema(self, name: str, schema: dict) -> str:
+        schema_file = path.join(self.TEST_TMP_DIR_PRE, name)
+        with open(schema_file, 'w') as fp:
+            json.dump(schema, fp)
+        return schema_file
+
+    def test_load_schema_file(self):
+        """ Normalized System Test
+
+        ``load_schema_file`` stores the factory in the cache directory, and later calls use it without loading and
+        validating the schema.
+        """
+        schema = {'type': 'object', 'required': ['p1'], 'properties': {'p1': {'type': 'integer'}}}
+        schema_file = self._write_schema('test_load_schema_file.json', schema)
+        cache_dir = path.join(self.TEST_TMP_DIR_PRE, 'test_load_schema_file')
+
+        self.assertDictEqual(load_schema_file(schema_file, cache_dir), schema)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        with mock.patch('ranjg.schemas.load') as mock_load, mock.patch('ranjg.schemas.validate') as mock_validate:
+            loaded = load_schema_file(schema_file, cache_dir)
+            generated = ranjg.gen(loaded, schema_is_validated=True)
+
+        self.assertDictEqual(loaded, schema)
+        self.assertIsInstance(generated['p1'], int)
+        mock_load.assert_not_called()
+        mock_validate.assert_not_called()
+
+    def test_load_modified_schema_file(self):
+        """ Normalized System Test
+
+        When the content of the schema file is changed, the cached factory is not used.
+        """
+        schema_file = self._write_schema('test_load_modified_schema_file.json', {'type': 'integer'})
+        cache_dir = path.join(self.TEST_TMP_DIR_PRE, 'test_load_modified_schema_file')
+        load_schema_file(schema_file, cache_dir)
+
+        self._write_schema('test_load_modified_schema_file.json', {'type': 'string'})
+
+        self.assertDictEqual(load_schema_file(schema_file, cache_dir), {'type': 'string'})
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_load_schema_file_with_broken_cache(self):
+        """ Semi-normalized System Test
+
+        When the cache file is broken, the schema is loaded as usual and the cache file is rewritten.
+        """
+        schema_file = self._write_schema('test_load_schema_file_with_broken_cache.json', {'type': 'null'})
+        cache_dir = path.join(self.TEST_TMP_DIR_PRE, 'test_load_schema_file_with_broken_cache')
+        load_schema_file(schema_file, cache_dir)
+        cache_file = path.join(cache_dir, os.listdir(cache_dir)[0])
+        with open(cache_file, 'wb') as fp:
+            fp.write(b'broken')
+
+        self.assertDictEqual(load_schema_file(schema_file, cache_dir), {'type': 'null'})
+        with mock.patch('ranjg.schemas.validate') as mock_validate:
+            load_schema_file(schema_file, cache_dir)
+        mock_validate.assert_not_called()
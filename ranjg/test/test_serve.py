@@ -0,0 +1,265 @@
+import json
+import os
+from os import path
+import random
+import shutil
+import socket
+import threading
+import unittest
+from unittest import mock
+import urllib.error
+import urllib.request
+
+import jsonschema
+
+import ranjg
+from .._serve import GenerationService, RequestError, make_unix_server, make_http_server, _CHUNK_SIZE
+from ..error import GenerateError
+
+
+class TestGenerationService(unittest.TestCase):
+    """Test class of ``GenerationService``
+
+    Test ``ranjg._serve.GenerationService``
+    """
+
+    def test_prepare(self):
+        """ Normalized System Test
+
+        ``GenerationService#prepare(request)`` returns the number of values and a function which generates them as
+        JSON Lines. With the same seed, the same values are generated.
+        """
+        service = GenerationService()
+        schema = {'type': 'object', 'required': ['p1'], 'properties': {'p1': {'type': 'integer'}}}
+        # 一度に生成する値の数を超える数を要求する
+        request = {'schema': schema, 'n': 1100, 'seed': 1}
+
+        results = []
+        for _ in range(2):
+            n, generate_lines = service.prepare(request)
+            lines = ''.join(generate_lines()).splitlines()
+
+            self.assertEqual(n, 1100)
+            self.assertEqual(len(lines), 1100)
+            for line in lines[:10]:
+                jsonschema.validate(json.loads(line), schema)
+            results.append(lines)
+
+        self.assertListEqual(results[0], results[1])
+
+    def test_prepare_with_options(self):
+        """ Normalized System Test
+        """
+        service = GenerationService()
+        request = {'schema': {'type': 'boolean'}, 'n': 3, 'options': {'default_prob_of_true_given_bool': 1.0}}
+
+        _, generate_lines = service.prepare(request)
+
+        self.assertEqual(''.join(generate_lines()), 'true\ntrue\ntrue\n')
+
+    def test_factory_is_cached(self):
+        """ Normalized System Test
+
+        ``GenerationService`` constructs the factory only once for schemas which are equal as JSON.
+        """
+        service = GenerationService()
+
+        factory = service.factory({'type': 'integer', 'minimum': 0})
+
+        self.assertIsInstance(factory, ranjg.factories.IntFactory)
+        self.assertIs(service.factory({'minimum': 0, 'type': 'integer'}), factory)
+        self.assertIsNot(service.factory({'type': 'integer', 'minimum': 1}), factory)
+
+    def test_prepare_with_illegal_request(self):
+        """ Semi-normalized System Test
+        """
+        service = GenerationService()
+        case_list = (
+            ([], "must be a JSON object"),
+            ({'n': 1}, "must have 'schema'"),
+            ({'schema': {}, 'n': -1}, "Illegal 'n'"),
+            ({'schema': {}, 'n': True}, "Illegal 'n'"),
+            ({'schema': {}, 'seed': 'a'}, "Illegal 'seed'"),
+            ({'schema': {}, 'options': {'unknown': 1}}, "Illegal 'options'"),
+            ({'schema': {'type': 'unknown'}}, ""),
+            ({'schema': {'type': 'integer', 'minimum': 1, 'maximum': 0}}, ""),
+            ({'schema': {}, 'options': {'default_schema_of_properties': {'type': 'unknown'}}},
+             "Illegal 'options': default_schema_of_properties"),
+            ({'schema': {}, 'options': {'default_schema_of_items': {'type': 'integer', 'minimum': 1, 'maximum': 0}}},
+             "Illegal 'options': default_schema_of_items"),
+            ({'schema': {}, 'options': {'priority_schema_of_properties': {'p1': {'minLength': -1}}}},
+             "Illegal 'options': priority_schema_of_properties.p1"),
+            ({'schema': {}, 'options': {'priority_schema_of_properties': []}}, "Illegal 'options'"),
+            ({'schema': {}, 'options': {'default_schema_of_items': 1}}, "Illegal 'options': default_schema_of_items"),
+            ({'schema': {}, 'options': []}, "Illegal 'options'"),
+            ({'schema': {}, 'options': {'default_prob_of_optional_properties': 'x'}},
+             "Illegal 'options': default_prob_of_optional_properties"),
+            ({'schema': {}, 'options': {'default_prob_of_true_given_bool': 2}},
+             "Illegal 'options': default_prob_of_true_given_bool"),
+            ({'schema': {}, 'options': {'default_min_length_of_string': 1.5}},
+             "Illegal 'options': default_min_length_of_string"),
+            ({'schema': {}, 'options': {'regeneration_attempt_limit': '10'}},
+             "Illegal 'options': regeneration_attempt_limit"),
+            ({'schema': {}, 'options': {'enum_copy_style': 'COPY'}}, "Illegal 'options': enum_copy_style"),
+            ({'schema': {}, 'options': {'use_numpy': 1}}, "Illegal 'options': use_numpy"),
+        )
+
+        for request, message in case_list:
+            with self.subTest(request=request):
+                with self.assertRaisesRegex(RequestError, message):
+                    service.prepare(request)
+
+
+class TestServer(unittest.TestCase):
+    """Test class of servers
+
+    Test ``ranjg._serve.make_unix_server`` and ``ranjg._serve.make_http_server``
+    """
+
+    #: str: The path of directory where tests output file.
+    TEST_TMP_DIR = "./test-tmp/test_serve"
+    #: str: The path of directory where tests output file.
+    TEST_TMP_DIR_PRE = path.join(TEST_TMP_DIR, f"{random.randint(0, 2 ** 64):X}")
+
+    @classmethod
+    def setUpClass(cls):
+        if path.exists(cls.TEST_TMP_DIR_PRE):
+            shutil.rmtree(cls.TEST_TMP_DIR_PRE)
+        os.makedirs(cls.TEST_TMP_DIR_PRE, exist_ok=True)
+
+    def _start(self, server):
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        self.addCleanup(stop)
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix domain sockets are not available")
+    def test_unix_server(self):
+        """ Normalized System Test
+
+        The server on a Unix domain socket responds a header line and generated values for each request line, and
+        removes the socket file when it is closed.
+        """
+        socket_path = path.join(self.TEST_TMP_DIR_PRE, "test_unix_server.sock")
+        server = make_unix_server(socket_path, GenerationService())
+        self._start(server)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            with sock.makefile('rwb') as fp:
+                fp.write(b'{"schema": {"type": "integer", "minimum": 0}, "n": 3}\n')
+                fp.write(b'{"schema": {"type": "unknown"}}\n')
+                fp.write(b'{"schema": {"type": "array"},'
+                         b' "options": {"default_schema_of_items": {"type": "unknown"}}}\n')
+                fp.write(b'{"schema": {"type": "object", "properties": {"a": {"type": "integer"}}},'
+                         b' "options": {"default_prob_of_optional_properties": "x"}}\n')
+                fp.write(b'{"schema": {"type": "null"}, "n": 2}\n')
+                fp.flush()
+
+                self.assertDictEqual(json.loads(fp.readline()), {'n': 3})
+                for _ in range(3):
+                    self.assertGreaterEqual(json.loads(fp.readline()), 0)
+                self.assertIn('error', json.loads(fp.readline()))
+                self.assertIn('error', json.loads(fp.readline()))
+                self.assertIn('default_prob_of_optional_properties', json.loads(fp.readline())['error'])
+                self.assertDictEqual(json.loads(fp.readline()), {'n': 2})
+                self.assertEqual(fp.readline(), b'null\n')
+                self.assertEqual(fp.readline(), b'null\n')
+
+        server.shutdown()
+        server.server_close()
+        self.assertFalse(path.exists(socket_path))
+
+    def test_http_server(self):
+        """ Normalized System Test
+
+        The HTTP server responds generated values as JSON Lines, or an error with status 400.
+        """
+        server = make_http_server('127.0.0.1', 0, GenerationService())
+        self._start(server)
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+        request = json.dumps({'schema': {'type': 'string', 'pattern': '^a$'}, 'n': 2}).encode('utf-8')
+        with urllib.request.urlopen(url, data=request) as response:
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.read(), b'"a"\n"a"\n')
+
+        with self.assertRaises(urllib.error.HTTPError) as cm:
+            urllib.request.urlopen(url, data=b'{"n": 1}')
+        self.assertEqual(cm.exception.code, 400)
+        self.assertIn('error', json.loads(cm.exception.read().decode('utf-8')))
+        cm.exception.close()
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix domain sockets are not available")
+    def test_unix_server_with_failure_in_generation(self):
+        """ Semi-normalized System Test
+
+        When generation fails after the header, the server writes an error line instead of the rest of the values and
+        closes the connection.
+        """
+        socket_path = path.join(self.TEST_TMP_DIR_PRE, "test_unix_server_with_failure_in_generation.sock")
+        server = make_unix_server(socket_path, GenerationService())
+        self._start(server)
+
+        with mock.patch('ranjg.factories.NoneFactory.gen_many', autospec=True,
+                        side_effect=[[None] * _CHUNK_SIZE, GenerateError('failed', None)]), \
+                socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            with sock.makefile('rwb') as fp:
+                fp.write(json.dumps({'schema': {'type': 'null'}, 'n': _CHUNK_SIZE + 1}).encode('utf-8') + b'\n')
+                fp.flush()
+
+                self.assertDictEqual(json.loads(fp.readline()), {'n': _CHUNK_SIZE + 1})
+                for _ in range(_CHUNK_SIZE):
+                    self.assertEqual(fp.readline(), b'null\n')
+                self.assertDictEqual(json.loads(fp.readline()), {'error': 'failed'})
+                self.assertEqual(fp.readline(), b'')
+
+    def test_http_server_with_illegal_options(self):
+        """ Semi-normalized System Test
+
+        The HTTP server responds an error with status 400 for an illegal value of options, before any value is
+        generated.
+        """
+        server = make_http_server('127.0.0.1', 0, GenerationService())
+        self._start(server)
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+        request = json.dumps({'schema': {'type': 'object', 'properties': {'a': {'type': 'integer'}}},
+                              'options': {'default_prob_of_optional_properties': 'x'}}).encode('utf-8')
+        with self.assertRaises(urllib.error.HTTPError) as cm:
+            urllib.request.urlopen(url, data=request)
+        self.assertEqual(cm.exception.code, 400)
+        self.assertIn('default_prob_of_optional_properties', json.loads(cm.exception.read().decode('utf-8'))['error'])
+        cm.exception.close()
+
+    def test_http_server_with_failure_in_generation(self):
+        """ Semi-normalized System Test
+
+        When generation fails before any value is generated, the HTTP server responds an error with status 400. When it
+        fails after the response has started, the last line of the body is an error.
+        """
+        server = make_http_server('127.0.0.1', 0, GenerationService())
+        self._start(server)
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        request = json.dumps({'schema': {'type': 'null'}, 'n': _CHUNK_SIZE + 1}).encode('utf-8')
+
+        with mock.patch('ranjg.factories.NoneFactory.gen_many', autospec=True,
+                        side_effect=GenerateError('failed', None)):
+            with self.assertRaises(urllib.error.HTTPError) as cm:
+                urllib.request.urlopen(url, data=request)
+        self.assertEqual(cm.exception.code, 400)
+        self.assertDictEqual(json.loads(cm.exception.read().decode('utf-8')), {'error': 'failed'})
+        cm.exception.close()
+
+        with mock.patch('ranjg.factories.NoneFactory.gen_many', autospec=True,
+                        side_effect=[[None] * _CHUNK_SIZE, GenerateError('failed', None)]):
+            with urllib.request.urlopen(url, data=request) as response:
+                self.assertEqual(response.status, 200)
+                lines = response.read().decode('utf-8').splitlines()
+        self.assertListEqual(lines[:-1], ['null'] * _CHUNK_SIZE)
+        self.assertDictEqual(json.loads(lines[-1]), {'error': 'failed'})
@@ -0,0 +1,152 @@
+import pickle
+import random
+import unittest
+
+import ranjg
+from ranjg import Options
+from ranjg.error import GenerateError
+
+
+class TestStats(unittest.TestCase):
+    """Test class of ``Factory#stats``
+
+    Test ``ranjg.stats.GenerationStats``
+    """
+
+    #: 後方参照を含み、長さの条件を満たすまで生成を繰り返すスキーマ
+    BACKREFERENCE_SCHEMA = {'type': 'string', 'pattern': '^(a+)-\\1$', 'maxLength': 5}
+
+    def test_stats_retries(self):
+        """ Normalized System Test
+
+        Values rejected by a factory are counted as retries, and the attempts are recorded as a histogram.
+        """
+        factory = ranjg.Factory({'type': 'array', 'minItems': 100, 'maxItems': 100,
+                                 'items': self.BACKREFERENCE_SCHEMA})
+        factory.gen(rng=random.Random(0))
+
+        path_stats = factory.stats()['$[]']
+        self.assertEqual(sum(path_stats.attempts.values()), 100)
+        self.assertEqual(sum((attempts - 1) * count for attempts, count in path_stats.attempts.items()),
+                         path_stats.retries)
+        self.assertGreater(path_stats.retries, 0)
+        self.assertEqual(path_stats.failures, 0)
+        self.assertIn('$[]', factory.stats().report())
+
+    def test_stats_failures(self):
+        """ Normalized System Test
+
+        When no value is accepted within ``options.regeneration_attempt_limit``, it is counted as a failure.
+        """
+        factory = ranjg.Factory({'type': 'string', 'pattern': '^(a+)-\\1$', 'minLength': 5, 'maxLength': 5})
+        options = Options(regeneration_attempt_limit=1)
+
+        failures = 0
+        for _ in range(20):
+            try:
+                factory.gen(options=options)
+            except GenerateError:
+                failures += 1
+
+        path_stats = factory.stats()['$']
+        self.assertEqual(path_stats.failures, failures)
+        self.assertDictEqual(path_stats.attempts, {1: 20})
+        self.assertEqual(path_stats.retries, 0)
+
+    def test_stats_fallbacks(self):
+        """ Normalized System Test
+
+        Resolutions of child elements to factories derived from options are counted as fallbacks, and factories
+        derived from options are included in the statistics.
+        """
+        options = Options(default_schema_of_properties=self.BACKREFERENCE_SCHEMA,
+                          priority_schema_of_properties={'p2': {'type': 'integer'}})
+        factory = ranjg.Factory({'type': 'object', 'required': ['p1', 'p2', 'p3'],
+                                 'properties': {'p3': {'type': 'null'}}})
+
+        for _ in range(5):
+            factory.gen(options=options)
+        stats = factory.stats()
+
+        self.assertEqual(stats['$'].fallbacks, 10)
+        self.assertEqual(sum(stats['$.*'].attempts.values()), 5)
+        self.assertIn('$.p2', stats)
+        self.assertTrue(stats['$.p3'].is_empty())
+
+    def test_stats_fallbacks_for_each_value(self):
+        """ Normalized System Test
+
+        Fallbacks are counted for each child element with ``gen``, ``compile``, ``gen_many`` and ``gen_columns``.
+        """
+        options = Options(default_schema_of_items={'type': 'integer'},
+                          priority_schema_of_properties={'p2': {'type': 'integer'}})
+        list_schema = {'type': 'array', 'minItems': 4, 'maxItems': 4}
+        tuple_schema = {'type': 'array', 'minItems': 4, 'maxItems': 4, 'items': [{'type': 'null'}]}
+        dict_schema = {'type': 'object', 'required': ['p1', 'p2'], 'properties': {'p1': {'type': 'null'}}}
+        case_list = (
+            (list_schema, lambda factory: [factory.gen(options=options) for _ in range(10)], 40),
+            (list_schema, lambda factory: [factory.compile(options=options)() for _ in range(10)], 40),
+            (list_schema, lambda factory: factory.gen_many(10, options=options), 40),
+            (tuple_schema, lambda factory: [factory.gen(options=options) for _ in range(10)], 30),
+            (tuple_schema, lambda factory: factory.gen_many(10, options=options), 30),
+            (dict_schema, lambda factory: [factory.gen(options=options) for _ in range(10)], 10),
+            (dict_schema, lambda factory: [factory.compile(options=options)() for _ in range(10)], 10),
+            (dict_schema, lambda factory: factory.gen_many(10, options=options), 10),
+            (dict_schema, lambda factory: factory.gen_columns(10, options=options, use_array=True), 10),
+        )
+
+        for index, (schema, gen, expected) in enumerate(case_list):
+            with self.subTest(index=index):
+                factory = ranjg.Factory(schema)
+                gen(factory)
+                self.assertEqual(factory.stats()['$'].fallbacks, expected)
+
+    def test_stats_deep_copies(self):
+        """ Normalized System Test
+
+        Deep copies of values of ``enum`` are counted with ``gen``, ``compile`` and ``gen_many``, and values of
+        ``enum`` which don't satisfy the schema are counted at construction.
+        """
+        factory = ranjg.Factory({'enum': [[1], [2], 'a'], 'type': 'array'})
+
+        factory.gen()
+        generate = factory.compile()
+        generate()
+        generate()
+        factory.gen_many(3)
+        factory.gen(options=Options(enum_copy_style=ranjg.options.NO_COPY))
+
+        path_stats = factory.stats()['$']
+        self.assertEqual(path_stats.deep_copies, 6)
+        self.assertEqual(path_stats.filtered_enum_values, 1)
+
+    def test_stats_multi_factory(self):
+        """ Normalized System Test
+
+        Statistics of factories of each type are merged at the same path.
+        """
+        factory = ranjg.Factory({'type': ['string', 'null'], 'pattern': '^(a+)-\\1$', 'maxLength': 5})
+        generated = factory.gen_many(50)
+
+        self.assertEqual(sum(factory.stats()['$'].attempts.values()),
+                         len([value for value in generated if value is not None]))
+
+    def test_stats_pickle(self):
+        """ Normalized System Test
+
+        The statistics are not carried over by pickle.
+        """
+        factory = ranjg.Factory({'enum': [[1]]})
+        factory.gen()
+
+        self.assertEqual(pickle.loads(pickle.dumps(factory)).stats()['$'].deep_copies, 0)
+
+    def test_report_empty(self):
+        """ Normalized System Test
+
+        When nothing is counted, the report says so.
+        """
+        factory = ranjg.Factory({'type': 'integer'})
+        factory.gen()
+
+        self.assertEqual(factory.stats().report(), "(no retries, fallbacks or copies recorded)")
@@ -0,0 +1,91 @@
+import collections
+import threading
+from typing import Generic, TypeVar, Optional, Hashable, List
+
+_K = TypeVar('_K', bound=Hashable)
+_V = TypeVar('_V')
+
+
+class LRUCache(Generic[_K, _V]):
+    """A cache which discards the least recently used item when the number of items exceeds ``maxsize``.
+
+    It is thread safe.
+
+    Args:
+        maxsize: The maximum number of items which the cache holds.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive: {maxsize}")
+
+        self._maxsize = maxsize
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def get(self, key: _K, default: Optional[_V] = None) -> Optional[_V]:
+        """Returns the item of ``key`` and marks it as recently used.
+
+        Args:
+            key: The key of the item.
+            default: The value returned if the cache doesn't have the item.
+
+        Returns:
+            The item of ``key``, or ``default`` if the cache doesn't have it.
+        """
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key: _K, value: _V) -> None:
+        """Stores the item and discards the least recently used items if the cache is full.
+
+        Args:
+            key: The key of the item.
+            value: The item.
+        """
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        """Changes ``maxsize`` and discards the least recently used items if the cache is full.
+
+        Args:
+            maxsize: The new maximum number of items which the cache holds.
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive: {maxsize}")
+
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def values(self) -> List[_V]:
+        """Returns all items, without marking them as recently used.
+        """
+        with self._lock:
+            return list(self._items.values())
+
+    def clear(self) -> None:
+        """Discards all items.
+        """
+        with self._lock:
+            self._items.clear()
+
+    def __contains__(self, key: _K) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,15 @@
+import hashlib
+import json
+
+
+def canonical_hash(value) -> str:
+    """Returns a hash of a JSON value which doesn't depend on the order of the keys of objects.
+
+    Args:
+        value: A value which can be serialized as JSON.
+
+    Returns:
+        The hex digest of SHA-256 of the canonical JSON representation of ``value``.
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,17 @@
+import hashlib
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """Derive a seed for the ``index``-th generation from a base seed.
+
+    The derived seeds are independent of each other, so each generation can be reproduced without the others.
+
+    Args:
+        seed: The base seed.
+        index: The index of the generation.
+
+    Returns:
+        A seed for the ``index``-th generation.
+    """
+    digest = hashlib.blake2b(f"{seed}:{index}".encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
@@ -6,9 +6,16 @@ def load_readme() -> str:
         return f.read()
 
 
+def load_version() -> str:
+    version = {}
+    with open("ranjg/_version.py", encoding="utf-8") as f:
+        exec(f.read(), version)
+    return version["__version__"]
+
+
 setup(
     name='ranjg',
-    version='0.5.0.1',
+    version=load_version(),
     project_urls={
         "Bug Tracker": 'https://github.com/unaguna/random-json-generator/issues',
         "Documentation": 'https://unaguna.github.io/random-json-generator/',
@@ -24,8 +31,10 @@ setup(
     packages=find_packages(exclude=('ranjg.test',)),
     install_requires=[
         'jsonschema',
-        'rstr',
     ],
+    extras_require={
+        'numpy': ['numpy>=1.17'],
+    },
     license="MIT",
     classifiers=[
         'Development Status :: 2 - Pre-Alpha',